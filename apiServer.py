@@ -0,0 +1,577 @@
+"""
+HTTP API JSON untuk data SkillHub, terpisah dari aplikasi Streamlit.
+
+Jalankan dari command line:
+    python apiServer.py --port 8080 --workers 16
+
+Endpoint:
+    GET    /participants?after_id=&limit=        daftar peserta (keyset)
+    GET    /participants/<id>                    detail peserta
+    GET    /participants/<id>/courses            kelas yang diikuti peserta
+    POST   /participants                         tambah peserta
+    PUT    /participants/<id>                    ubah peserta
+    DELETE /participants/<id>                    hapus peserta
+    GET    /courses?after_id=&limit=             daftar kelas (keyset)
+    GET    /courses/<id>                         detail kelas
+    GET    /courses/<id>/participants            roster kelas
+    POST   /courses                              tambah kelas
+    PUT    /courses/<id>                         ubah kelas
+    DELETE /courses/<id>                         hapus kelas
+    GET    /enrollments?after=&limit=            semua pendaftaran (keyset)
+    POST   /enrollments                          daftarkan peserta ke kelas
+    DELETE /enrollments/<participant_id>/<course_id>
+
+Respons GET membawa ETag dan Last-Modified dari tabel table_versions;
+permintaan dengan If-None-Match / If-Modified-Since yang masih cocok dijawab
+304 tanpa body dan tanpa menjalankan query datanya.
+Jika database tidak dapat dihubungi, respons 503 membawa Retry-After.
+"""
+
+import argparse
+import json
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from dataExport import json_default
+from databaseConnection import DatabaseConnection, DatabaseUnavailableError, ER_DUP_ENTRY, QueryTimeoutError
+from models.participant import Participant
+from models.course import Course
+from models.enrollment import Enrollment, EnrollmentStatus
+from models.tableVersion import TableVersion
+
+# Tabel yang menentukan isi setiap jenis respons GET (dasar ETag/Last-Modified)
+PARTICIPANT_TABLES = (TableVersion.PARTICIPANTS,)
+COURSE_TABLES = (TableVersion.COURSES,)
+ENROLLMENT_TABLES = (TableVersion.PARTICIPANTS, TableVersion.COURSES, TableVersion.ENROLLMENTS)
+
+logger = logging.getLogger("skillhub.api")
+
+
+class ApiError(Exception):
+    """Kesalahan permintaan yang dijawab dengan status HTTP tertentu."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+# ==================== HANDLER ENDPOINT ====================
+
+class SkillHubApi:
+    """
+    Routing dan handler endpoint, terlepas dari transport HTTP.
+    Setiap permintaan memakai koneksi sendiri dari connect().
+    """
+
+    DEFAULT_LIMIT = 50
+    MAX_LIMIT = 500
+
+    def __init__(self, connect: Callable[[], DatabaseConnection]):
+        """
+        Inisialisasi API.
+
+        Args:
+            connect: Fungsi pembuat koneksi per permintaan (misalnya meminjam dari pool)
+        """
+        self.connect = connect
+        # (method, path, handler, tabel sumber untuk validator GET)
+        self.routes: List[Tuple[str, re.Pattern, Callable, Tuple[str, ...]]] = [
+            ("GET", re.compile(r"^/participants$"), self.list_participants, PARTICIPANT_TABLES),
+            ("POST", re.compile(r"^/participants$"), self.create_participant, ()),
+            ("GET", re.compile(r"^/participants/(\d+)$"), self.get_participant, PARTICIPANT_TABLES),
+            ("PUT", re.compile(r"^/participants/(\d+)$"), self.update_participant, ()),
+            ("DELETE", re.compile(r"^/participants/(\d+)$"), self.delete_participant, ()),
+            ("GET", re.compile(r"^/participants/(\d+)/courses$"), self.participant_courses, ENROLLMENT_TABLES),
+            ("GET", re.compile(r"^/courses$"), self.list_courses, COURSE_TABLES),
+            ("POST", re.compile(r"^/courses$"), self.create_course, ()),
+            ("GET", re.compile(r"^/courses/(\d+)$"), self.get_course, COURSE_TABLES),
+            ("PUT", re.compile(r"^/courses/(\d+)$"), self.update_course, ()),
+            ("DELETE", re.compile(r"^/courses/(\d+)$"), self.delete_course, ()),
+            ("GET", re.compile(r"^/courses/(\d+)/participants$"), self.course_roster, ENROLLMENT_TABLES),
+            ("GET", re.compile(r"^/enrollments$"), self.list_enrollments, ENROLLMENT_TABLES),
+            ("POST", re.compile(r"^/enrollments$"), self.create_enrollment, ()),
+            ("DELETE", re.compile(r"^/enrollments/(\d+)/(\d+)$"), self.delete_enrollment, ()),
+        ]
+
+    def handle(self, method: str, path: str, query: Dict[str, str],
+               body: Optional[Dict] = None) -> Tuple[int, Any]:
+        """
+        Menjalankan endpoint yang cocok dengan method dan path (tanpa conditional GET).
+
+        Args:
+            method: Method HTTP
+            path: Path tanpa query string
+            query: Parameter query string (satu nilai per nama)
+            body: Body JSON untuk POST/PUT (optional)
+
+        Returns:
+            Tuple[int, Any]: Status HTTP dan payload JSON
+        """
+        status, payload, _ = self.dispatch(method, path, query, body)
+        return status, payload
+
+    def dispatch(self, method: str, path: str, query: Dict[str, str],
+                 body: Optional[Dict] = None,
+                 headers=None) -> Tuple[int, Any, Dict[str, str]]:
+        """
+        Menjalankan endpoint yang cocok dengan method dan path. Untuk GET,
+        ETag dan Last-Modified dibentuk dari versi tabel sumbernya lebih dulu,
+        dalam transaksi yang sama dengan query datanya; jika validator klien
+        masih cocok, dijawab 304 tanpa menjalankan query data.
+
+        Args:
+            method: Method HTTP
+            path: Path tanpa query string
+            query: Parameter query string (satu nilai per nama)
+            body: Body JSON untuk POST/PUT (optional)
+            headers: Header permintaan untuk If-None-Match/If-Modified-Since (optional)
+
+        Returns:
+            Tuple[int, Any, Dict[str, str]]: Status HTTP, payload JSON, dan header validator
+        """
+        allowed = []
+        for route_method, pattern, handler, tables in self.routes:
+            match = pattern.match(path)
+            if not match:
+                continue
+            if route_method != method:
+                allowed.append(route_method)
+                continue
+
+            db = self.connect()
+            try:
+                if db.connection is None:
+                    raise ApiError(503, "Database tidak tersedia")
+                args = [int(value) for value in match.groups()]
+                if not tables:
+                    status, payload = handler(db, *args, query=query, body=body or {})
+                    return status, payload, {}
+
+                # Versi dan data dibaca dalam satu transaksi (snapshot yang sama), sehingga
+                # tulis yang masuk di antaranya tidak memasangkan ETag lama dengan data baru
+                with db.transaction():
+                    stamp = self._stamp(db, tables)
+                    validators = validator_headers(*stamp) if stamp else {}
+                    if stamp and headers is not None and is_not_modified(headers, *stamp):
+                        return 304, None, validators
+                    status, payload = handler(db, *args, query=query, body=body or {})
+                return status, payload, validators if status == 200 else {}
+            except ApiError as e:
+                return e.status, {'error': e.message}, {}
+            except DatabaseUnavailableError as e:
+                return 503, {'error': "Database tidak tersedia"}, {}
+            except QueryTimeoutError as e:
+                return 503, {'error': "Query melewati batas waktu"}, {}
+            except Exception as e:
+                # Klien tetap menerima respons JSON, bukan koneksi yang terputus
+                logger.exception("Gagal menjalankan %s %s", method, path)
+                return 500, {'error': "Terjadi kesalahan pada server"}, {}
+            finally:
+                db.disconnect()
+
+        if allowed:
+            return 405, {'error': f"Method tidak didukung, gunakan {', '.join(allowed)}"}, {}
+        return 404, {'error': "Endpoint tidak ditemukan"}, {}
+
+    # -------------------- Helper --------------------
+
+    @staticmethod
+    def _stamp(db: DatabaseConnection,
+               tables: Tuple[str, ...]) -> Optional[Tuple[str, Optional[datetime]]]:
+        """
+        Membentuk ETag dan Last-Modified dari versi dan waktu perubahan tabel
+        sumber, dengan satu query kecil ke table_versions.
+
+        Returns:
+            Optional[Tuple[str, Optional[datetime]]]: (ETag, Last-Modified UTC),
+            atau None jika versi tidak bisa dibaca
+        """
+        stamps = TableVersion(db).get_stamps()
+        if db.last_error is not None or not all(table in stamps for table in tables):
+            return None
+
+        etag = '"' + "-".join(str(stamps[table][0]) for table in tables) + '"'
+        changed = [stamps[table][1] for table in tables]
+        if not all(isinstance(value, datetime) for value in changed):
+            return etag, None
+        return etag, max(changed).replace(tzinfo=timezone.utc)
+
+    def _limit(self, query: Dict[str, str]) -> int:
+        """Membaca parameter limit dengan batas MAX_LIMIT."""
+        try:
+            limit = int(query.get('limit', self.DEFAULT_LIMIT))
+        except ValueError:
+            raise ApiError(400, "limit harus berupa angka")
+        if limit < 1:
+            raise ApiError(400, "limit minimal 1")
+        return min(limit, self.MAX_LIMIT)
+
+    def _after_id(self, query: Dict[str, str]) -> Optional[int]:
+        """Membaca cursor after_id."""
+        if not query.get('after_id'):
+            return None
+        try:
+            return int(query['after_id'])
+        except ValueError:
+            raise ApiError(400, "after_id harus berupa angka")
+
+    @staticmethod
+    def _page(rows: List[Dict], limit: int, cursor_of: Callable[[Dict], Any]) -> Dict:
+        """Memotong hasil limit+1 menjadi satu halaman beserta cursor berikutnya."""
+        has_next = len(rows) > limit
+        rows = rows[:limit]
+        return {'data': rows, 'next': cursor_of(rows[-1]) if has_next else None}
+
+    @staticmethod
+    def _require(body: Dict, *fields: str) -> List[str]:
+        """Mengambil field wajib dari body sebagai string yang sudah di-strip."""
+        values = []
+        for field in fields:
+            value = str(body.get(field) or '').strip()
+            if not value:
+                raise ApiError(400, f"Field {field} wajib diisi")
+            values.append(value)
+        return values
+
+    @staticmethod
+    def _write_failed(db: DatabaseConnection, what: str) -> ApiError:
+        """Menerjemahkan kegagalan tulis menjadi 409 (duplikat) atau 500."""
+        if db.last_error is not None and db.last_error.errno == ER_DUP_ENTRY:
+            return ApiError(409, f"{what} sudah ada")
+        return ApiError(500, f"Gagal menyimpan {what.lower()}")
+
+    # -------------------- Peserta --------------------
+
+    def list_participants(self, db, query, body):
+        limit = self._limit(query)
+        rows = Participant(db).get_page(self._after_id(query), limit + 1)
+        return 200, self._page(rows, limit, lambda row: row['id'])
+
+    def get_participant(self, db, participant_id, query, body):
+        participant = Participant(db).get_by_id(participant_id)
+        if not participant:
+            raise ApiError(404, "Peserta tidak ditemukan")
+        return 200, participant
+
+    def participant_courses(self, db, participant_id, query, body):
+        detail = Enrollment(db).get_participant_detail(participant_id)
+        if not detail:
+            raise ApiError(404, "Peserta tidak ditemukan")
+        return 200, {'data': detail['courses']}
+
+    def create_participant(self, db, query, body):
+        nama, email = self._require(body, 'nama', 'email')
+        if not Participant(db).create(nama, email, body.get('no_telp', ''), body.get('alamat', '')):
+            raise self._write_failed(db, "Email")
+        return 201, {'created': True}
+
+    def update_participant(self, db, participant_id, query, body):
+        model = Participant(db)
+        if not model.get_by_id(participant_id):
+            raise ApiError(404, "Peserta tidak ditemukan")
+        nama, email = self._require(body, 'nama', 'email')
+        if not model.update(participant_id, nama, email, body.get('no_telp', ''), body.get('alamat', '')):
+            raise self._write_failed(db, "Email")
+        return 200, model.get_by_id(participant_id)
+
+    def delete_participant(self, db, participant_id, query, body):
+        model = Participant(db)
+        if not model.get_by_id(participant_id):
+            raise ApiError(404, "Peserta tidak ditemukan")
+        if not model.delete(participant_id):
+            raise ApiError(500, "Gagal menghapus peserta")
+        return 200, {'deleted': True}
+
+    # -------------------- Kelas --------------------
+
+    def list_courses(self, db, query, body):
+        limit = self._limit(query)
+        rows = Course(db).get_page(self._after_id(query), limit + 1)
+        return 200, self._page(rows, limit, lambda row: row['id'])
+
+    def get_course(self, db, course_id, query, body):
+        course = Course(db).get_by_id(course_id)
+        if not course:
+            raise ApiError(404, "Kelas tidak ditemukan")
+        return 200, course
+
+    def course_roster(self, db, course_id, query, body):
+        detail = Enrollment(db).get_course_detail(course_id)
+        if not detail:
+            raise ApiError(404, "Kelas tidak ditemukan")
+        return 200, {'data': detail['participants']}
+
+    def create_course(self, db, query, body):
+        nama_kelas, = self._require(body, 'nama_kelas')
+        if not Course(db).create(nama_kelas, body.get('deskripsi', ''), body.get('instruktur', '')):
+            raise self._write_failed(db, "Kelas")
+        return 201, {'created': True}
+
+    def update_course(self, db, course_id, query, body):
+        model = Course(db)
+        if not model.get_by_id(course_id):
+            raise ApiError(404, "Kelas tidak ditemukan")
+        nama_kelas, = self._require(body, 'nama_kelas')
+        if not model.update(course_id, nama_kelas, body.get('deskripsi', ''), body.get('instruktur', '')):
+            raise self._write_failed(db, "Kelas")
+        return 200, model.get_by_id(course_id)
+
+    def delete_course(self, db, course_id, query, body):
+        model = Course(db)
+        if not model.get_by_id(course_id):
+            raise ApiError(404, "Kelas tidak ditemukan")
+        if not model.delete(course_id):
+            raise ApiError(500, "Gagal menghapus kelas")
+        return 200, {'deleted': True}
+
+    # -------------------- Pendaftaran --------------------
+
+    def list_enrollments(self, db, query, body):
+        limit = self._limit(query)
+        after = None
+        if query.get('after'):
+            # Cursor "<tanggal_daftar ISO>|<id>", tanggal kosong untuk NULL
+            try:
+                tanggal, enrollment_id = query['after'].rsplit('|', 1)
+                after = (datetime.fromisoformat(tanggal) if tanggal else None, int(enrollment_id))
+            except ValueError:
+                raise ApiError(400, "after harus berbentuk <tanggal_daftar>|<id>")
+
+        rows = Enrollment(db).get_enrollments_page(after, limit + 1)
+        return 200, self._page(rows, limit, lambda row: (
+            f"{row['tanggal_daftar'].isoformat() if row['tanggal_daftar'] else ''}|{row['id']}"
+        ))
+
+    def create_enrollment(self, db, query, body):
+        try:
+            participant_id = int(body['participant_id'])
+            course_id = int(body['course_id'])
+        except (KeyError, TypeError, ValueError):
+            raise ApiError(400, "participant_id dan course_id wajib berupa angka")
+
+        status = Enrollment(db).create(participant_id, course_id)
+        codes = {
+            EnrollmentStatus.CREATED: 201,
+            EnrollmentStatus.ALREADY_ENROLLED: 409,
+            EnrollmentStatus.UNKNOWN_PARTICIPANT: 404,
+            EnrollmentStatus.UNKNOWN_COURSE: 404,
+            EnrollmentStatus.FAILED: 500,
+        }
+        return codes[status], {'status': status.value}
+
+    def delete_enrollment(self, db, participant_id, course_id, query, body):
+        model = Enrollment(db)
+        enrolled = model.get_courses_by_participant(participant_id)
+        if not any(course['id'] == course_id for course in enrolled):
+            raise ApiError(404, "Pendaftaran tidak ditemukan")
+        if not model.delete(participant_id, course_id):
+            raise ApiError(500, "Gagal menghapus pendaftaran")
+        return 200, {'deleted': True}
+
+
+# ==================== VALIDASI CONDITIONAL GET ====================
+
+def validator_headers(etag: str, last_modified: Optional[datetime]) -> Dict[str, str]:
+    """
+    Menyusun header ETag, Last-Modified, dan Cache-Control untuk respons GET.
+
+    Args:
+        etag: ETag respons
+        last_modified: Last-Modified respons (None jika tidak diketahui)
+
+    Returns:
+        Dict[str, str]: Header validator
+    """
+    headers = {'ETag': etag, 'Cache-Control': "no-cache"}
+    if last_modified is not None:
+        headers['Last-Modified'] = format_datetime(last_modified, usegmt=True)
+    return headers
+
+
+def is_not_modified(headers, etag: str, last_modified: Optional[datetime]) -> bool:
+    """
+    Mengecek If-None-Match lalu If-Modified-Since (RFC 9110).
+
+    Args:
+        headers: Header permintaan
+        etag: ETag respons saat ini
+        last_modified: Last-Modified respons saat ini (None jika tidak diketahui)
+
+    Returns:
+        bool: True jika klien boleh memakai salinannya (304)
+    """
+    if_none_match = headers.get('If-None-Match')
+    if if_none_match is not None:
+        tags = [tag.strip() for tag in if_none_match.split(',')]
+        return '*' in tags or any(tag.removeprefix('W/') == etag for tag in tags)
+
+    if_modified_since = headers.get('If-Modified-Since')
+    if if_modified_since and last_modified is not None:
+        try:
+            return last_modified <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+# ==================== HTTP SERVER ====================
+
+class ApiRequestHandler(BaseHTTPRequestHandler):
+    """Menerjemahkan permintaan HTTP ke SkillHubApi dan menulis respons JSON."""
+
+    protocol_version = "HTTP/1.1"
+    # Koneksi keep-alive yang menganggur menahan satu worker; dilepas cepat
+    # agar beberapa klien yang diam tidak menghabiskan thread pool
+    timeout = 2
+    server_version = "SkillHubAPI/1.0"
+    # Saran jeda (detik) untuk klien saat database tidak tersedia (503)
+    retry_after = 5
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method: str):
+        url = urlsplit(self.path)
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+
+        body = None
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            try:
+                body = json.loads(self.rfile.read(length))
+            except ValueError:
+                self._send(400, {'error': "Body harus JSON"})
+                return
+            if not isinstance(body, dict):
+                self._send(400, {'error': "Body harus objek JSON"})
+                return
+
+        status, payload, validators = self.server.api.dispatch(method, url.path, query, body,
+                                                               self.headers)
+        self._send(status, payload, validators)
+
+    def _send(self, status: int, payload: Any, validators: Optional[Dict[str, str]] = None):
+        data = b"" if status == 304 else json.dumps(
+            payload, default=json_default, ensure_ascii=False).encode("utf-8")
+        headers = {'Content-Type': "application/json; charset=utf-8"}
+        headers.update(validators or {})
+        if status == 503:
+            headers['Retry-After'] = str(self.retry_after)
+
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        if data:
+            self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class ApiServer(HTTPServer):
+    """HTTP server yang melayani setiap koneksi di thread pool berukuran tetap."""
+
+    def __init__(self, address: Tuple[str, int], api: SkillHubApi, workers: int = 8,
+                 verbose: bool = False):
+        """
+        Inisialisasi server.
+
+        Args:
+            address: (host, port); port 0 memilih port bebas
+            api: Handler endpoint
+            workers: Jumlah worker yang melayani koneksi bersamaan
+            verbose: Tulis log akses ke stderr
+        """
+        super().__init__(address, ApiRequestHandler)
+        self.api = api
+        self.verbose = verbose
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="skillhub-api")
+
+    def process_request(self, request, client_address):
+        self.executor.submit(self._process, request, client_address)
+
+    def _process(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(wait=True)
+
+
+def connection_factory(workers: int) -> Callable[[], DatabaseConnection]:
+    """
+    Membuat fungsi pembuat koneksi dari environment variable yang sama
+    dengan aplikasi (DB_BACKEND, DB_HOST, DB_POOL_*, DB_REPLICA_HOSTS, ...).
+
+    Args:
+        workers: Jumlah worker; pool MySQL minimal sebesar ini
+
+    Returns:
+        Callable[[], DatabaseConnection]: Fungsi yang mengembalikan koneksi siap pakai
+    """
+    if os.getenv("DB_BACKEND", "mysql") == "sqlite":
+        from sqliteConnection import SQLiteConnection
+        path = os.getenv("DB_SQLITE_PATH", "skillhub.db")
+        return lambda: SQLiteConnection(path)
+
+    options = dict(
+        host=os.getenv("DB_HOST", "localhost"),
+        user=os.getenv("DB_USER", "root"),
+        password=os.getenv("DB_PASSWORD", ""),
+        database=os.getenv("DB_NAME", "skillhub_db"),
+        pool_size=max(workers, int(os.getenv("DB_POOL_SIZE", "5"))),
+        pool_timeout=float(os.getenv("DB_POOL_TIMEOUT", "10")),
+        pool_recycle=float(os.getenv("DB_POOL_RECYCLE", "300")),
+        replica_hosts=[h.strip() for h in os.getenv("DB_REPLICA_HOSTS", "").split(",") if h.strip()],
+    )
+    return lambda: DatabaseConnection.pooled(**options)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point command line untuk menjalankan HTTP API."""
+    parser = argparse.ArgumentParser(description="HTTP API JSON SkillHub")
+    parser.add_argument("--host", default=os.getenv("API_HOST", "127.0.0.1"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("API_PORT", "8080")))
+    parser.add_argument("--workers", type=int, default=int(os.getenv("API_WORKERS", "8")))
+    parser.add_argument("--verbose", action="store_true", help="Tampilkan log akses")
+    args = parser.parse_args(argv)
+
+    api = SkillHubApi(connection_factory(args.workers))
+    server = ApiServer((args.host, args.port), api, workers=args.workers, verbose=args.verbose)
+    print(f"SkillHub API berjalan di http://{args.host}:{server.server_port} ({args.workers} worker)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -5,16 +5,34 @@ Main application untuk SkillHub Management System
 
 import streamlit as st
 import pandas as pd
+import csv
+import io
 import os
 
+import dataExport
+
 from models.participant import Participant
 from models.course import Course
-from databaseConnection import DatabaseConnection
+from databaseConnection import DatabaseConnection, DatabaseUnavailableError, QueryTimeoutError
+from sqliteConnection import SQLiteConnection
+from schemaMigration import ensure_schema
 from models.enrollment import Enrollment
+from models.statistics import Statistics
+from models.statCounter import StatCounter
+from models.queryCache import QueryCache
+from models.sharedCache import get_shared_cache
 from datetime import datetime
+from typing import List, Optional
 
 class SkillHubApp:
 
+    # Jumlah baris per halaman pada tab daftar
+    PAGE_SIZE = 50
+    # Batas ukuran ekspor dari aplikasi (isi unduhan ditahan di memori server)
+    EXPORT_MAX_BYTES = 50 * 1024 * 1024
+    # Jumlah hasil pencarian yang ditampilkan picker
+    SEARCH_LIMIT = 20
+
     def __init__(self):
 
         if 'db_config' not in st.session_state:
@@ -22,73 +40,51 @@ class SkillHubApp:
                 'host': os.getenv("DB_HOST", "localhost"),
                 'user': os.getenv("DB_USER", "root"),
                 'password':  os.getenv("DB_PASSWORD", ""),
-                'database': os.getenv("DB_NAME", "skillhub_db")
+                'database': os.getenv("DB_NAME", "skillhub_db"),
+                'pool_size': int(os.getenv("DB_POOL_SIZE", "5")),
+                'pool_timeout': float(os.getenv("DB_POOL_TIMEOUT", "10")),
+                'pool_recycle': float(os.getenv("DB_POOL_RECYCLE", "300")),
+                'replica_hosts': [h.strip() for h in os.getenv("DB_REPLICA_HOSTS", "").split(",") if h.strip()],
+                'read_your_writes': float(os.getenv("DB_READ_YOUR_WRITES", "5")),
+                'backend': os.getenv("DB_BACKEND", "mysql"),
+                'sqlite_path': os.getenv("DB_SQLITE_PATH", "skillhub.db")
             }
 
-        self.db = DatabaseConnection(
-            host=st.session_state.db_config['host'],
-            user=st.session_state.db_config['user'],
-            password=st.session_state.db_config['password'],
-            database=st.session_state.db_config['database']
-        )
+        if st.session_state.db_config['backend'] == 'sqlite':
+            # File SQLite lokal (mode WAL), untuk instalasi tanpa server MySQL
+            self.db = SQLiteConnection(st.session_state.db_config['sqlite_path'])
+        else:
+            # Koneksi dipinjam dari pool bersama per proses dan dikembalikan di akhir rerun
+            self.db = DatabaseConnection.pooled(
+                host=st.session_state.db_config['host'],
+                user=st.session_state.db_config['user'],
+                password=st.session_state.db_config['password'],
+                database=st.session_state.db_config['database'],
+                pool_size=st.session_state.db_config['pool_size'],
+                pool_timeout=st.session_state.db_config['pool_timeout'],
+                pool_recycle=st.session_state.db_config['pool_recycle'],
+                replica_hosts=st.session_state.db_config['replica_hosts'],
+                read_your_writes=st.session_state.db_config['read_your_writes']
+            )
+        # Sesi yang baru menulis tetap membaca dari primary selama jendela read-your-writes
+        self.db.last_write = st.session_state.get('db_last_write')
+        # Cache query per rerun, dipakai bersama oleh semua model di halaman ini
+        self.query_cache = QueryCache(shared=get_shared_cache())
         self.main()
 
     # ==================== DATABASE INITIALIZATION ====================
     def init_database(self) -> bool:
         """
-        Inisialisasi struktur database (tabel).
-        
-        Args:
-            db: Instance DatabaseConnection
+        Inisialisasi struktur database melalui migrasi skema.
+        Versi skema hanya dicek sekali per proses, bukan setiap rerun.
             
         Returns:
             bool: True jika berhasil, False jika gagal
         """
         try:
-            # Tabel participants
-            create_participants = """
-            CREATE TABLE IF NOT EXISTS participants (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                nama VARCHAR(100) NOT NULL,
-                email VARCHAR(100) UNIQUE NOT NULL,
-                no_telp VARCHAR(20),
-                alamat TEXT,
-                tanggal_daftar DATETIME,
-                INDEX idx_email (email)
-            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
-            """
-            
-            # Tabel courses
-            create_courses = """
-            CREATE TABLE IF NOT EXISTS courses (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                nama_kelas VARCHAR(100) NOT NULL,
-                deskripsi TEXT,
-                instruktur VARCHAR(100),
-                tanggal_dibuat DATETIME,
-                INDEX idx_nama_kelas (nama_kelas)
-            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
-            """
-            
-            # Tabel enrollments (relasi many-to-many)
-            create_enrollments = """
-            CREATE TABLE IF NOT EXISTS enrollments (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                participant_id INT NOT NULL,
-                course_id INT NOT NULL,
-                tanggal_daftar DATETIME,
-                FOREIGN KEY (participant_id) REFERENCES participants(id),
-                FOREIGN KEY (course_id) REFERENCES courses(id),
-                UNIQUE KEY unique_enrollment (participant_id, course_id),
-                INDEX idx_participant (participant_id),
-                INDEX idx_course (course_id)
-            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
-            """
-            
-            self.db.execute_query(create_participants)
-            self.db.execute_query(create_courses)
-            self.db.execute_query(create_enrollments)
-            
+            if not ensure_schema(self.db):
+                st.error("Error inisialisasi database: migrasi skema gagal")
+                return False
             return True
         except Exception as e:
             st.error(f"Error inisialisasi database: {e}")
@@ -96,14 +92,156 @@ class SkillHubApp:
 
 
     # ==================== UI COMPONENTS ====================
+    def show_export(self, dataset: str):
+        """
+        Menampilkan tombol ekspor dataset ke CSV/JSON Lines.
+        Baris dialirkan dari database, tetapi st.download_button menyimpan isi file
+        di memori server selama tombolnya tampil, sehingga ukuran ekspor dibatasi
+        EXPORT_MAX_BYTES; ekspor yang lebih besar memakai `python commands.py export`.
+        Hasil ekspor dilepas dari sesi setelah diunduh.
+        
+        Args:
+            dataset: Nama dataset di dataExport.DATASETS
+        """
+        state_key = f"export_file_{dataset}"
+        with st.expander("📤 Ekspor Data"):
+            fmt = st.radio("Format", dataExport.FORMATS, horizontal=True, key=f"export_format_{dataset}")
+            
+            if st.button("⚙️ Siapkan File", key=f"export_prepare_{dataset}"):
+                st.session_state.pop(state_key, None)
+                out = io.StringIO()
+                try:
+                    count = dataExport.export(self.db, dataset, fmt, out, max_bytes=self.EXPORT_MAX_BYTES)
+                    st.session_state[state_key] = (out.getvalue().encode("utf-8"), fmt, count)
+                except dataExport.ExportTooLargeError as e:
+                    st.error(
+                        f"❌ Ekspor melebihi {self.EXPORT_MAX_BYTES // (1024 * 1024)} MB. "
+                        f"Gunakan: python commands.py export {dataset} --format {fmt} --output <file>"
+                    )
+            
+            prepared = st.session_state.get(state_key)
+            if prepared:
+                data, prepared_fmt, count = prepared
+                st.caption(f"{count} baris siap diunduh.")
+                st.download_button(
+                    "⬇️ Unduh",
+                    data=data,
+                    file_name=f"{dataset}.{prepared_fmt}",
+                    mime="text/csv" if prepared_fmt == "csv" else "application/x-ndjson",
+                    key=f"export_download_{dataset}",
+                    on_click=lambda: st.session_state.pop(state_key, None)
+                )
+
+    def paginate(self, key: str, load_page, cursor_of) -> list:
+        """
+        Menampilkan navigasi halaman berbasis keyset dan mengambil halaman aktif.
+        
+        Args:
+            key: Kunci unik widget dan state paginasi
+            load_page: Fungsi (cursor, limit) -> list baris
+            cursor_of: Fungsi baris -> cursor untuk halaman berikutnya
+            
+        Returns:
+            list: Baris pada halaman aktif
+        """
+        state_key = f"page_cursors_{key}"
+        if state_key not in st.session_state:
+            st.session_state[state_key] = [None]
+        cursors = st.session_state[state_key]
+        
+        # Ambil satu baris ekstra untuk mengetahui apakah masih ada halaman berikutnya
+        rows = load_page(cursors[-1], self.PAGE_SIZE + 1)
+        has_next = len(rows) > self.PAGE_SIZE
+        rows = rows[:self.PAGE_SIZE]
+        
+        col_prev, col_info, col_next = st.columns([1, 2, 1])
+        with col_prev:
+            if st.button("⬅️ Sebelumnya", key=f"{key}_prev", disabled=len(cursors) == 1):
+                cursors.pop()
+                st.experimental_rerun()
+        with col_info:
+            st.caption(f"Halaman {len(cursors)}")
+        with col_next:
+            if st.button("Berikutnya ➡️", key=f"{key}_next", disabled=not has_next):
+                cursors.append(cursor_of(rows[-1]))
+                st.experimental_rerun()
+        
+        return rows
+
+    def search_picker(self, label: str, key: str, search, format_label,
+                      empty_message: str) -> Optional[int]:
+        """
+        Picker cari-sambil-ketik: kotak pencarian lalu selectbox berisi hasil teratas,
+        sehingga hanya baris yang cocok yang diambil dari database.
+        
+        Args:
+            label: Label selectbox
+            key: Kunci unik widget
+            search: Fungsi (kata kunci, limit) -> list baris, misalnya Participant.search
+            format_label: Fungsi baris -> label opsi
+            empty_message: Pesan jika belum ada data sama sekali
+            
+        Returns:
+            Optional[int]: ID yang dipilih, atau None jika tidak ada hasil
+        """
+        term = st.text_input(f"🔎 Cari ({label})", key=f"{key}_search",
+                             placeholder="Ketik ID atau awal nama...")
+        rows = search(term, self.SEARCH_LIMIT)
+        if not rows:
+            st.info("Tidak ada data yang cocok." if term.strip() else empty_message)
+            return None
+        
+        options = {format_label(row): row['id'] for row in rows}
+        selected = st.selectbox(label, options=list(options.keys()), key=key)
+        return options[selected]
+
+    def search_multipicker(self, label: str, key: str, search, format_label) -> List[int]:
+        """
+        Multiselect cari-sambil-ketik. Pilihan dari pencarian sebelumnya tetap
+        dipertahankan saat kata kunci diganti.
+        
+        Args:
+            label: Label multiselect
+            key: Kunci unik widget
+            search: Fungsi (kata kunci, limit) -> list baris
+            format_label: Fungsi baris -> label opsi
+            
+        Returns:
+            List[int]: ID yang dipilih
+        """
+        term = st.text_input(f"🔎 Cari ({label})", key=f"{key}_search",
+                             placeholder="Ketik ID atau awal nama...")
+        known = st.session_state.setdefault(f"{key}_ids", {})
+        found = {format_label(row): row['id'] for row in search(term, self.SEARCH_LIMIT)}
+        known.update(found)
+        
+        labels = list(dict.fromkeys([*st.session_state.get(key, []), *found]))
+        selected = st.multiselect(label, options=labels, key=key)
+        return [known[label] for label in selected]
+
+    @staticmethod
+    def participant_label(participant: dict) -> str:
+        """Label opsi picker peserta."""
+        return f"{participant['id']} - {participant['nama']} ({participant['email']})"
+
+    @staticmethod
+    def course_label(course: dict) -> str:
+        """Label opsi picker kelas."""
+        return f"{course['id']} - {course['nama_kelas']}"
+
+    def clear_picker(self, key: str):
+        """Mengosongkan pilihan multipicker setelah disimpan."""
+        for state_key in (key, f"{key}_ids"):
+            st.session_state.pop(state_key, None)
+
     def show_participant_management(self):
         """Tampilan untuk manajemen data peserta."""
         st.header("📋 Manajemen Data Peserta")
         
-        participant_model = Participant(self.db)
+        participant_model = Participant(self.db, self.query_cache)
         
-        tab1, tab2, tab3, tab4, tab5 = st.tabs([
-            "➕ Tambah", "📊 Daftar", "🔍 Detail", "✏️ Edit", "🗑️ Hapus"
+        tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
+            "➕ Tambah", "📊 Daftar", "🔍 Detail", "✏️ Edit", "🗑️ Hapus", "📥 Import CSV"
         ])
         
         # TAB: Tambah Peserta
@@ -128,28 +266,34 @@ class SkillHubApp:
         # TAB: Daftar Peserta
         with tab2:
             st.subheader("Daftar Seluruh Peserta")
-            participants = participant_model.get_all()
+            participants = self.paginate(
+                "participants",
+                lambda cursor, limit: participant_model.get_page(cursor, limit),
+                lambda p: p['id']
+            )
             
             if participants:
                 df = pd.DataFrame(participants)
                 df['tanggal_daftar'] = pd.to_datetime(df['tanggal_daftar']).dt.strftime('%Y-%m-%d %H:%M')
                 st.dataframe(df, use_container_width=True, hide_index=True)
-                st.info(f"Total Peserta: {len(participants)}")
+                st.info(f"Total Peserta: {participant_model.count()}")
+                self.show_export("participants")
             else:
                 st.info("Belum ada data peserta.")
         
         # TAB: Detail Peserta
         with tab3:
             st.subheader("Detail Peserta")
-            participants = participant_model.get_all()
+            participant_id = self.search_picker(
+                "Pilih Peserta", "detail_participant", participant_model.search,
+                self.participant_label, "Belum ada data peserta."
+            )
             
-            if participants:
-                participant_options = {f"{p['id']} - {p['nama']}": p['id'] for p in participants}
-                selected = st.selectbox("Pilih Peserta", options=list(participant_options.keys()))
-                
+            if participant_id is not None:
                 if st.button("🔍 Lihat Detail"):
-                    participant_id = participant_options[selected]
-                    detail = participant_model.get_by_id(participant_id)
+                    # Data peserta dan kelasnya diambil dalam satu query
+                    enrollment_model = Enrollment(self.db, self.query_cache)
+                    detail = enrollment_model.get_participant_detail(participant_id)
                     
                     if detail:
                         col1, col2 = st.columns(2)
@@ -165,27 +309,22 @@ class SkillHubApp:
                         # Tampilkan kelas yang diikuti
                         st.divider()
                         st.write("**Kelas yang Diikuti:**")
-                        enrollment_model = Enrollment(self.db)
-                        courses = enrollment_model.get_courses_by_participant(participant_id)
                         
-                        if courses:
-                            for course in courses:
+                        if detail['courses']:
+                            for course in detail['courses']:
                                 st.write(f"- {course['nama_kelas']} (Instruktur: {course['instruktur']})")
                         else:
                             st.info("Belum mengikuti kelas apapun.")
-            else:
-                st.info("Belum ada data peserta.")
         
         # TAB: Edit Peserta
         with tab4:
             st.subheader("Edit Data Peserta")
-            participants = participant_model.get_all()
+            participant_id = self.search_picker(
+                "Pilih Peserta untuk Diedit", "edit_participant", participant_model.search,
+                self.participant_label, "Belum ada data peserta."
+            )
             
-            if participants:
-                participant_options = {f"{p['id']} - {p['nama']}": p['id'] for p in participants}
-                selected = st.selectbox("Pilih Peserta untuk Diedit", options=list(participant_options.keys()))
-                
-                participant_id = participant_options[selected]
+            if participant_id is not None:
                 detail = participant_model.get_by_id(participant_id)
                 
                 if detail:
@@ -209,40 +348,62 @@ class SkillHubApp:
                         if st.session_state.get("success_edit"):
                             st.success("✅ Data kelas berhasil diupdate!")
                             del st.session_state["success_edit"]
-
-            else:
-                st.info("Belum ada data peserta.")
         
         # TAB: Hapus Peserta
         with tab5:
             st.subheader("Hapus Peserta")
-            participants = participant_model.get_all()
+            participant_ids = self.search_multipicker(
+                "Pilih Peserta untuk Dihapus", "delete_participants", participant_model.search,
+                self.participant_label
+            )
             
-            if participants:
-                participant_options = {f"{p['id']} - {p['nama']}": p['id'] for p in participants}
-                selected = st.selectbox("Pilih Peserta untuk Dihapus", options=list(participant_options.keys()))
-                
+            if participant_ids:
                 st.warning("⚠️ Menghapus peserta akan menghapus semua pendaftaran kelas peserta ini!")
                 
-                if st.button("🗑️ Hapus Peserta", type="primary"):
-                    participant_id = participant_options[selected]
-                    if participant_model.delete(participant_id):
-                        st.session_state["success_delete_participant"] = True
-                        st.experimental_rerun()
-
-                if st.session_state.get("success_delete_participant"):   
-                    st.success("✅ Participant berhasil dihapus!")
-                    del st.session_state["success_delete_participant"]
-
-            else:
-                st.info("Belum ada data peserta.")
+                if st.button(f"🗑️ Hapus {len(participant_ids)} Peserta", type="primary"):
+                    st.session_state["success_delete_participant"] = participant_model.delete_many(participant_ids)
+                    self.clear_picker("delete_participants")
+                    st.experimental_rerun()
+
+            if st.session_state.get("success_delete_participant"):
+                result = st.session_state["success_delete_participant"]
+                if result['deleted']:
+                    st.success(f"✅ {result['deleted']} peserta berhasil dihapus!")
+                if result['failed']:
+                    st.error(f"❌ {result['failed']} peserta gagal dihapus.")
+                del st.session_state["success_delete_participant"]
+
+        # TAB: Import Peserta dari CSV
+        with tab6:
+            st.subheader("Import Peserta dari CSV")
+            st.caption("Kolom CSV: nama, email, no_telp, alamat. Email yang sudah terdaftar dilewati.")
+            
+            uploaded = st.file_uploader("Pilih file CSV", type=["csv"], key="import_participants_csv")
+            
+            if uploaded is not None and st.button("📥 Import Peserta"):
+                # Baca CSV baris per baris langsung ke batch INSERT
+                reader = csv.DictReader(io.TextIOWrapper(uploaded, encoding="utf-8-sig", newline=""))
+                progress = st.empty()
+                summary = participant_model.bulk_create(
+                    reader,
+                    on_batch=lambda s: progress.info(f"⏳ {s['inserted']} peserta ditambahkan...")
+                )
+                
+                progress.success(f"✅ {summary['inserted']} peserta berhasil diimport!")
+                if summary['duplicates']:
+                    st.warning(f"⚠️ {len(summary['duplicates'])} email sudah terdaftar dan dilewati: "
+                               + ", ".join(summary['duplicates'][:20]))
+                if summary['invalid']:
+                    st.warning(f"⚠️ Baris tanpa nama/email dilewati: {summary['invalid'][:20]}")
+                if summary['failed']:
+                    st.error(f"❌ {summary['failed']} peserta gagal disimpan.")
 
 
     def show_course_management(self):
         """Tampilan untuk manajemen data kelas."""
         st.header("🎓 Manajemen Data Kelas")
         
-        course_model = Course(self.db)
+        course_model = Course(self.db, self.query_cache)
         
         tab1, tab2, tab3, tab4, tab5 = st.tabs([
             "➕ Tambah", "📊 Daftar", "🔍 Detail", "✏️ Edit", "🗑️ Hapus"
@@ -269,28 +430,34 @@ class SkillHubApp:
         # TAB: Daftar Kelas
         with tab2:
             st.subheader("Daftar Seluruh Kelas")
-            courses = course_model.get_all()
+            courses = self.paginate(
+                "courses",
+                lambda cursor, limit: course_model.get_page(cursor, limit),
+                lambda c: c['id']
+            )
             
             if courses:
                 df = pd.DataFrame(courses)
                 df['tanggal_dibuat'] = pd.to_datetime(df['tanggal_dibuat']).dt.strftime('%Y-%m-%d %H:%M')
                 st.dataframe(df, use_container_width=True, hide_index=True)
-                st.info(f"Total Kelas: {len(courses)}")
+                st.info(f"Total Kelas: {course_model.count()}")
+                self.show_export("courses")
             else:
                 st.info("Belum ada data kelas.")
         
         # TAB: Detail Kelas
         with tab3:
             st.subheader("Detail Kelas")
-            courses = course_model.get_all()
+            course_id = self.search_picker(
+                "Pilih Kelas", "detail_course", course_model.search,
+                self.course_label, "Belum ada data kelas."
+            )
             
-            if courses:
-                course_options = {f"{c['id']} - {c['nama_kelas']}": c['id'] for c in courses}
-                selected = st.selectbox("Pilih Kelas", options=list(course_options.keys()))
-                
+            if course_id is not None:
                 if st.button("🔍 Lihat Detail"):
-                    course_id = course_options[selected]
-                    detail = course_model.get_by_id(course_id)
+                    # Data kelas dan pesertanya diambil dalam satu query
+                    enrollment_model = Enrollment(self.db, self.query_cache)
+                    detail = enrollment_model.get_course_detail(course_id)
                     
                     if detail:
                         col1, col2 = st.columns(2)
@@ -300,33 +467,29 @@ class SkillHubApp:
                             st.write(f"**Instruktur:** {detail['instruktur']}")
                         with col2:
                             st.write(f"**Tanggal Dibuat:** {detail['tanggal_dibuat']}")
+                            st.write(f"**Jumlah Peserta:** {len(detail['participants'])}")
                         
                         st.write(f"**Deskripsi:** {detail['deskripsi']}")
                         
                         # Tampilkan peserta yang terdaftar
                         st.divider()
                         st.write("**Peserta yang Terdaftar:**")
-                        enrollment_model = Enrollment(self.db)
-                        participants = enrollment_model.get_participants_by_course(course_id)
                         
-                        if participants:
-                            for p in participants:
+                        if detail['participants']:
+                            for p in detail['participants']:
                                 st.write(f"- {p['nama']} ({p['email']})")
                         else:
                             st.info("Belum ada peserta yang terdaftar.")
-            else:
-                st.info("Belum ada data kelas.")
         
         # TAB: Edit Kelas
         with tab4:
             st.subheader("Edit Data Kelas")
-            courses = course_model.get_all()
+            course_id = self.search_picker(
+                "Pilih Kelas untuk Diedit", "edit_course", course_model.search,
+                self.course_label, "Belum ada data kelas."
+            )
             
-            if courses:
-                course_options = {f"{c['id']} - {c['nama_kelas']}": c['id'] for c in courses}
-                selected = st.selectbox("Pilih Kelas untuk Diedit", options=list(course_options.keys()))
-                
-                course_id = course_options[selected]
+            if course_id is not None:
                 detail = course_model.get_by_id(course_id)
                 
                 if detail:
@@ -349,43 +512,41 @@ class SkillHubApp:
                         if st.session_state.get("success_edit"):
                             st.success("✅ Data kelas berhasil diupdate!")
                             del st.session_state["success_edit"]
-
-            else:
-                st.info("Belum ada data kelas.")
                 
         
         # TAB: Hapus Kelas
         with tab5:
             st.subheader("Hapus Kelas")
-            courses = course_model.get_all()
+            course_ids = self.search_multipicker(
+                "Pilih Kelas untuk Dihapus", "delete_courses", course_model.search,
+                self.course_label
+            )
             
-            if courses:
-                course_options = {f"{c['id']} - {c['nama_kelas']}": c['id'] for c in courses}
-                selected = st.selectbox("Pilih Kelas untuk Dihapus", options=list(course_options.keys()))
-                
+            if course_ids:
                 st.warning("⚠️ Menghapus kelas akan menghapus semua pendaftaran peserta di kelas ini!")
                 
-                if st.button("🗑️ Hapus Kelas", type="primary"):
-                    course_id = course_options[selected]
-                    if course_model.delete(course_id):
-                        st.session_state["success_delete_course"] = True
-                        st.experimental_rerun()
+                if st.button(f"🗑️ Hapus {len(course_ids)} Kelas", type="primary"):
+                    st.session_state["success_delete_course"] = course_model.delete_many(course_ids)
+                    self.clear_picker("delete_courses")
+                    st.experimental_rerun()
 
-                if st.session_state.get("success_delete_course"):   
-                    st.success("✅ Kelas berhasil dihapus!")
-                    del st.session_state["success_delete_course"]
-
-            else:
-                st.info("Belum ada data kelas.")
+            if st.session_state.get("success_delete_course"):
+                result = st.session_state["success_delete_course"]
+                if result['deleted']:
+                    st.success(f"✅ {result['deleted']} kelas berhasil dihapus!")
+                if result['failed']:
+                    st.error(f"❌ {result['failed']} kelas gagal dihapus.")
+                del st.session_state["success_delete_course"]
 
 
     def show_enrollment_management(self):
         """Tampilan untuk manajemen pendaftaran."""
         st.header("📝 Manajemen Pendaftaran")
         
-        enrollment_model = Enrollment(self.db)
-        participant_model = Participant(self.db)
-        course_model = Course(self.db)
+        enrollment_model = Enrollment(self.db, self.query_cache)
+        participant_model = Participant(self.db, self.query_cache)
+        course_model = Course(self.db, self.query_cache)
+        totals = StatCounter(self.db, self.query_cache).get_totals()
         
         tab1, tab2, tab3, tab4, tab5 = st.tabs([
             "➕ Daftarkan", "📋Semua Pendaftaran", "👤 Kelas per Peserta", "🎓 Peserta per Kelas", "🗑️ Hapus Pendaftaran"
@@ -395,70 +556,85 @@ class SkillHubApp:
         with tab1:
             st.subheader("Daftarkan Peserta ke Kelas")
 
-            participants = participant_model.get_all()
-            courses = course_model.get_all()
-
-            if not participants:
+            if not totals[StatCounter.PARTICIPANTS]:
                 st.warning("⚠️ Belum ada data peserta. Tambahkan peserta terlebih dahulu.")
                 st.stop()
 
-            if not courses:
+            if not totals[StatCounter.COURSES]:
                 st.warning("⚠️ Belum ada data kelas. Tambahkan kelas terlebih dahulu.")
                 st.stop()
 
-            participant_options = {f"{p['id']} - {p['nama']}": p['id'] for p in participants}
-
-            selected_participant_label = st.selectbox(
-                "Pilih Peserta *",
-                options=list(participant_options.keys()),
-                key="select_participant" 
+            mode = st.radio(
+                "Mode Pendaftaran",
+                ["Satu peserta → beberapa kelas", "Beberapa peserta → satu kelas"],
+                horizontal=True,
+                key="enrollment_mode"
             )
 
-            participant_id = participant_options[selected_participant_label]
-
-            # Ambil kelas yang sudah diikuti peserta
-            enrolled = enrollment_model.get_courses_by_participant(participant_id)
-            enrolled_ids = {e['id'] for e in enrolled}
+            if mode == "Satu peserta → beberapa kelas":
+                participant_id = self.search_picker(
+                    "Pilih Peserta *", "select_participant", participant_model.search,
+                    self.participant_label, "Belum ada data peserta."
+                )
 
-            # Kelas yang belum diambil
-            available_courses = [c for c in courses if c['id'] not in enrolled_ids]
+                if participant_id is not None:
+                    # Kelas yang sudah diikuti peserta disaring di database (NOT EXISTS)
+                    course_ids = self.search_multipicker(
+                        "Pilih Kelas", "select_course",
+                        lambda term, limit: course_model.search_available(participant_id, term, limit),
+                        self.course_label
+                    )
 
-            with st.form("add_enrollment_form"):
+                    if st.button("💾 Daftarkan", key="add_enrollment"):
+                        if not course_ids:
+                            st.error("Pilih minimal satu kelas!")
+                        else:
+                            result = enrollment_model.enroll_courses(participant_id, course_ids)
+                            st.session_state["success_enrollment"] = result
+                            self.clear_picker("select_course")
+                            st.experimental_rerun()
 
-                if available_courses:
-                    course_options = {
-                        f"{c['id']} - {c['nama_kelas']}": c['id']
-                        for c in available_courses
-                    }
+            else:
+                course_id = self.search_picker(
+                    "Pilih Kelas *", "select_course_bulk", course_model.search,
+                    self.course_label, "Belum ada data kelas."
+                )
 
-                    selected_course_label = st.selectbox(
-                        "Pilih Kelas",
-                        options=list(course_options.keys()),
-                        key="select_course"
+                if course_id is not None:
+                    participant_ids = self.search_multipicker(
+                        "Pilih Peserta", "select_participants_bulk", participant_model.search,
+                        self.participant_label
                     )
 
-                    submitted = st.form_submit_button("💾 Daftarkan")
-
-                    if submitted:
-                        course_id = course_options[selected_course_label]
-                        if enrollment_model.create(participant_id, course_id):
-                            st.session_state["success_enrollment"] = True
+                    if st.button("💾 Daftarkan", key="add_bulk_enrollment"):
+                        if not participant_ids:
+                            st.error("Pilih minimal satu peserta!")
+                        else:
+                            result = enrollment_model.enroll_participants(course_id, participant_ids)
+                            st.session_state["success_enrollment"] = result
+                            self.clear_picker("select_participants_bulk")
                             st.experimental_rerun()
 
-                    if st.session_state.get("success_enrollment"):
-                        st.success("✅ Peserta berhasil didaftarkan ke kelas!")
-                        del st.session_state["success_enrollment"]
-
-                else:
-                    st.warning("Peserta ini sudah mengambil semua kelas!")
-                    st.form_submit_button("💾 Daftarkan", disabled=True)
+            if st.session_state.get("success_enrollment"):
+                result = st.session_state["success_enrollment"]
+                if result['inserted']:
+                    st.success(f"✅ {result['inserted']} pendaftaran berhasil ditambahkan!")
+                if result['skipped']:
+                    st.warning(f"⚠️ {result['skipped']} pendaftaran dilewati karena sudah terdaftar.")
+                if not result['inserted'] and not result['skipped']:
+                    st.error("❌ Pendaftaran gagal disimpan.")
+                del st.session_state["success_enrollment"]
 
         
             # TAB: Semua Pendaftaran
         with tab2:
             st.subheader("📋 Semua Pendaftaran")
 
-            enrollments = enrollment_model.get_all_enrollments()
+            enrollments = self.paginate(
+                "enrollments",
+                lambda cursor, limit: enrollment_model.get_enrollments_page(cursor, limit),
+                lambda e: (e['tanggal_daftar'], e['id'])
+            )
 
             if enrollments:
                 df = pd.DataFrame(enrollments)
@@ -470,7 +646,8 @@ class SkillHubApp:
                     hide_index=True
                 )
 
-                st.info(f"Total Pendaftaran: {len(enrollments)}")
+                st.info(f"Total Pendaftaran: {totals[StatCounter.ENROLLMENTS]}")
+                self.show_export("enrollments")
             else:
                 st.info("Belum ada data pendaftaran.")
 
@@ -478,15 +655,16 @@ class SkillHubApp:
         with tab3:
             st.subheader("Kelas yang Diikuti Peserta")
             
-            participants = participant_model.get_all()
+            participant_id = self.search_picker(
+                "Pilih Peserta", "view_courses", participant_model.search,
+                self.participant_label, "Belum ada data peserta."
+            )
             
-            if participants:
-                participant_options = {f"{p['id']} - {p['nama']}": p['id'] for p in participants}
-                selected = st.selectbox("Pilih Peserta", options=list(participant_options.keys()), key="view_courses")
-                
+            if participant_id is not None:
                 if st.button("🔍 Lihat Kelas"):
-                    participant_id = participant_options[selected]
-                    courses = enrollment_model.get_courses_by_participant(participant_id)
+                    courses = enrollment_model.get_courses_by_participant(
+                        participant_id, columns=('id', 'nama_kelas', 'instruktur', 'deskripsi')
+                    )
                     
                     if courses:
                         st.success(f"Peserta ini mengikuti {len(courses)} kelas:")
@@ -497,22 +675,21 @@ class SkillHubApp:
                         st.dataframe(display_df, use_container_width=True, hide_index=True)
                     else:
                         st.info("Peserta ini belum mengikuti kelas apapun.")
-            else:
-                st.info("Belum ada data peserta.")
         
         # TAB: Peserta per Kelas
         with tab4:
             st.subheader("Peserta yang Terdaftar di Kelas")
             
-            courses = course_model.get_all()
+            course_id = self.search_picker(
+                "Pilih Kelas", "view_participants", course_model.search,
+                self.course_label, "Belum ada data kelas."
+            )
             
-            if courses:
-                course_options = {f"{c['id']} - {c['nama_kelas']}": c['id'] for c in courses}
-                selected = st.selectbox("Pilih Kelas", options=list(course_options.keys()), key="view_participants")
-                
+            if course_id is not None:
                 if st.button("🔍 Lihat Peserta"):
-                    course_id = course_options[selected]
-                    participants = enrollment_model.get_participants_by_course(course_id)
+                    participants = enrollment_model.get_participants_by_course(
+                        course_id, columns=('id', 'nama', 'email', 'no_telp')
+                    )
                     
                     if participants:
                         st.success(f"Kelas ini diikuti oleh {len(participants)} peserta:")
@@ -523,65 +700,70 @@ class SkillHubApp:
                         st.dataframe(display_df, use_container_width=True, hide_index=True)
                     else:
                         st.info("Belum ada peserta yang terdaftar di kelas ini.")
-            else:
-                st.info("Belum ada data kelas.")
         
         # TAB: Hapus Pendaftaran
         with tab5:
             st.subheader("Hapus Pendaftaran")
             
-            enrollments = enrollment_model.get_all_enrollments()
+            participant_id = self.search_picker(
+                "Pilih Peserta", "delete_enrollment_participant", participant_model.search,
+                self.participant_label, "Belum ada data peserta."
+            )
             
-            if enrollments:
-                st.info(f"Total Pendaftaran: {len(enrollments)}")
-                
-                enrollment_options = {
-                    f"{e['id']} - {e['nama_peserta']} → {e['nama_kelas']}": 
-                    (e['participant_id'], e['course_id']) 
-                    for e in enrollments
-                }
-                
-                selected = st.selectbox("Pilih Pendaftaran untuk Dihapus", options=list(enrollment_options.keys()))
-                
-                st.warning("⚠️ Hanya menghapus relasi pendaftaran, tidak menghapus peserta atau kelas.")
+            if participant_id is not None:
+                # Hanya kelas yang diikuti peserta ini, dengan kolom untuk label saja
+                enrolled = enrollment_model.get_courses_by_participant(
+                    participant_id, columns=('id', 'nama_kelas')
+                )
                 
-                if st.button("🗑️ Hapus Pendaftaran", type="primary"):
-                    participant_id, course_id = enrollment_options[selected]
-                    if enrollment_model.delete(participant_id, course_id):
-                        st.session_state["success_delete_enrollment"] = True
+                if enrolled:
+                    course_options = {self.course_label(e): e['id'] for e in enrolled}
+                    selected = st.multiselect(
+                        "Pilih Pendaftaran untuk Dihapus", options=list(course_options.keys()),
+                        key="delete_enrollment_courses"
+                    )
+                    
+                    st.warning("⚠️ Hanya menghapus relasi pendaftaran, tidak menghapus peserta atau kelas.")
+                    
+                    if selected and st.button(f"🗑️ Hapus {len(selected)} Pendaftaran", type="primary"):
+                        st.session_state["success_delete_enrollment"] = enrollment_model.delete_courses(
+                            participant_id, [course_options[label] for label in selected]
+                        )
+                        self.clear_picker("delete_enrollment_courses")
                         st.experimental_rerun()
+                else:
+                    st.info("Peserta ini belum mengikuti kelas apapun.")
 
-                if st.session_state.get("success_delete_enrollment"):   
-                    st.success("✅ Pendaftaran berhasil dihapus!")
-                    del st.session_state["success_delete_enrollment"]
-
-            else:
-                st.info("Belum ada data pendaftaran.")
+            if st.session_state.get("success_delete_enrollment"):
+                result = st.session_state["success_delete_enrollment"]
+                if result['deleted']:
+                    st.success(f"✅ {result['deleted']} pendaftaran berhasil dihapus!")
+                if result['failed']:
+                    st.error(f"❌ {result['failed']} pendaftaran gagal dihapus.")
+                del st.session_state["success_delete_enrollment"]
 
 
     def show_dashboard(self):
         """Tampilan dashboard dengan statistik."""
         st.header("📊 Dashboard SkillHub")
         
-        participant_model = Participant(self.db)
-        course_model = Course(self.db)
-        enrollment_model = Enrollment(self.db)
+        statistics_model = Statistics(self.db, self.query_cache)
         
-        # Statistik
-        participants = participant_model.get_all()
-        courses = course_model.get_all()
-        enrollments = enrollment_model.get_all_enrollments()
+        # Statistik (jumlah dan data terbaru dalam satu query)
+        stats = statistics_model.get_dashboard_stats(
+            recent_participants=3, recent_courses=3, recent_enrollments=5
+        )
         
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            st.metric("👥 Total Peserta", len(participants))
+            st.metric("👥 Total Peserta", stats['total_peserta'])
         
         with col2:
-            st.metric("🎓 Total Kelas", len(courses))
+            st.metric("🎓 Total Kelas", stats['total_kelas'])
         
         with col3:
-            st.metric("📝 Total Pendaftaran", len(enrollments))
+            st.metric("📝 Total Pendaftaran", stats['total_pendaftaran'])
         
         st.divider()
         
@@ -590,18 +772,16 @@ class SkillHubApp:
         
         with col1:
             st.subheader("🆕 Peserta Terbaru")
-            if participants:
-                recent_participants = participants[-3:]
-                for p in recent_participants:
+            if stats['peserta_terbaru']:
+                for p in stats['peserta_terbaru']:
                     st.write(f"• **{p['nama']}** - {p['email']}")
             else:
                 st.info("Belum ada peserta.")
         
         with col2:
             st.subheader("🆕 Kelas Terbaru")
-            if courses:
-                recent_courses = courses[-3:]
-                for c in recent_courses:
+            if stats['kelas_terbaru']:
+                for c in stats['kelas_terbaru']:
                     st.write(f"• **{c['nama_kelas']}** - Instruktur: {c['instruktur']}")
             else:
                 st.info("Belum ada kelas.")
@@ -609,8 +789,8 @@ class SkillHubApp:
         st.divider()
         
         st.subheader("🆕 Pendaftaran Terbaru")
-        if enrollments:
-            df = pd.DataFrame(enrollments[-5:])
+        if stats['pendaftaran_terbaru']:
+            df = pd.DataFrame(stats['pendaftaran_terbaru'])
             df['tanggal_daftar'] = pd.to_datetime(df['tanggal_daftar']).dt.strftime('%Y-%m-%d %H:%M')
             st.dataframe(df[['nama_peserta', 'nama_kelas', 'tanggal_daftar']], 
                         use_container_width=True, hide_index=True)
@@ -618,6 +798,32 @@ class SkillHubApp:
             st.info("Belum ada pendaftaran.")
 
 
+    def show_query_stats(self):
+        """Panel sidebar berisi query paling mahal dan query lambat di proses ini."""
+        with st.sidebar:
+            if not st.checkbox("⏱️ Statistik Query", key="show_query_stats"):
+                return
+            
+            monitor = self.db.monitor
+            top_queries = monitor.top(limit=10)
+            if top_queries:
+                st.caption("Query dengan total waktu terbesar")
+                st.dataframe(
+                    pd.DataFrame(top_queries)[['fingerprint', 'count', 'p50_ms', 'p95_ms', 'max_ms', 'errors']],
+                    use_container_width=True, hide_index=True
+                )
+            else:
+                st.caption("Belum ada query yang tercatat.")
+            
+            slow = monitor.slow_queries()
+            if slow:
+                st.caption(f"Query lambat (≥ {monitor.slow_threshold * 1000:.0f} ms)")
+                st.dataframe(
+                    pd.DataFrame(slow)[['durasi_ms', 'rows', 'error', 'fingerprint']],
+                    use_container_width=True, hide_index=True
+                )
+
+
     # ==================== MAIN APPLICATION ====================
     def main(self):
         """
@@ -652,18 +858,18 @@ class SkillHubApp:
                 st.session_state["menu"] = "Manajemen Kelas"
             if st.button("📝 Manajemen Pendaftaran", use_container_width=True):
                 st.session_state["menu"] = "Manajemen Pendaftaran"
+
+            pool_stats = self.db.pool_stats()
+            if pool_stats:
+                with st.expander("🔌 Status Pool Koneksi"):
+                    st.write(f"Dipakai: {pool_stats['in_use']} / {pool_stats['max_size']}")
+                    st.write(f"Idle: {pool_stats['idle']}")
+                    st.write(f"Menunggu: {pool_stats['waits']} (timeout: {pool_stats['timeouts']})")
             
         
         # Inisialisasi koneksi database
         try:
-            db = DatabaseConnection(
-                host=st.session_state.db_config['host'],
-                user=st.session_state.db_config['user'],
-                password=st.session_state.db_config['password'],
-                database=st.session_state.db_config['database']
-            )
-            
-            if db.connect():
+            if self.db.connect():
                 # Inisialisasi tabel jika belum ada
                 self.init_database()
                 
@@ -677,14 +883,26 @@ class SkillHubApp:
                 elif st.session_state["menu"] == "Manajemen Pendaftaran":
                     self.show_enrollment_management()
                 
-                # Tutup koneksi setelah selesai
-                db.disconnect()
+                self.show_query_stats()
             else:
                 st.error("❌ Gagal terhubung ke database. Periksa konfigurasi database.")
         
+        except DatabaseUnavailableError as e:
+            st.error("❌ Database sedang tidak dapat dihubungi. Silakan coba lagi beberapa saat lagi.")
+            st.caption(str(e))
+        
+        except QueryTimeoutError as e:
+            st.error("❌ Database terlalu lama merespons dan query dibatalkan. Silakan coba lagi.")
+            st.caption(str(e))
+        
         except Exception as e:
             st.error(f"❌ Error: {e}")
 
+        finally:
+            # Kembalikan koneksi ke pool setelah selesai (juga saat rerun/stop)
+            st.session_state['db_last_write'] = self.db.last_write
+            self.db.disconnect()
+
 
 if __name__ == "__main__":
     app = SkillHubApp()   # buat instance class SkillHubApp
\ No newline at end of file
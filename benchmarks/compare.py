@@ -0,0 +1,91 @@
+"""
+Membandingkan dua file hasil benchmark dan menandai regresi.
+
+Jalankan dari command line:
+    python -m benchmarks.compare baseline.json hasil.json --threshold 0.2
+"""
+
+import argparse
+import json
+from typing import Dict, List, Optional
+
+# Selisih di bawah batas ini (ms) dianggap noise, berapa pun persentasenya
+NOISE_FLOOR_MS = 0.5
+
+
+def compare(baseline: Dict, current: Dict, threshold: float = 0.2) -> List[Dict]:
+    """
+    Membandingkan median setiap benchmark yang ada di kedua hasil.
+
+    Args:
+        baseline: Isi file hasil sebelumnya
+        current: Isi file hasil sekarang
+        threshold: Kenaikan relatif median yang dianggap regresi (0.2 = 20%)
+
+    Returns:
+        List[Dict]: name, baseline_ms, current_ms, change, regression
+    """
+    rows = []
+    for name, result in current.get('results', {}).items():
+        before = baseline.get('results', {}).get(name)
+        if before is None:
+            continue
+        old, new = before['median_ms'], result['median_ms']
+        change = (new - old) / old if old else 0.0
+        rows.append({
+            'name': name,
+            'baseline_ms': old,
+            'current_ms': new,
+            'change': round(change, 4),
+            'regression': change > threshold and new - old > NOISE_FLOOR_MS,
+        })
+    rows.sort(key=lambda r: r['change'], reverse=True)
+    return rows
+
+
+def format_report(rows: List[Dict]) -> str:
+    """
+    Menyusun laporan perbandingan yang bisa dibaca manusia.
+
+    Args:
+        rows: Hasil compare()
+
+    Returns:
+        str: Satu baris per benchmark, regresi ditandai "REGRESI"
+    """
+    if not rows:
+        return "Tidak ada benchmark yang bisa dibandingkan."
+    lines = []
+    for row in rows:
+        flag = "REGRESI" if row['regression'] else ""
+        lines.append(f"{row['name']:<55} {row['baseline_ms']:>10.3f} -> {row['current_ms']:>10.3f} ms "
+                     f"{row['change'] * 100:>+7.1f}% {flag}".rstrip())
+    regressions = sum(1 for row in rows if row['regression'])
+    lines.append(f"{regressions} regresi dari {len(rows)} benchmark.")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point command line; exit code 1 jika ada regresi."""
+    parser = argparse.ArgumentParser(description="Bandingkan hasil benchmark SkillHub")
+    parser.add_argument("baseline", help="File hasil sebelumnya")
+    parser.add_argument("current", help="File hasil sekarang")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Kenaikan median yang dianggap regresi (default 0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    with open(args.current, encoding="utf-8") as f:
+        current = json.load(f)
+
+    if baseline.get('scale') != current.get('scale'):
+        print(f"Peringatan: skala berbeda ({baseline.get('scale')} vs {current.get('scale')})")
+
+    rows = compare(baseline, current, args.threshold)
+    print(format_report(rows))
+    return 1 if any(row['regression'] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
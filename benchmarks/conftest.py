@@ -0,0 +1,132 @@
+"""
+Fixture benchmark SkillHub.
+
+Jalankan dengan:
+    pytest benchmarks -m benchmark
+
+Environment variable:
+    BENCH_SCALE     skala dataset di dataGenerator.SCALES (default tiny)
+    BENCH_SEED      seed generator data (default 42)
+    BENCH_ROUNDS    jumlah pengulangan per benchmark (default 5)
+    BENCH_OUTPUT    file hasil JSON (default benchmarks/results/<scale>.json)
+    BENCH_BASELINE  file hasil sebelumnya untuk dibandingkan (optional)
+"""
+
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+import pytest
+
+from benchmarks.compare import compare, format_report
+from benchmarks.dataGenerator import generate
+from queryMonitor import QueryMonitor
+from schemaMigration import SchemaMigrator
+from sqliteConnection import SQLiteConnection
+
+SCALE = os.getenv("BENCH_SCALE", "tiny")
+SEED = int(os.getenv("BENCH_SEED", "42"))
+ROUNDS = int(os.getenv("BENCH_ROUNDS", "5"))
+OUTPUT = os.getenv("BENCH_OUTPUT", os.path.join(os.path.dirname(__file__), "results", f"{SCALE}.json"))
+BASELINE = os.getenv("BENCH_BASELINE")
+
+_results: Dict[str, Dict[str, Any]] = {}
+_dataset: Dict[str, int] = {}
+
+
+class Bench:
+    """Pengukur waktu yang mencatat hasil ke laporan JSON sesi benchmark."""
+
+    def __call__(self, name: str, fn: Callable, setup: Optional[Callable[[int], tuple]] = None,
+                 rounds: Optional[int] = None) -> Any:
+        """
+        Menjalankan fn beberapa kali dan mencatat durasinya.
+
+        Args:
+            name: Nama benchmark, misalnya "Participant.get_all"
+            fn: Fungsi yang diukur
+            setup: Fungsi (nomor ronde) -> tuple argumen fn (nilai lain diabaikan), tidak ikut diukur (optional)
+            rounds: Jumlah pengulangan (optional, default BENCH_ROUNDS)
+
+        Returns:
+            Any: Hasil fn pada ronde terakhir
+        """
+        rounds = rounds or ROUNDS
+        durations = []
+        result = None
+        for i in range(rounds):
+            args = setup(i) if setup else ()
+            args = args if isinstance(args, tuple) else ()
+            started = time.perf_counter()
+            result = fn(*args)
+            durations.append((time.perf_counter() - started) * 1000)
+
+        _results[name] = {
+            'rounds': rounds,
+            'min_ms': round(min(durations), 3),
+            'median_ms': round(statistics.median(durations), 3),
+            'mean_ms': round(statistics.fmean(durations), 3),
+            'max_ms': round(max(durations), 3),
+        }
+        return result
+
+
+@pytest.fixture(scope="session")
+def bench_db_path(tmp_path_factory) -> str:
+    """File SQLite berisi data sintetis sesuai BENCH_SCALE dan BENCH_SEED."""
+    path = str(tmp_path_factory.mktemp("bench") / f"skillhub_{SCALE}_{SEED}.db")
+    db = SQLiteConnection(path, monitor=QueryMonitor())
+    try:
+        assert SchemaMigrator(db).migrate(), f"Migrasi skema gagal: {db.last_error}"
+        _dataset.update(generate(db, SCALE, SEED))
+    finally:
+        db.disconnect()
+    return path
+
+
+@pytest.fixture(scope="session")
+def bench_db(bench_db_path) -> SQLiteConnection:
+    """Koneksi bersama ke database benchmark."""
+    db = SQLiteConnection(bench_db_path, monitor=QueryMonitor())
+    yield db
+    db.disconnect()
+
+
+@pytest.fixture(scope="session")
+def bench() -> Bench:
+    """Pengukur waktu benchmark."""
+    return Bench()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Menulis hasil benchmark ke JSON dan membandingkannya dengan baseline."""
+    if not _results:
+        return
+
+    report = {
+        'created': datetime.now().isoformat(timespec="seconds"),
+        'scale': SCALE,
+        'seed': SEED,
+        'dataset': _dataset,
+        'python': platform.python_version(),
+        'sqlite': sqlite3.sqlite_version,
+        'results': dict(sorted(_results.items())),
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(OUTPUT)), exist_ok=True)
+    with open(OUTPUT, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    reporter = session.config.pluginmanager.get_plugin("terminalreporter")
+    if reporter is None:
+        return
+    reporter.write_line(f"Hasil benchmark ditulis ke {OUTPUT}")
+
+    if BASELINE and os.path.exists(BASELINE):
+        with open(BASELINE, encoding="utf-8") as f:
+            baseline = json.load(f)
+        reporter.write_line(format_report(compare(baseline, report)))
@@ -0,0 +1,129 @@
+# ==================== SYNTHETIC DATA GENERATOR ====================
+"""
+Generator data sintetis yang deterministik untuk benchmark.
+Seed dan skala yang sama selalu menghasilkan isi tabel yang sama.
+"""
+
+import random
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Tuple
+
+from databaseConnection import DatabaseConnection
+from models.statCounter import StatCounter
+
+# Skala dataset: (jumlah peserta, jumlah kelas, jumlah pendaftaran)
+SCALES: Dict[str, Tuple[int, int, int]] = {
+    'tiny': (200, 20, 1_000),
+    '10k': (2_000, 100, 10_000),
+    '100k': (20_000, 500, 100_000),
+    '1m': (200_000, 2_000, 1_000_000),
+}
+
+BASE_DATE = datetime(2024, 1, 1, 8, 0, 0)
+BATCH_SIZE = 5_000
+
+_FIRST_NAMES = ["Andi", "Budi", "Citra", "Dewi", "Eko", "Fitri", "Gita", "Hadi",
+                "Indah", "Joko", "Kartika", "Lestari", "Made", "Nur", "Putri", "Rizki"]
+_LAST_NAMES = ["Saputra", "Wijaya", "Santoso", "Pratama", "Lestari", "Hidayat",
+               "Kusuma", "Nugroho", "Siregar", "Wibowo"]
+_TOPICS = ["Python", "Data Science", "Web Development", "UI/UX", "Digital Marketing",
+           "Public Speaking", "Akuntansi", "Desain Grafis", "Cloud", "Machine Learning"]
+_LEVELS = ["Dasar", "Menengah", "Lanjut"]
+
+
+def participant_rows(count: int, rng: random.Random) -> Iterator[tuple]:
+    """Menghasilkan baris peserta (nama, email, no_telp, alamat, tanggal_daftar)."""
+    for i in range(count):
+        nama = f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}"
+        yield (
+            nama,
+            f"peserta{i:07d}@skillhub.test",
+            f"08{rng.randrange(10**9, 10**10)}",
+            f"Jl. Benchmark No. {rng.randrange(1, 500)}",
+            BASE_DATE + timedelta(minutes=i),
+        )
+
+
+def course_rows(count: int, rng: random.Random) -> Iterator[tuple]:
+    """Menghasilkan baris kelas (nama_kelas, deskripsi, instruktur, tanggal_dibuat)."""
+    for i in range(count):
+        topic = rng.choice(_TOPICS)
+        yield (
+            f"{topic} {rng.choice(_LEVELS)} #{i + 1}",
+            f"Kelas {topic} untuk benchmark",
+            f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}",
+            BASE_DATE + timedelta(hours=i),
+        )
+
+
+def enrollment_rows(count: int, participants: int, courses: int,
+                    rng: random.Random) -> Iterator[tuple]:
+    """
+    Menghasilkan pasangan pendaftaran unik (participant_id, course_id, tanggal_daftar).
+    ID mengasumsikan tabel kosong sehingga AUTO_INCREMENT dimulai dari 1.
+    """
+    if count > participants * courses:
+        raise ValueError("Jumlah pendaftaran melebihi jumlah pasangan peserta-kelas")
+    pairs = rng.sample(range(participants * courses), count)
+    for i, pair in enumerate(pairs):
+        yield (
+            pair // courses + 1,
+            pair % courses + 1,
+            BASE_DATE + timedelta(seconds=30 * i),
+        )
+
+
+def _insert(db: DatabaseConnection, query: str, rows: Iterator[tuple]) -> int:
+    """Menyisipkan baris per batch dengan executemany."""
+    total = 0
+    batch: List[tuple] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= BATCH_SIZE:
+            if not db.execute_many(query, batch):
+                raise RuntimeError(f"Gagal mengisi data: {db.last_error}")
+            total += len(batch)
+            batch = []
+    if batch:
+        if not db.execute_many(query, batch):
+            raise RuntimeError(f"Gagal mengisi data: {db.last_error}")
+        total += len(batch)
+    return total
+
+
+def generate(db: DatabaseConnection, scale: str = 'tiny', seed: int = 42) -> Dict[str, int]:
+    """
+    Mengisi tabel participants, courses, enrollments (yang masih kosong)
+    lalu menghitung ulang stat_counters.
+
+    Args:
+        db: Instance DatabaseConnection
+        scale: Nama skala di SCALES
+        seed: Seed generator acak
+
+    Returns:
+        Dict[str, int]: Jumlah baris participants, courses, enrollments
+    """
+    if scale not in SCALES:
+        raise ValueError(f"Skala tidak dikenal: {scale} (pilihan: {', '.join(SCALES)})")
+    n_participants, n_courses, n_enrollments = SCALES[scale]
+    rng = random.Random(seed)
+
+    counts = {
+        'participants': _insert(db, """
+            INSERT INTO participants (nama, email, no_telp, alamat, tanggal_daftar)
+            VALUES (%s, %s, %s, %s, %s)
+        """, participant_rows(n_participants, rng)),
+        'courses': _insert(db, """
+            INSERT INTO courses (nama_kelas, deskripsi, instruktur, tanggal_dibuat)
+            VALUES (%s, %s, %s, %s)
+        """, course_rows(n_courses, rng)),
+        'enrollments': _insert(db, """
+            INSERT INTO enrollments (participant_id, course_id, tanggal_daftar)
+            VALUES (%s, %s, %s)
+        """, enrollment_rows(n_enrollments, n_participants, n_courses, rng)),
+    }
+
+    if not StatCounter(db).reconcile():
+        raise RuntimeError(f"Gagal menghitung ulang stat_counters: {db.last_error}")
+    return counts
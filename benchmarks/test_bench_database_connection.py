@@ -0,0 +1,153 @@
+"""
+Benchmark method publik DatabaseConnection.
+
+Perbandingan prepared statement butuh server MySQL: atur BENCH_MYSQL_DB ke
+database kosong sekali pakai (tabelnya diisi data sintetis), memakai
+DB_HOST/DB_USER/DB_PASSWORD.
+"""
+
+import inspect
+import os
+import pytest
+from benchmarks.dataGenerator import generate
+from databaseConnection import DatabaseConnection
+from models.course import Course
+from models.enrollment import Enrollment
+from models.participant import Participant
+from schemaMigration import SchemaMigrator
+
+pytestmark = pytest.mark.benchmark
+
+MYSQL_BENCH_DB = os.getenv("BENCH_MYSQL_DB")
+
+COVERED = {'connect', 'disconnect', 'pool_stats', 'execute_query', 'execute_many',
+           'transaction', 'fetch_all', 'fetch_one', 'iter_rows', 'read_from_primary'}
+# Konstruktor khusus MySQL, tidak bisa diukur tanpa server
+EXEMPT = {'from_env', 'pooled'}
+
+
+class TestCoverage:
+    #Test every public DatabaseConnection method has a benchmark
+
+    def test_every_public_method_is_benchmarked(self):
+        #Test new public methods are added to the benchmark suite
+        methods = {name for name, member in vars(DatabaseConnection).items()
+                   if not name.startswith('_')
+                   and (inspect.isfunction(member) or isinstance(member, classmethod))}
+
+        assert methods == COVERED | EXEMPT
+
+
+class TestDatabaseConnectionBench:
+    #Benchmark DatabaseConnection
+
+    def test_connect_disconnect(self, bench, bench_db):
+        #Benchmark opening and closing a connection
+        bench("DatabaseConnection.connect", bench_db.connect,
+              setup=lambda i: bench_db.disconnect())
+        bench("DatabaseConnection.disconnect", bench_db.disconnect,
+              setup=lambda i: bench_db.connect())
+        assert bench_db.connect()
+
+    def test_pool_stats(self, bench, bench_db):
+        #Benchmark pool stats lookup (None without a pool)
+        assert bench("DatabaseConnection.pool_stats", bench_db.pool_stats) is None
+
+    def test_fetch(self, bench, bench_db):
+        #Benchmark buffered and streamed reads
+        query = "SELECT * FROM enrollments ORDER BY id"
+        rows = bench("DatabaseConnection.fetch_all", lambda: bench_db.fetch_all(query))
+        streamed = bench("DatabaseConnection.iter_rows", lambda: sum(1 for _ in bench_db.iter_rows(query)))
+        assert streamed == len(rows)
+        assert bench("DatabaseConnection.fetch_one",
+                     lambda: bench_db.fetch_one("SELECT * FROM participants WHERE id = %s", (1,)))
+
+    def test_read_from_primary(self, bench, bench_db):
+        #Benchmark a primary-pinned read (routing overhead without replicas)
+        def run():
+            with bench_db.read_from_primary():
+                return bench_db.fetch_one("SELECT * FROM participants WHERE id = %s", (1,))
+
+        assert bench("DatabaseConnection.read_from_primary", run)
+
+    def test_execute_query(self, bench, bench_db):
+        #Benchmark single committed write
+        assert bench("DatabaseConnection.execute_query",
+                     lambda: bench_db.execute_query(
+                         "UPDATE courses SET deskripsi = %s WHERE id = %s", ("Benchmark", 1)))
+
+    def test_execute_many(self, bench, bench_db):
+        #Benchmark 1000-row executemany in one commit
+        query = "UPDATE participants SET no_telp = %s WHERE id = %s"
+        params = [("0822222222", i) for i in range(1, 1001)]
+
+        assert bench("DatabaseConnection.execute_many[1000]",
+                     lambda: bench_db.execute_many(query, params))
+
+    def test_transaction(self, bench, bench_db):
+        #Benchmark 100 writes grouped in one transaction
+        def run():
+            with bench_db.transaction() as tx:
+                for i in range(1, 101):
+                    bench_db.execute_query("UPDATE courses SET instruktur = %s WHERE id = %s",
+                                           ("Benchmark", i))
+            return tx.committed
+
+        assert bench("DatabaseConnection.transaction[100]", run)
+
+    def test_transaction_group_commit(self, bench, bench_db):
+        #Benchmark 20 model writes committed one by one versus in one outer transaction
+        def rows(i):
+            return [(f"Grup {i}-{n}", f"grup{i}-{n}@skillhub.test", "", "") for n in range(20)]
+
+        def autocommit(batch):
+            model = Participant(bench_db)
+            return all(model.create(*row) for row in batch)
+
+        def grouped(batch):
+            model = Participant(bench_db)
+            with bench_db.transaction() as tx:
+                ok = all(model.create(*row) for row in batch)
+            return ok and tx.committed
+
+        assert bench("Participant.create[20 commits]", autocommit, setup=lambda i: (rows(f"a{i}"),))
+        assert bench("Participant.create[20, transaction]", grouped, setup=lambda i: (rows(f"t{i}"),))
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not MYSQL_BENCH_DB, reason="BENCH_MYSQL_DB tidak diatur")
+class TestPreparedStatementBench:
+    #Benchmark hot model queries with and without server-side prepared statements
+
+    @pytest.fixture(scope="class")
+    def mysql_db(self):
+        #Fixture for a migrated and seeded MySQL benchmark database
+        db = DatabaseConnection(os.getenv("DB_HOST", "localhost"), os.getenv("DB_USER", "root"),
+                                os.getenv("DB_PASSWORD", ""), MYSQL_BENCH_DB)
+        if not db.connect():
+            pytest.fail("Tidak bisa terhubung ke database benchmark MySQL")
+        assert SchemaMigrator(db).migrate()
+        generate(db, 'tiny')
+        yield db
+        db.disconnect()
+
+    def test_hot_queries(self, bench, mysql_db):
+        #Benchmark each hot query per call, plain cursor vs cached prepared statement
+        hot = {
+            'Participant.get_by_id': lambda: Participant(mysql_db).get_by_id(1),
+            'Course.get_by_id': lambda: Course(mysql_db).get_by_id(1),
+            'Enrollment.get_courses_by_participant': lambda: Enrollment(mysql_db).get_courses_by_participant(1),
+            'Enrollment.get_participants_by_course': lambda: Enrollment(mysql_db).get_participants_by_course(1),
+            # Pendaftaran yang sudah ada: jalur pengecekan duplikat (ditolak unique_enrollment)
+            'Enrollment.create[duplicate]': lambda: Enrollment(mysql_db).create(1, 1),
+        }
+        Enrollment(mysql_db).create(1, 1)
+        statements = mysql_db.statements
+
+        for name, run in hot.items():
+            # Tanpa cache statement, _run memakai cursor biasa
+            mysql_db.statements = None
+            bench(f"{name}[plain]", run, rounds=200)
+            mysql_db.statements = statements
+            run()
+            bench(f"{name}[prepared]", run, rounds=200)
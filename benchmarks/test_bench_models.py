@@ -0,0 +1,262 @@
+"""
+Benchmark method publik Participant, Course, Enrollment, dan TableVersion.
+"""
+
+import inspect
+import itertools
+import pytest
+from models.participant import Participant
+from models.course import Course
+from models.enrollment import Enrollment
+from models.queryCache import QueryCache
+from models.sharedCache import SharedCache
+from models.tableVersion import TableVersion
+
+pytestmark = pytest.mark.benchmark
+
+# Nomor unik untuk data yang dibuat oleh benchmark tulis
+_unique = itertools.count(1)
+
+
+def public_methods(cls) -> set:
+    #Helper: public methods defined on a model class
+    return {name for name, _ in inspect.getmembers(cls, inspect.isfunction)
+            if not name.startswith('_') and name in vars(cls)}
+
+
+def new_participant(db) -> int:
+    #Helper: create a participant outside the timed section and return its id
+    email = f"bench{next(_unique)}@skillhub.test"
+    assert Participant(db).create("Peserta Benchmark", email, "0800000000", "Jl. Uji")
+    return db.fetch_one("SELECT id FROM participants WHERE email = %s", (email,))['id']
+
+
+def new_course(db) -> int:
+    #Helper: create a course outside the timed section and return its id
+    nama = f"Kelas Benchmark {next(_unique)}"
+    assert Course(db).create(nama, "Deskripsi", "Instruktur")
+    return db.fetch_one("SELECT id FROM courses WHERE nama_kelas = %s", (nama,))['id']
+
+
+COVERED = {
+    Participant: {'create', 'bulk_create', 'get_all', 'iter_all', 'get_page', 'count',
+                  'get_labels', 'search', 'get_by_id', 'get_by_ids', 'update', 'delete',
+                  'delete_many'},
+    Course: {'create', 'get_all', 'iter_all', 'get_page', 'count', 'get_labels', 'search',
+             'search_available', 'get_by_id', 'get_by_ids', 'update', 'delete', 'delete_many'},
+    Enrollment: {'create', 'enroll_participants', 'enroll_courses',
+                 'get_courses_by_participant', 'get_participants_by_course',
+                 'get_participant_detail', 'get_course_detail', 'delete', 'delete_courses',
+                 'get_all_enrollments', 'iter_all_enrollments', 'get_enrollments_page',
+                 'count_enrollments'},
+    TableVersion: {'bump', 'get_versions', 'get_stamps'},
+}
+
+
+class TestCoverage:
+    #Test every public model method has a benchmark
+
+    @pytest.mark.parametrize("cls", list(COVERED), ids=lambda cls: cls.__name__)
+    def test_every_public_method_is_benchmarked(self, cls):
+        #Test new public methods are added to the benchmark suite
+        assert public_methods(cls) == COVERED[cls]
+
+
+class TestParticipantBench:
+    #Benchmark Participant
+
+    @pytest.fixture
+    def model(self, bench_db):
+        #fixture For Participant without cache so every call hits the database
+        return Participant(bench_db)
+
+    def test_reads(self, bench, model):
+        #Benchmark read methods
+        assert bench("Participant.get_all", model.get_all)
+        bench("Participant.iter_all", lambda: sum(1 for _ in model.iter_all()))
+        bench("Participant.get_page", lambda: model.get_page(after_id=1000, limit=51))
+        assert bench("Participant.count", model.count) > 0
+        bench("Participant.get_page[id,nama]", lambda: model.get_page(after_id=1000, limit=51,
+                                                                     columns=('id', 'nama')))
+        assert bench("Participant.get_labels", model.get_labels)
+        assert bench("Participant.get_by_id", lambda: model.get_by_id(1))
+        assert bench("Participant.get_by_ids[1000]", lambda: model.get_by_ids(range(1, 1001)))
+        bench("Participant.search[prefix]", lambda: model.search("Budi"))
+        bench("Participant.search[word]", lambda: model.search("Santoso"))
+
+    def test_create(self, bench, model):
+        #Benchmark single insert with counters
+        assert bench("Participant.create", model.create,
+                     setup=lambda i: ("Peserta Benchmark", f"bench{next(_unique)}@skillhub.test",
+                                      "0800000000", "Jl. Uji"))
+
+    def test_bulk_create(self, bench, model):
+        #Benchmark CSV-style import of 500 rows
+        def rows(i):
+            return ([{'nama': "Peserta Import", 'email': f"bench{next(_unique)}@skillhub.test",
+                      'no_telp': "0800000000", 'alamat': "Jl. Uji"} for _ in range(500)],)
+
+        summary = bench("Participant.bulk_create[500]", model.bulk_create, setup=rows)
+        assert summary['inserted'] == 500
+
+    def test_update(self, bench, model):
+        #Benchmark update by primary key
+        assert bench("Participant.update", model.update,
+                     setup=lambda i: (2, "Peserta Diubah", f"bench{next(_unique)}@skillhub.test",
+                                      "0811111111", "Jl. Ubah"))
+
+    def test_delete(self, bench, bench_db, model):
+        #Benchmark delete with enrollments and counters
+        def setup(i):
+            participant_id = new_participant(bench_db)
+            Enrollment(bench_db).enroll_courses(participant_id, [1, 2, 3])
+            return (participant_id,)
+
+        assert bench("Participant.delete", model.delete, setup=setup)
+
+    def test_delete_many(self, bench, bench_db, model):
+        #Benchmark bulk delete of 20 enrolled participants
+        def setup(i):
+            participant_ids = [new_participant(bench_db) for _ in range(20)]
+            Enrollment(bench_db).enroll_participants(1, participant_ids)
+            return (participant_ids,)
+
+        assert bench("Participant.delete_many[20]", model.delete_many, setup=setup)['deleted'] == 20
+
+
+class TestCourseBench:
+    #Benchmark Course
+
+    @pytest.fixture
+    def model(self, bench_db):
+        #fixture For Course without cache
+        return Course(bench_db)
+
+    def test_reads(self, bench, model):
+        #Benchmark read methods
+        assert bench("Course.get_all", model.get_all)
+        bench("Course.iter_all", lambda: sum(1 for _ in model.iter_all()))
+        bench("Course.get_page", lambda: model.get_page(after_id=10, limit=51))
+        assert bench("Course.count", model.count) > 0
+        assert bench("Course.get_labels", model.get_labels)
+        assert bench("Course.get_by_id", lambda: model.get_by_id(1))
+        assert bench("Course.get_by_ids[50]", lambda: model.get_by_ids(range(1, 51)))
+        bench("Course.search[prefix]", lambda: model.search("Python"))
+        bench("Course.search_available", lambda: model.search_available(1))
+        bench("Course.search_available[prefix]", lambda: model.search_available(1, "Python"))
+
+    def test_get_all_shared_cache(self, bench, bench_db):
+        #Benchmark a new rerun reading the course list from the cross-session cache
+        shared = SharedCache()
+        Course(bench_db, QueryCache(shared)).get_all()
+
+        assert bench("Course.get_all[shared]", lambda: Course(bench_db, QueryCache(shared)).get_all())
+        assert shared.hits >= 1
+
+    def test_create(self, bench, model):
+        #Benchmark single insert with counters
+        assert bench("Course.create", model.create,
+                     setup=lambda i: (f"Kelas Benchmark {next(_unique)}", "Deskripsi", "Instruktur"))
+
+    def test_update(self, bench, model):
+        #Benchmark update by primary key
+        assert bench("Course.update", model.update,
+                     setup=lambda i: (2, f"Kelas Diubah {i}", "Deskripsi", "Instruktur"))
+
+    def test_delete(self, bench, bench_db, model):
+        #Benchmark delete with enrollments and counters
+        def setup(i):
+            course_id = new_course(bench_db)
+            Enrollment(bench_db).enroll_participants(course_id, list(range(1, 51)))
+            return (course_id,)
+
+        assert bench("Course.delete", model.delete, setup=setup)
+
+    def test_delete_many(self, bench, bench_db, model):
+        #Benchmark bulk delete of 5 courses
+        def setup(i):
+            course_ids = [new_course(bench_db) for _ in range(5)]
+            Enrollment(bench_db).enroll_courses(1, course_ids)
+            return (course_ids,)
+
+        assert bench("Course.delete_many[5]", model.delete_many, setup=setup)['deleted'] == 5
+
+
+class TestEnrollmentBench:
+    #Benchmark Enrollment
+
+    @pytest.fixture
+    def model(self, bench_db):
+        #fixture For Enrollment without cache
+        return Enrollment(bench_db)
+
+    def test_reads(self, bench, model):
+        #Benchmark read methods
+        assert bench("Enrollment.get_all_enrollments", model.get_all_enrollments)
+        bench("Enrollment.iter_all_enrollments", lambda: sum(1 for _ in model.iter_all_enrollments()))
+        first_page = model.get_enrollments_page(limit=50)
+        cursor = (first_page[-1]['tanggal_daftar'], first_page[-1]['id'])
+        assert bench("Enrollment.get_enrollments_page", lambda: model.get_enrollments_page(after=cursor, limit=51))
+        assert bench("Enrollment.count_enrollments", model.count_enrollments) > 0
+        bench("Enrollment.get_courses_by_participant", lambda: model.get_courses_by_participant(1))
+        assert bench("Enrollment.get_participants_by_course", lambda: model.get_participants_by_course(1))
+        assert bench("Enrollment.get_participant_detail", lambda: model.get_participant_detail(1))
+        assert bench("Enrollment.get_course_detail", lambda: model.get_course_detail(1))
+
+    def test_create(self, bench, bench_db, model):
+        #Benchmark single enrollment with counters
+        bench("Enrollment.create", model.create,
+              setup=lambda i: (new_participant(bench_db), 1))
+
+    def test_enroll_participants(self, bench, bench_db, model):
+        #Benchmark enrolling 100 new participants into one course
+        def setup(i):
+            return (1, [new_participant(bench_db) for _ in range(100)])
+
+        assert bench("Enrollment.enroll_participants[100]", model.enroll_participants,
+                     setup=setup)['inserted'] == 100
+
+    def test_enroll_courses(self, bench, bench_db, model):
+        #Benchmark enrolling one new participant into 10 courses
+        assert bench("Enrollment.enroll_courses[10]", model.enroll_courses,
+                     setup=lambda i: (new_participant(bench_db), list(range(1, 11))))['inserted'] == 10
+
+    def test_delete(self, bench, bench_db, model):
+        #Benchmark delete with counters
+        def setup(i):
+            participant_id = new_participant(bench_db)
+            model.create(participant_id, 1)
+            return (participant_id, 1)
+
+        assert bench("Enrollment.delete", model.delete, setup=setup)
+
+    def test_delete_courses(self, bench, bench_db, model):
+        #Benchmark removing one participant from 10 courses
+        def setup(i):
+            participant_id = new_participant(bench_db)
+            model.enroll_courses(participant_id, list(range(1, 11)))
+            return (participant_id, list(range(1, 11)))
+
+        assert bench("Enrollment.delete_courses[10]", model.delete_courses, setup=setup)['deleted'] == 10
+
+
+
+class TestTableVersionBench:
+    #Benchmark TableVersion
+
+    @pytest.fixture
+    def model(self, bench_db):
+        #fixture For TableVersion without cache
+        return TableVersion(bench_db)
+
+    def test_get_versions(self, bench, model):
+        #Benchmark the per-rerun version check
+        assert bench("TableVersion.get_versions", model.get_versions)
+
+    def test_get_stamps(self, bench, model):
+        #Benchmark the validator lookup done before every API GET
+        assert bench("TableVersion.get_stamps", model.get_stamps)
+
+    def test_bump(self, bench, model):
+        #Benchmark the version bump done by every write
+        assert bench("TableVersion.bump", lambda: model.bump(TableVersion.COURSES))
@@ -0,0 +1,57 @@
+"""
+Benchmark render penuh setiap halaman show_* SkillHubApp dengan AppTest.
+"""
+
+import inspect
+import pytest
+from streamlit.testing.v1 import AppTest
+from app import SkillHubApp
+
+pytestmark = pytest.mark.benchmark
+
+PAGES = ['show_dashboard', 'show_participant_management', 'show_course_management',
+         'show_enrollment_management', 'show_query_stats']
+
+
+def render_page():
+    #Script: one rerun of a single page against the benchmark database
+    import os
+    from app import SkillHubApp
+    from models.queryCache import QueryCache
+    from sqliteConnection import SQLiteConnection
+
+    app = SkillHubApp.__new__(SkillHubApp)
+    app.db = SQLiteConnection(os.environ["SKILLHUB_BENCH_DB"])
+    app.query_cache = QueryCache()
+    try:
+        getattr(app, os.environ["SKILLHUB_BENCH_PAGE"])()
+    finally:
+        app.db.disconnect()
+
+
+class TestCoverage:
+    #Test every page without arguments has a benchmark
+
+    def test_every_page_is_benchmarked(self):
+        #Test new show_* pages are added to the benchmark suite
+        pages = {name for name, fn in inspect.getmembers(SkillHubApp, inspect.isfunction)
+                 if name.startswith('show_') and len(inspect.signature(fn).parameters) == 1}
+
+        assert pages == set(PAGES)
+
+
+class TestPageRenderBench:
+    #Benchmark page renders
+
+    @pytest.mark.parametrize("page", PAGES)
+    def test_render(self, bench, bench_db_path, monkeypatch, page):
+        #Benchmark one full rerun of the page
+        monkeypatch.setenv("SKILLHUB_BENCH_DB", bench_db_path)
+        monkeypatch.setenv("SKILLHUB_BENCH_PAGE", page)
+
+        def render():
+            at = AppTest.from_function(render_page, default_timeout=120)
+            return at.run()
+
+        at = bench(f"SkillHubApp.{page}", render)
+        assert not at.exception
@@ -0,0 +1,120 @@
+# ==================== CIRCUIT BREAKER CLASS ====================
+
+import threading
+import time
+from typing import Dict
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker untuk satu database. Setelah failure_threshold kegagalan
+    koneksi berturut-turut, permintaan langsung ditolak (fail fast) selama
+    reset_timeout detik, lalu satu permintaan percobaan diizinkan: jika
+    berhasil circuit tertutup kembali, jika gagal terbuka lagi.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Inisialisasi circuit breaker dalam keadaan tertutup.
+
+        Args:
+            failure_threshold: Jumlah kegagalan berturut-turut sebelum circuit terbuka
+            reset_timeout: Lama (detik) circuit terbuka sebelum percobaan berikutnya
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold minimal 1")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._rejected = 0
+
+    @property
+    def state(self) -> str:
+        """Keadaan circuit saat ini (CLOSED, OPEN, atau HALF_OPEN)."""
+        return self._state
+
+    def allow(self) -> bool:
+        """
+        Menentukan apakah permintaan boleh mencoba menghubungi database.
+
+        Returns:
+            bool: True jika boleh, False jika circuit terbuka (fail fast)
+        """
+        # Jalur cepat tanpa lock untuk keadaan normal
+        if self._state == self.CLOSED:
+            return True
+
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            # Satu percobaan per reset_timeout, juga jika percobaan sebelumnya tidak melapor
+            if time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._state = self.HALF_OPEN
+                self._opened_at = time.monotonic()
+                return True
+            self._rejected += 1
+            return False
+
+    def record_success(self):
+        """Mencatat operasi yang berhasil dan menutup circuit."""
+        if self._state == self.CLOSED and not self._failures:
+            return
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+
+    def record_failure(self):
+        """Mencatat kegagalan koneksi; membuka circuit jika batasnya tercapai."""
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def stats(self) -> Dict[str, object]:
+        """
+        Mengambil statistik circuit breaker.
+
+        Returns:
+            Dict[str, object]: Keadaan, jumlah kegagalan berturut-turut, dan permintaan yang ditolak
+        """
+        with self._lock:
+            return {
+                'state': self._state,
+                'failures': self._failures,
+                'rejected': self._rejected,
+            }
+
+
+# ==================== SHARED BREAKER REGISTRY ====================
+
+_shared_breakers: Dict[tuple, CircuitBreaker] = {}
+_shared_lock = threading.Lock()
+
+
+def get_circuit_breaker(key: tuple, **options) -> CircuitBreaker:
+    """
+    Mengambil circuit breaker yang dipakai bersama dalam satu proses, dibuat sekali per key,
+    sehingga semua sesi berhenti mencoba bersamaan saat database mati.
+
+    Args:
+        key: Identitas database (misalnya kombinasi host dan database)
+        **options: Parameter CircuitBreaker (failure_threshold, reset_timeout)
+
+    Returns:
+        CircuitBreaker: Circuit breaker bersama untuk key tersebut
+    """
+    with _shared_lock:
+        breaker = _shared_breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(**options)
+            _shared_breakers[key] = breaker
+        return breaker
@@ -0,0 +1,72 @@
+"""
+Perintah pemeliharaan SkillHub dari command line.
+
+Contoh:
+    python commands.py reconcile-counters
+    python commands.py export enrollments --format csv --output pendaftaran.csv
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+import dataExport
+from databaseConnection import DatabaseConnection
+from models.statCounter import StatCounter
+
+
+def reconcile_counters(db: DatabaseConnection, args: argparse.Namespace) -> int:
+    """Menghitung ulang tabel stat_counters dari data sebenarnya."""
+    counters = StatCounter(db)
+    if not counters.reconcile():
+        print("Gagal menghitung ulang stat_counters.")
+        return 1
+
+    totals = counters.get_totals()
+    print(f"stat_counters diperbarui: peserta={totals['participants']}, "
+          f"kelas={totals['courses']}, pendaftaran={totals['enrollments']}")
+    return 0
+
+
+def export_data(db: DatabaseConnection, args: argparse.Namespace) -> int:
+    """Mengekspor dataset ke CSV/JSON Lines secara streaming."""
+    if args.output == "-":
+        count = dataExport.export(db, args.dataset, args.format, sys.stdout)
+    else:
+        with open(args.output, "w", encoding="utf-8", newline="") as out:
+            count = dataExport.export(db, args.dataset, args.format, out)
+
+    print(f"{count} baris {args.dataset} diekspor.", file=sys.stderr)
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point command line."""
+    parser = argparse.ArgumentParser(description="Perintah pemeliharaan SkillHub")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    reconcile = subparsers.add_parser("reconcile-counters",
+                                      help="Hitung ulang stat_counters dari tabel sumber")
+    reconcile.set_defaults(handler=reconcile_counters)
+
+    export = subparsers.add_parser("export", help="Ekspor data ke CSV atau JSON Lines")
+    export.add_argument("dataset", choices=sorted(dataExport.DATASETS))
+    export.add_argument("--format", choices=dataExport.FORMATS, default="csv")
+    export.add_argument("--output", default="-", help="File tujuan (default: stdout)")
+    export.set_defaults(handler=export_data)
+
+    args = parser.parse_args(argv)
+
+    db = DatabaseConnection.from_env()
+    if db.connection is None:
+        print("Gagal terhubung ke database. Periksa konfigurasi database.")
+        return 1
+
+    try:
+        return args.handler(db, args)
+    finally:
+        db.disconnect()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
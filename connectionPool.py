@@ -0,0 +1,196 @@
+# ==================== CONNECTION POOL CLASS ====================
+
+import threading
+import time
+from typing import Callable, Dict, List, Tuple, Any
+
+
+class PoolTimeoutError(Exception):
+    """Dilempar jika tidak ada koneksi yang tersedia dalam batas waktu checkout."""
+
+
+class ConnectionPool:
+    """
+    Pool koneksi database yang dibatasi ukurannya dan aman dipakai antar thread.
+    Koneksi dibuat secara malas (lazy) melalui connect_fn, dipinjam dengan
+    acquire() dan dikembalikan dengan release().
+    """
+
+    def __init__(self, connect_fn: Callable[[], Any], max_size: int = 5,
+                 timeout: float = 10.0, idle_timeout: float = 300.0):
+        """
+        Inisialisasi pool koneksi.
+
+        Args:
+            connect_fn: Fungsi tanpa argumen yang membuat koneksi baru
+            max_size: Jumlah maksimum koneksi yang boleh dibuka
+            timeout: Batas waktu (detik) menunggu koneksi saat pool penuh
+            idle_timeout: Koneksi yang menganggur lebih lama dari ini (detik) akan diganti
+        """
+        if max_size < 1:
+            raise ValueError("max_size minimal 1")
+        self.connect_fn = connect_fn
+        self.max_size = max_size
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+
+        self._cond = threading.Condition()
+        self._idle: List[Tuple[Any, float]] = []
+        self._total = 0
+        self._in_use = 0
+        self._created = 0
+        self._recycled = 0
+        self._waits = 0
+        self._timeouts = 0
+
+    def acquire(self, timeout: float = None) -> Any:
+        """
+        Meminjam satu koneksi dari pool.
+
+        Args:
+            timeout: Batas waktu menunggu (optional, default dari pool)
+
+        Returns:
+            Any: Objek koneksi database
+
+        Raises:
+            PoolTimeoutError: Jika pool penuh sampai batas waktu habis
+        """
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        expired = []
+        waited = False
+
+        try:
+            with self._cond:
+                while True:
+                    now = time.monotonic()
+
+                    # Ambil koneksi idle terbaru, buang yang sudah terlalu lama menganggur
+                    while self._idle:
+                        conn, last_used = self._idle.pop()
+                        if now - last_used > self.idle_timeout:
+                            expired.append(conn)
+                            self._total -= 1
+                            self._recycled += 1
+                            continue
+                        self._in_use += 1
+                        return conn
+
+                    if self._total < self.max_size:
+                        self._total += 1
+                        self._in_use += 1
+                        break
+
+                    if not waited:
+                        self._waits += 1
+                        waited = True
+
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        raise PoolTimeoutError(
+                            f"Tidak ada koneksi tersedia dalam {timeout} detik "
+                            f"(pool penuh: {self.max_size})"
+                        )
+                    self._cond.wait(remaining)
+        finally:
+            for conn in expired:
+                self._close(conn)
+
+        # Buat koneksi baru di luar lock agar peminjam lain tidak ikut menunggu
+        try:
+            conn = self.connect_fn()
+        except BaseException:
+            with self._cond:
+                self._total -= 1
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+
+        with self._cond:
+            self._created += 1
+        return conn
+
+    def release(self, conn: Any, discard: bool = False):
+        """
+        Mengembalikan koneksi ke pool.
+
+        Args:
+            conn: Koneksi yang sebelumnya dipinjam dengan acquire()
+            discard: True jika koneksi rusak dan harus ditutup, bukan dipakai ulang
+        """
+        with self._cond:
+            self._in_use -= 1
+            if discard:
+                self._total -= 1
+            else:
+                self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+        if discard:
+            self._close(conn)
+
+    def close_all(self):
+        """Menutup semua koneksi yang sedang idle."""
+        with self._cond:
+            idle = [conn for conn, _ in self._idle]
+            self._total -= len(idle)
+            self._idle = []
+            self._cond.notify_all()
+
+        for conn in idle:
+            self._close(conn)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Mengambil statistik pemakaian pool.
+
+        Returns:
+            Dict[str, int]: Ukuran pool, koneksi dipakai, idle, jumlah menunggu, dll.
+        """
+        with self._cond:
+            return {
+                'max_size': self.max_size,
+                'total': self._total,
+                'in_use': self._in_use,
+                'idle': len(self._idle),
+                'created': self._created,
+                'recycled': self._recycled,
+                'waits': self._waits,
+                'timeouts': self._timeouts,
+            }
+
+    @staticmethod
+    def _close(conn: Any):
+        """Menutup koneksi tanpa melempar error."""
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+# ==================== SHARED POOL REGISTRY ====================
+
+_shared_pools: Dict[tuple, ConnectionPool] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_pool(key: tuple, connect_fn: Callable[[], Any], **options) -> ConnectionPool:
+    """
+    Mengambil pool yang dipakai bersama dalam satu proses, dibuat sekali per key.
+
+    Args:
+        key: Identitas pool (misalnya kombinasi host, user, database)
+        connect_fn: Fungsi pembuat koneksi baru
+        **options: Parameter ConnectionPool (max_size, timeout, idle_timeout)
+
+    Returns:
+        ConnectionPool: Pool bersama untuk key tersebut
+    """
+    with _shared_lock:
+        pool = _shared_pools.get(key)
+        if pool is None:
+            pool = ConnectionPool(connect_fn, **options)
+            _shared_pools[key] = pool
+        return pool
@@ -0,0 +1,142 @@
+"""
+Ekspor data SkillHub ke CSV atau JSON Lines secara streaming (memori konstan).
+"""
+
+import csv
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Callable, Dict, Iterable, Iterator, Optional, Sequence, TextIO, Tuple
+
+from databaseConnection import DatabaseConnection
+from models.participant import Participant
+from models.course import Course
+from models.enrollment import Enrollment
+
+
+# Sumber data yang bisa diekspor, masing-masing berupa iterator baris
+DATASETS: Dict[str, Callable[[DatabaseConnection], Iterator[Dict]]] = {
+    'participants': lambda db: Participant(db).iter_all(),
+    'courses': lambda db: Course(db).iter_all(),
+    'enrollments': lambda db: Enrollment(db).iter_all_enrollments(),
+}
+
+# Kolom setiap dataset, untuk header CSV walaupun datanya kosong
+COLUMNS: Dict[str, Tuple[str, ...]] = {
+    'participants': Participant.COLUMNS,
+    'courses': Course.COLUMNS,
+    'enrollments': ('id', 'participant_id', 'nama_peserta', 'course_id', 'nama_kelas', 'tanggal_daftar'),
+}
+
+FORMATS = ('csv', 'jsonl')
+
+
+class ExportTooLargeError(Exception):
+    """Hasil ekspor melebihi batas ukuran yang diizinkan."""
+
+
+class _LimitedWriter:
+    """Pembungkus file teks yang menghentikan ekspor setelah max_bytes (UTF-8)."""
+
+    def __init__(self, out: TextIO, max_bytes: int):
+        self.out = out
+        self.max_bytes = max_bytes
+        self.written = 0
+
+    def write(self, text: str) -> int:
+        self.written += len(text.encode("utf-8"))
+        if self.written > self.max_bytes:
+            raise ExportTooLargeError(f"Hasil ekspor melebihi {self.max_bytes} byte")
+        return self.out.write(text)
+
+
+def json_default(value):
+    """Konversi tipe yang tidak didukung json (tanggal, Decimal)."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Tipe {type(value).__name__} tidak bisa diubah ke JSON")
+
+
+def write_csv(rows: Iterable[Dict], out: TextIO,
+              fieldnames: Optional[Sequence[str]] = None) -> int:
+    """
+    Menulis baris ke CSV. Header ditulis dari fieldnames, juga jika tidak ada
+    baris; tanpa fieldnames header diambil dari kolom baris pertama.
+
+    Args:
+        rows: Iterable baris (dict)
+        out: File teks tujuan
+        fieldnames: Kolom CSV (optional)
+
+    Returns:
+        int: Jumlah baris yang ditulis (tanpa header)
+    """
+    writer = None
+    if fieldnames is not None:
+        writer = csv.DictWriter(out, fieldnames=list(fieldnames))
+        writer.writeheader()
+    count = 0
+    for row in rows:
+        if writer is None:
+            writer = csv.DictWriter(out, fieldnames=list(row.keys()))
+            writer.writeheader()
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def write_jsonl(rows: Iterable[Dict], out: TextIO) -> int:
+    """
+    Menulis baris ke JSON Lines (satu objek JSON per baris).
+
+    Args:
+        rows: Iterable baris (dict)
+        out: File teks tujuan
+
+    Returns:
+        int: Jumlah baris yang ditulis
+    """
+    count = 0
+    for row in rows:
+        out.write(json.dumps(row, default=json_default, ensure_ascii=False))
+        out.write("\n")
+        count += 1
+    return count
+
+
+def export(db: DatabaseConnection, dataset: str, fmt: str, out: TextIO,
+           max_bytes: Optional[int] = None) -> int:
+    """
+    Mengekspor satu dataset ke file dalam format tertentu.
+
+    Args:
+        db: Instance DatabaseConnection
+        dataset: Nama dataset (participants, courses, enrollments)
+        fmt: Format keluaran (csv, jsonl)
+        out: File teks tujuan
+        max_bytes: Batas ukuran hasil ekspor (optional, default tanpa batas)
+
+    Returns:
+        int: Jumlah baris yang diekspor
+
+    Raises:
+        ExportTooLargeError: Jika hasil ekspor melebihi max_bytes
+    """
+    if dataset not in DATASETS:
+        raise ValueError(f"Dataset tidak dikenal: {dataset}")
+    if fmt not in FORMATS:
+        raise ValueError(f"Format tidak dikenal: {fmt}")
+
+    if max_bytes is not None:
+        out = _LimitedWriter(out, max_bytes)
+    rows = DATASETS[dataset](db)
+    try:
+        if fmt == 'csv':
+            return write_csv(rows, out, COLUMNS[dataset])
+        return write_jsonl(rows, out)
+    finally:
+        # Ekspor yang dihentikan di tengah tetap menutup cursor streaming
+        if hasattr(rows, 'close'):
+            rows.close()
@@ -1,8 +1,64 @@
 # ==================== DATABASE CONNECTION CLASS ====================
 
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, List, Dict, Optional, Iterator, Sequence
+
 import mysql.connector
-from mysql.connector import Error
-from typing import List, Dict, Optional
+from mysql.connector import Error, InterfaceError, OperationalError
+
+from circuitBreaker import CircuitBreaker, get_circuit_breaker
+from connectionPool import ConnectionPool, PoolTimeoutError, get_shared_pool
+from queryMonitor import QueryMonitor, get_default_monitor
+from statementCache import StatementCache, statement_cache_for
+
+# Kode error MySQL yang ditangani oleh model
+ER_DUP_ENTRY = 1062
+ER_NO_REFERENCED_ROW = 1452
+ER_ROW_IS_REFERENCED = 1451
+ER_LOCK_WAIT_TIMEOUT = 1205
+
+# Kode error MySQL untuk query yang dibatalkan server karena batas waktu
+# (ER_LOCK_WAIT_TIMEOUT, ER_QUERY_INTERRUPTED, ER_QUERY_TIMEOUT)
+TIMEOUT_ERRORS = {ER_LOCK_WAIT_TIMEOUT, 1317, 3024}
+
+# Kode error client MySQL yang berarti koneksi ke server terputus atau tidak
+# dapat dibuat (CR_CONNECTION_ERROR, CR_CONN_HOST_ERROR, CR_SERVER_GONE_ERROR,
+# CR_SERVER_LOST, CR_SERVER_LOST_EXTENDED, ER_CLIENT_INTERACTION_TIMEOUT)
+CONNECTION_ERRORS = {2002, 2003, 2006, 2013, 2055, 4031}
+
+
+class DatabaseUnavailableError(Exception):
+    """Database tidak dapat dihubungi, juga setelah dicoba ulang."""
+
+
+class CircuitOpenError(DatabaseUnavailableError):
+    """Permintaan ditolak tanpa mencoba karena circuit breaker sedang terbuka."""
+
+
+class QueryTimeoutError(Exception):
+    """Query baca dibatalkan server karena melewati batas waktu eksekusi atau lock wait."""
+
+
+class Transaction:
+    """
+    Status satu blok transaksi yang dibuka dengan DatabaseConnection.transaction().
+    """
+
+    def __init__(self, parent: Optional["Transaction"] = None):
+        """
+        Inisialisasi status transaksi.
+
+        Args:
+            parent: Transaksi luar jika blok ini bersarang (optional)
+        """
+        self.parent = parent
+        self.depth = parent.depth + 1 if parent is not None else 0
+        # Nama savepoint blok bersarang (None untuk transaksi terluar)
+        self.savepoint: Optional[str] = None
+        self.failed = False
+        self.committed = False
 
 
 class DatabaseConnection:
@@ -10,8 +66,24 @@ class DatabaseConnection:
     Kelas untuk mengelola koneksi database MySQL.
     Mengimplementasikan context manager untuk koneksi yang aman.
     """
+
+    # Dialek SQL backend, dipakai migrasi skema untuk memilih DDL
+    dialect = 'mysql'
+
+    # Koneksi yang idle lebih lama dari ini (detik) di-ping sebelum dipakai
+    PING_INTERVAL = 30.0
+    # Percobaan untuk query yang gagal karena koneksi terputus, dengan jeda
+    # RETRY_BACKOFF, 2x, 4x, ... dibatasi RETRY_MAX_DELAY (detik)
+    RETRY_ATTEMPTS = 3
+    RETRY_BACKOFF = 0.2
+    RETRY_MAX_DELAY = 2.0
     
-    def __init__(self, host: str, user: str, password: str, database: str):
+    def __init__(self, host: str, user: str, password: str, database: str,
+                 pool: Optional[ConnectionPool] = None,
+                 monitor: Optional[QueryMonitor] = None,
+                 replicas: Optional[List["DatabaseConnection"]] = None,
+                 read_your_writes: float = 5.0,
+                 breaker: Optional[CircuitBreaker] = None):
         """
         Inisialisasi parameter koneksi database.
         
@@ -20,22 +92,145 @@ class DatabaseConnection:
             user: Username database
             password: Password database
             database: Nama database
+            pool: Pool koneksi untuk mode pooled (optional)
+            monitor: Pencatat waktu query (optional, default monitor bersama per proses)
+            replicas: Koneksi replika untuk fetch_all/fetch_one/iter_rows (optional)
+            read_your_writes: Lama (detik) pembacaan tetap ke primary setelah menulis
+            breaker: Circuit breaker (optional, default bersama per host dan database)
         """
         self.host = host
         self.user = user
         self.password = password
         self.database = database
+        self.pool = pool
+        self.monitor = monitor if monitor is not None else get_default_monitor()
         self.connection = None
         self.cursor = None
-        self.connect()
+        # Prepared statement milik koneksi fisik saat ini (lihat statementCache)
+        self.statements: Optional[StatementCache] = None
+        self.rowcount = 0
+        self.last_error: Optional[Error] = None
+        self._transaction: Optional[Transaction] = None
+        self.replicas = list(replicas or [])
+        self.read_your_writes = read_your_writes
+        # Waktu (time.monotonic) tulis terakhir sesi ini; disimpan app di session_state
+        self.last_write: Optional[float] = None
+        self._primary_reads = 0
+        self._next_replica = 0
+        self.breaker = breaker if breaker is not None else get_circuit_breaker((host, database))
+        self._last_used = time.monotonic()
+        try:
+            self.connect()
+        except CircuitOpenError as e:
+            # Query berikutnya juga langsung ditolak lewat _ensure_connection
+            pass
+
+    @classmethod
+    def from_env(cls) -> "DatabaseConnection":
+        """
+        Membuat koneksi dari environment variable DB_HOST, DB_USER, DB_PASSWORD, DB_NAME.
+        Jika DB_BACKEND=sqlite, membuka file SQLite di DB_SQLITE_PATH.
+        
+        Returns:
+            DatabaseConnection: Instance koneksi (tanpa pool)
+        """
+        if os.getenv("DB_BACKEND", "mysql") == "sqlite":
+            from sqliteConnection import SQLiteConnection
+            return SQLiteConnection(os.getenv("DB_SQLITE_PATH", "skillhub.db"))
+        return cls(
+            host=os.getenv("DB_HOST", "localhost"),
+            user=os.getenv("DB_USER", "root"),
+            password=os.getenv("DB_PASSWORD", ""),
+            database=os.getenv("DB_NAME", "skillhub_db")
+        )
+
+    @classmethod
+    def pooled(cls, host: str, user: str, password: str, database: str,
+               pool_size: int = 5, pool_timeout: float = 10.0,
+               pool_recycle: float = 300.0, replica_hosts: Sequence[str] = (),
+               read_your_writes: float = 5.0) -> "DatabaseConnection":
+        """
+        Membuat koneksi yang meminjam dari pool bersama (satu pool per proses).
+        
+        Args:
+            host: Host database MySQL
+            user: Username database
+            password: Password database
+            database: Nama database
+            pool_size: Jumlah maksimum koneksi di pool
+            pool_timeout: Batas waktu (detik) menunggu koneksi dari pool
+            pool_recycle: Koneksi idle lebih lama dari ini (detik) dibuat ulang
+            replica_hosts: Host replika baca, masing-masing dengan pool sendiri (optional)
+            read_your_writes: Lama (detik) pembacaan tetap ke primary setelah menulis
+            
+        Returns:
+            DatabaseConnection: Instance yang sudah meminjam koneksi dari pool
+        """
+        def connect_fn():
+            return mysql.connector.connect(
+                host=host,
+                user=user,
+                password=password,
+                database=database
+            )
+
+        pool = get_shared_pool(
+            (host, user, password, database),
+            connect_fn,
+            max_size=pool_size,
+            timeout=pool_timeout,
+            idle_timeout=pool_recycle
+        )
+        replicas = [
+            cls.pooled(replica_host, user, password, database, pool_size=pool_size,
+                       pool_timeout=pool_timeout, pool_recycle=pool_recycle)
+            for replica_host in replica_hosts
+        ]
+        return cls(host, user, password, database, pool=pool, replicas=replicas,
+                   read_your_writes=read_your_writes)
     
     def connect(self) -> bool:
         """
-        Membuat koneksi ke database MySQL.
+        Membuat koneksi ke database MySQL, atau meminjam dari pool jika mode pooled.
+        Selama circuit breaker terbuka, koneksi tidak dicoba sama sekali.
         
         Returns:
             bool: True jika koneksi berhasil, False jika gagal
+            
+        Raises:
+            CircuitOpenError: Jika circuit breaker sedang terbuka
+        """
+        # Koneksi pooled hanya dipinjam sekali sampai disconnect()
+        if self.pool is not None and self.connection is not None:
+            return True
+        if not self.breaker.allow():
+            raise CircuitOpenError(f"Database {self.database} sedang tidak tersedia")
+        return self._open()
+
+    def _open(self) -> bool:
         """
+        Membuka koneksi fisik (atau meminjam dari pool) dan mencatat hasilnya
+        ke circuit breaker. Pool yang penuh tidak dihitung sebagai kegagalan server.
+        
+        Returns:
+            bool: True jika koneksi berhasil, False jika gagal
+        """
+        if self.pool is not None:
+            try:
+                self.connection = self.pool.acquire()
+                self.cursor = self.connection.cursor(dictionary=True)
+                self.statements = statement_cache_for(self.connection)
+                self.breaker.record_success()
+                return True
+            except PoolTimeoutError as e:
+                return False
+            except Error as e:
+                self.breaker.record_failure()
+                if self.connection is not None:
+                    self.pool.release(self.connection, discard=True)
+                    self.connection = None
+                return False
+
         try:
             self.connection = mysql.connector.connect(
                 host=self.host,
@@ -45,66 +240,577 @@ class DatabaseConnection:
             )
             if self.connection.is_connected():
                 self.cursor = self.connection.cursor(dictionary=True)
+                self.statements = statement_cache_for(self.connection)
+                self.breaker.record_success()
                 return True
         except Error as e:
-            return False
+            self.connection = None
+        self.breaker.record_failure()
+        return False
     
     def disconnect(self):
-        """Menutup koneksi database."""
+        """Menutup koneksi database, atau mengembalikannya ke pool jika mode pooled."""
+        for replica in self.replicas:
+            replica.disconnect()
+
         if self.cursor:
             self.cursor.close()
+            self.cursor = None
+        # Statement tetap disiapkan di koneksi pooled untuk peminjam berikutnya
+        self.statements = None
+
+        if self.pool is not None:
+            if self.connection is not None:
+                discard = False
+                try:
+                    # Akhiri transaksi/snapshot baca agar peminjam berikutnya melihat data terbaru
+                    self.connection.rollback()
+                except Error:
+                    discard = True
+                self.pool.release(self.connection, discard=discard)
+                self.connection = None
+            return
+
         if self.connection and self.connection.is_connected():
             self.connection.close()
+        self.connection = None
+
+    def pool_stats(self) -> Optional[Dict[str, int]]:
+        """
+        Mengambil statistik pool koneksi.
+        
+        Returns:
+            Optional[Dict[str, int]]: Statistik pool atau None jika tidak memakai pool
+        """
+        if self.pool is None:
+            return None
+        return self.pool.stats()
+
+    @contextmanager
+    def read_from_primary(self) -> Iterator[None]:
+        """
+        Memaksa semua pembacaan di dalam blok ini ke primary, untuk
+        pembacaan yang tidak boleh tertinggal dari replika (misalnya migrasi).
+        """
+        self._primary_reads += 1
+        try:
+            yield
+        finally:
+            self._primary_reads -= 1
+
+    def _reader(self) -> "DatabaseConnection":
+        """
+        Memilih koneksi untuk pembacaan: replika secara bergiliran, atau
+        primary jika tidak ada replika, di dalam transaksi/read_from_primary(),
+        atau masih dalam jendela read-your-writes setelah sesi ini menulis.
+        """
+        if not self.replicas or self._transaction is not None or self._primary_reads:
+            return self
+        if self.last_write is not None and time.monotonic() - self.last_write < self.read_your_writes:
+            return self
+
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[self._next_replica % len(self.replicas)]
+            self._next_replica += 1
+            try:
+                if replica.connection is not None or replica.connect():
+                    return replica
+            except CircuitOpenError as e:
+                # Replika yang sedang mati dilewati tanpa mencoba koneksi
+                pass
+        return self
+
+    # ==================== RECONNECT & RETRY ====================
+
+    @staticmethod
+    def _is_connection_error(e: Error) -> bool:
+        """Mengecek apakah error berarti koneksi terputus, bukan kesalahan query."""
+        if e.errno in CONNECTION_ERRORS:
+            return True
+        # Misalnya "MySQL Connection not available" dari driver, tanpa kode error
+        return isinstance(e, (OperationalError, InterfaceError)) and e.errno in (None, -1)
+
+    def _ensure_connection(self):
+        """
+        Memastikan koneksi siap dipakai: ping jika sudah idle lebih lama dari
+        PING_INTERVAL, dan membuka koneksi baru jika belum ada atau terputus.
+        
+        Raises:
+            CircuitOpenError: Jika circuit breaker sedang terbuka
+            DatabaseUnavailableError: Jika koneksi tidak dapat dibuat
+        """
+        now = time.monotonic()
+        if self.connection is not None and now - self._last_used > self.PING_INTERVAL:
+            try:
+                self.connection.ping(reconnect=False, attempts=1, delay=0)
+            except Error as e:
+                self._drop_connection()
+        
+        if self.connection is None:
+            # Koneksi baru di tengah transaksi akan meng-commit sebagian perubahan
+            if self._transaction is not None:
+                raise DatabaseUnavailableError("Koneksi database terputus di tengah transaksi")
+            # connect() memeriksa circuit breaker dan mencatat hasil koneksinya
+            if not self.connect():
+                self._drop_connection()
+                raise DatabaseUnavailableError(f"Tidak dapat terhubung ke database {self.database}")
+        elif not self.breaker.allow():
+            raise CircuitOpenError(f"Database {self.database} sedang tidak tersedia")
+        self._last_used = now
+
+    def _drop_connection(self):
+        """Membuang koneksi yang terputus (ditutup, atau dibuang dari pool)."""
+        if self.cursor is not None:
+            try:
+                self.cursor.close()
+            except Error as e:
+                pass
+            self.cursor = None
+        self.statements = None
+        
+        if self.connection is not None:
+            if self.pool is not None:
+                self.pool.release(self.connection, discard=True)
+            else:
+                try:
+                    self.connection.close()
+                except Error as e:
+                    pass
+            self.connection = None
+
+    def _with_retry(self, run: Callable[[], Any], idempotent: bool = True) -> Any:
+        """
+        Menjalankan run() pada koneksi yang dipastikan hidup. Jika koneksi
+        terputus, koneksi dibuat ulang dan run() diulang dengan jeda bertambah
+        (maksimal RETRY_ATTEMPTS kali). Query yang tidak idempotent hanya diulang
+        jika gagal sebelum terkirim, dan di dalam transaksi tidak ada pengulangan.
+        Error query biasa (bukan koneksi) diteruskan apa adanya.
+        
+        Args:
+            run: Fungsi yang menjalankan query pada self.cursor/self.connection
+            idempotent: True jika run() aman diulang (query baca)
+            
+        Returns:
+            Any: Hasil run()
+            
+        Raises:
+            CircuitOpenError: Jika circuit breaker sedang terbuka
+            DatabaseUnavailableError: Jika koneksi tetap gagal setelah dicoba ulang
+            Error: Jika query gagal karena sebab lain
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            sent = False
+            try:
+                self._ensure_connection()
+                sent = True
+                result = run()
+            except CircuitOpenError:
+                raise
+            except (Error, DatabaseUnavailableError) as e:
+                if isinstance(e, Error) and not self._is_connection_error(e):
+                    # Server menjawab; kesalahan ada di query
+                    self.breaker.record_success()
+                    raise
+                if sent:
+                    # Kegagalan membuka koneksi sudah dicatat oleh connect()
+                    self.breaker.record_failure()
+                    self._drop_connection()
+                retry = self._transaction is None and (idempotent or not sent)
+                if not retry or attempt >= self.RETRY_ATTEMPTS:
+                    if isinstance(e, DatabaseUnavailableError):
+                        raise
+                    raise DatabaseUnavailableError(f"Koneksi ke database {self.database} terputus") from e
+                time.sleep(min(self.RETRY_BACKOFF * 2 ** (attempt - 1), self.RETRY_MAX_DELAY))
+            else:
+                self.breaker.record_success()
+                return result
+
+    def __enter__(self) -> "DatabaseConnection":
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.disconnect()
+        return False
     
-    def execute_query(self, query: str, params: tuple = None) -> bool:
+    def execute_query(self, query: str, params: tuple = None, prepared: bool = False) -> bool:
         """"
         Menjalankan query INSERT, UPDATE, DELETE.
         
         Args:
             query: SQL query string
             params: Parameter untuk query (optional)
+            prepared: Jalankan sebagai prepared statement yang di-cache per koneksi
             
         Returns:
             bool: True jika berhasil, False jika gagal
+            
+        Raises:
+            DatabaseUnavailableError: Jika database tidak dapat dihubungi
         """
+        self.last_error = None
+        started = time.perf_counter()
+        def write():
+            cursor = self._run(query, params, prepared)
+            # Di dalam transaction(), commit dilakukan sekali di akhir blok
+            if self._transaction is None:
+                self.connection.commit()
+            return cursor
+        
         try:
-            self.cursor.execute(query, params)
-            self.connection.commit()
+            # Tulis hanya diulang jika koneksi gagal sebelum query terkirim;
+            # putus saat commit berarti hasilnya tidak diketahui, jadi tidak diulang
+            cursor = self._with_retry(write, idempotent=False)
+            self.rowcount = cursor.rowcount
+            self.last_write = time.monotonic()
+            self._record(query, started, self.rowcount)
             return True
+        except DatabaseUnavailableError as e:
+            self._record(query, started, 0, e)
+            if self._transaction is not None:
+                self._transaction.failed = True
+            raise
         except Error as e:
+            self._record(query, started, 0, e)
+            self.last_error = e
+            if self._transaction is not None:
+                self._transaction.failed = True
+            else:
+                self.connection.rollback()
+            return False
+
+    def execute_many(self, query: str, seq_params: List[tuple]) -> bool:
+        """
+        Menjalankan satu query INSERT/UPDATE/DELETE untuk banyak parameter
+        (executemany) dengan satu commit. Selalu memakai cursor biasa karena
+        executemany-nya menggabungkan INSERT menjadi satu statement multi-baris.
+        
+        Args:
+            query: SQL query string
+            seq_params: List parameter, satu tuple per baris
+            
+        Returns:
+            bool: True jika berhasil, False jika gagal
+            
+        Raises:
+            DatabaseUnavailableError: Jika database tidak dapat dihubungi
+        """
+        self.last_error = None
+        started = time.perf_counter()
+        def write():
+            self.cursor.executemany(query, seq_params)
+            if self._transaction is None:
+                self.connection.commit()
+        
+        try:
+            self._with_retry(write, idempotent=False)
+            self.rowcount = self.cursor.rowcount
+            self.last_write = time.monotonic()
+            self._record(query, started, self.rowcount)
+            return True
+        except DatabaseUnavailableError as e:
+            self._record(query, started, 0, e)
+            if self._transaction is not None:
+                self._transaction.failed = True
+            raise
+        except Error as e:
+            self._record(query, started, 0, e)
+            self.last_error = e
+            if self._transaction is not None:
+                self._transaction.failed = True
+            else:
+                self.connection.rollback()
+            return False
+
+    def _run(self, query: str, params: Optional[tuple], prepared: bool):
+        """
+        Menjalankan query pada cursor biasa, atau sebagai prepared statement
+        jika diminta dan koneksi mendukungnya (SQLite sudah meng-cache
+        statement sendiri di modul sqlite3).
+        
+        Returns:
+            Cursor yang berisi hasil query
+        """
+        if prepared and params is not None and self.statements is not None:
+            return self.statements.execute(query, params)
+        self.cursor.execute(query, params)
+        return self.cursor
+
+    def _record(self, query: str, started: float, rows: int,
+                error: Optional[BaseException] = None):
+        """Mencatat durasi, jumlah baris, dan error query ke monitor."""
+        if self.monitor is not None:
+            # rowcount bisa -1 atau bukan int jika driver tidak mengetahuinya
+            rows = rows if isinstance(rows, int) and rows > 0 else 0
+            self.monitor.record(query, time.perf_counter() - started, rows, error)
+
+    @contextmanager
+    def transaction(self) -> Iterator[Transaction]:
+        """
+        Menjalankan beberapa query tulis dalam satu transaksi.
+        execute_query tidak commit per statement di dalam blok ini; commit
+        dilakukan sekali di akhir, atau rollback jika ada query yang gagal.
+        Blok bersarang memakai SAVEPOINT. Blok bersarang yang gagal dibatalkan
+        ke savepoint-nya dan membuat transaksi luar ikut gagal, sehingga seluruh
+        unit kerja di-rollback walaupun model hanya mengembalikan False.
+        
+        Yields:
+            Transaction: Status transaksi (committed bernilai True jika berhasil;
+            untuk blok bersarang, perubahannya ikut commit transaksi terluar)
+        """
+        parent = self._transaction
+        tx = Transaction(parent)
+        if parent is not None:
+            name = f"sp_{tx.depth}"
+            if self._savepoint(f"SAVEPOINT {name}"):
+                tx.savepoint = name
+            else:
+                tx.failed = True
+        elif not self._begin():
+            tx.failed = True
+        self._transaction = tx
+        try:
+            yield tx
+        except BaseException:
+            tx.failed = True
+            raise
+        finally:
+            self._transaction = parent
+            if parent is not None:
+                self._end_savepoint(tx)
+            else:
+                self._end_transaction(tx)
+
+    def _end_transaction(self, tx: Transaction):
+        """Commit atau rollback transaksi terluar."""
+        if self.connection is None:
+            # Koneksi terputus di tengah blok; server sudah membatalkan transaksinya
+            tx.failed = True
+            return
+        if not tx.failed:
+            try:
+                self.connection.commit()
+                tx.committed = True
+                return
+            except Error as e:
+                tx.failed = True
+        try:
             self.connection.rollback()
+        except Error as e:
+            pass
+
+    def _end_savepoint(self, tx: Transaction):
+        """Melepas savepoint blok bersarang, atau membatalkannya dan menggagalkan transaksi luar."""
+        name = tx.savepoint
+        if name is not None and not tx.failed:
+            if self._savepoint(f"RELEASE SAVEPOINT {name}"):
+                tx.committed = True
+                return
+            tx.failed = True
+        
+        # Savepoint bisa sudah hilang (misalnya deadlock membatalkan seluruh
+        # transaksi); transaksi luar tetap di-rollback di akhir blok terluar
+        if name is not None and self._savepoint(f"ROLLBACK TO SAVEPOINT {name}"):
+            self._savepoint(f"RELEASE SAVEPOINT {name}")
+        tx.parent.failed = True
+
+    def _begin(self) -> bool:
+        """
+        Memulai transaksi terluar. MySQL memulai transaksi secara otomatis
+        (autocommit nonaktif), sehingga tidak ada yang perlu dijalankan.
+        
+        Returns:
+            bool: True jika transaksi siap dipakai
+        """
+        return True
+
+    def _savepoint(self, statement: str) -> bool:
+        """
+        Menjalankan perintah SAVEPOINT, RELEASE SAVEPOINT, atau ROLLBACK TO
+        SAVEPOINT di dalam transaksi yang sedang berjalan.
+        
+        Returns:
+            bool: True jika berhasil, False jika gagal (error disimpan di last_error)
+        """
+        if self.cursor is None:
+            return False
+        started = time.perf_counter()
+        try:
+            self.cursor.execute(statement)
+            self._record(statement, started, 0)
+            return True
+        except Error as e:
+            self._record(statement, started, 0, e)
+            self.last_error = e
             return False
     
-    def fetch_all(self, query: str, params: tuple = None) -> List[Dict]:
+    def fetch_all(self, query: str, params: tuple = None, prepared: bool = False) -> List[Dict]:
         """
         Mengambil semua hasil query SELECT.
         
         Args:
             query: SQL query string
             params: Parameter untuk query (optional)
+            prepared: Jalankan sebagai prepared statement yang di-cache per koneksi
             
         Returns:
             List[Dict]: List of dictionary hasil query
+            
+        Raises:
+            DatabaseUnavailableError: Jika database tidak dapat dihubungi
+            QueryTimeoutError: Jika query dibatalkan karena batas waktu
         """
+        reader = self._reader()
+        if reader is not self:
+            try:
+                rows = reader.fetch_all(query, params, prepared)
+                if reader.last_error is None:
+                    self.last_error = None
+                    return rows
+            except DatabaseUnavailableError as e:
+                pass
+            # Replika gagal: ulangi di primary
+
+        self.last_error = None
+        started = time.perf_counter()
         try:
-            self.cursor.execute(query, params)
-            return self.cursor.fetchall()
+            rows = self._with_retry(lambda: self._run(query, params, prepared).fetchall())
+            self._record(query, started, len(rows))
+            return rows
+        except DatabaseUnavailableError as e:
+            self._record(query, started, 0, e)
+            raise
         except Error as e:
+            self._record(query, started, 0, e)
+            self.last_error = e
+            self._raise_if_timeout(e)
             return []
     
-    def fetch_one(self, query: str, params: tuple = None) -> Optional[Dict]:
+    def fetch_one(self, query: str, params: tuple = None, prepared: bool = False) -> Optional[Dict]:
         """
         Mengambil satu hasil query SELECT.
         
         Args:
             query: SQL query string
             params: Parameter untuk query (optional)
+            prepared: Jalankan sebagai prepared statement yang di-cache per koneksi
             
         Returns:
             Optional[Dict]: Dictionary hasil query atau None
+            
+        Raises:
+            DatabaseUnavailableError: Jika database tidak dapat dihubungi
+            QueryTimeoutError: Jika query dibatalkan karena batas waktu
         """
+        reader = self._reader()
+        if reader is not self:
+            try:
+                row = reader.fetch_one(query, params, prepared)
+                if reader.last_error is None:
+                    self.last_error = None
+                    return row
+            except DatabaseUnavailableError as e:
+                pass
+
+        self.last_error = None
+        started = time.perf_counter()
         try:
-            self.cursor.execute(query, params)
-            return self.cursor.fetchone()
+            row = self._with_retry(lambda: self._fetch_first(query, params, prepared))
+            self._record(query, started, 1 if row else 0)
+            return row
+        except DatabaseUnavailableError as e:
+            self._record(query, started, 0, e)
+            raise
         except Error as e:
-            return None
\ No newline at end of file
+            self._record(query, started, 0, e)
+            self.last_error = e
+            self._raise_if_timeout(e)
+            return None
+
+    @staticmethod
+    def _raise_if_timeout(e: Error):
+        """
+        Menaikkan QueryTimeoutError untuk error batas waktu, agar hasil yang
+        dibatalkan tidak tampil sebagai tabel kosong.
+        
+        Raises:
+            QueryTimeoutError: Jika errno termasuk TIMEOUT_ERRORS
+        """
+        if e.errno in TIMEOUT_ERRORS:
+            raise QueryTimeoutError(f"Query dibatalkan karena melewati batas waktu: {e.msg}") from e
+
+    def _fetch_first(self, query: str, params: Optional[tuple], prepared: bool) -> Optional[Dict]:
+        """Menjalankan query dan mengambil baris pertamanya."""
+        cursor = self._run(query, params, prepared)
+        if cursor is self.cursor:
+            return cursor.fetchone()
+        # Cursor prepared tidak di-buffer; habiskan hasilnya agar koneksi siap dipakai lagi
+        rows = cursor.fetchall()
+        return rows[0] if rows else None
+
+    def iter_rows(self, query: str, params: tuple = None,
+                  chunk_size: int = 1000) -> Iterator[Dict]:
+        """
+        Mengalirkan hasil query SELECT baris per baris memakai cursor unbuffered
+        (server-side) dan fetchmany, sehingga memori tetap konstan untuk hasil besar.
+        Koneksi tidak boleh dipakai query lain sampai iterasi selesai.
+        
+        Args:
+            query: SQL query string
+            params: Parameter untuk query (optional)
+            chunk_size: Jumlah baris per fetchmany
+            
+        Yields:
+            Dict: Satu baris hasil query
+            
+        Raises:
+            Error: Jika query gagal (tidak ditelan agar ekspor tidak terpotong diam-diam)
+            DatabaseUnavailableError: Jika database tidak dapat dihubungi sebelum baris pertama
+            QueryTimeoutError: Jika query dibatalkan karena batas waktu
+        """
+        reader = self._reader()
+        if reader is not self:
+            yield from reader.iter_rows(query, params, chunk_size)
+            return
+
+        started = time.perf_counter()
+        count = 0
+        error = None
+        cursor = None
+        try:
+            # Hanya query awal yang diulang; putus di tengah aliran tetap menjadi error
+            cursor = self._with_retry(lambda: self._start_stream(query, params))
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                count += len(rows)
+                yield from rows
+        except (Error, DatabaseUnavailableError) as e:
+            error = e
+            if isinstance(e, Error):
+                self._raise_if_timeout(e)
+            raise
+        finally:
+            self._record(query, started, count, error)
+            if cursor is not None:
+                # Buang sisa hasil jika iterasi dihentikan lebih awal
+                if getattr(self.connection, 'unread_result', False):
+                    self.connection.consume_results()
+                cursor.close()
+
+    def _start_stream(self, query: str, params: Optional[tuple]):
+        """Membuka cursor unbuffered dan menjalankan query untuk iter_rows."""
+        cursor = self.connection.cursor(dictionary=True, buffered=False)
+        try:
+            cursor.execute(query, params)
+        except Error:
+            try:
+                cursor.close()
+            except Error as e:
+                pass
+            raise
+        return cursor
+
@@ -1,16 +1,316 @@
 # ==================== BASE MODEL CLASS ====================
+import re
 from databaseConnection import DatabaseConnection
+from .queryCache import QueryCache
+from typing import List, Dict, Optional, Tuple, Callable, Any, Iterable, Iterator, Sequence
+
+
+class _QueryFailed(Exception):
+    """Query gagal di dalam loader cache; hasil kosongnya tidak boleh disimpan."""
+
+    def __init__(self, result: Any):
+        super().__init__("query gagal")
+        self.result = result
+
 
 class BaseModel:
     """
     Parent class untuk semua model.
     """
     
-    def __init__(self, db: DatabaseConnection):
+    # Kolom tabel utama model yang boleh diminta lewat parameter columns
+    COLUMNS: Tuple[str, ...] = ()
+    
+    # Jumlah id maksimum per query IN (...) pada get_by_ids
+    ID_CHUNK_SIZE = 500
+    
+    def __init__(self, db: DatabaseConnection, cache: Optional[QueryCache] = None):
         """
         Inisialisasi model dengan koneksi database.
         
         Args:
             db: Instance DatabaseConnection
+            cache: Cache query per rerun yang dipakai bersama antar model (optional)
+        """
+        self.db = db
+        self.cache = cache
+
+    @staticmethod
+    def _projection(columns: Optional[Sequence[str]], allowed: Tuple[str, ...],
+                    alias: str = "") -> str:
+        """
+        Menyusun daftar kolom SELECT dari kolom yang diminta.
+        
+        Args:
+            columns: Nama kolom yang diminta (None untuk semua kolom)
+            allowed: Kolom yang dikenal tabel tersebut
+            alias: Alias tabel di query, misalnya "c" (optional)
+            
+        Returns:
+            str: Daftar kolom untuk SELECT
+            
+        Raises:
+            ValueError: Jika ada kolom yang tidak dikenal
+        """
+        prefix = f"{alias}." if alias else ""
+        if not columns:
+            return f"{prefix}*"
+        unknown = [column for column in columns if column not in allowed]
+        if unknown:
+            raise ValueError(f"Kolom tidak dikenal: {', '.join(unknown)}")
+        return ", ".join(prefix + column for column in columns)
+
+    def _load(self, fetch: Callable[[], Any]) -> Any:
+        """
+        Menjalankan query ke database untuk loader cache. Jika query gagal
+        (db.last_error terisi), hasil kosongnya dilempar sebagai _QueryFailed
+        agar tidak disimpan oleh QueryCache maupun SharedCache.
+        """
+        result = fetch()
+        if self.db.last_error is not None:
+            raise _QueryFailed(result)
+        return result
+
+    def _cached(self, kind: str, query: str, params: Optional[tuple]) -> Any:
+        """Menjalankan fetch_all/fetch_one melalui cache per rerun; gagal -> _QueryFailed."""
+        prepared = params is not None
+        fetch = self.db.fetch_all if kind == 'all' else self.db.fetch_one
+        load = lambda: self._load(lambda: fetch(query, params, prepared=prepared))
+        if self.cache is None:
+            return load()
+        return self.cache.get_or_load((kind, query, params), load)
+
+    def _fetch_all(self, query: str, params: tuple = None) -> List[Dict]:
+        """Menjalankan fetch_all (prepared jika berparameter) melalui cache jika tersedia."""
+        try:
+            return self._cached('all', query, params)
+        except _QueryFailed as e:
+            return e.result
+
+    def _fetch_one(self, query: str, params: tuple = None) -> Optional[Dict]:
+        """Menjalankan fetch_one (prepared jika berparameter) melalui cache jika tersedia."""
+        try:
+            return self._cached('one', query, params)
+        except _QueryFailed as e:
+            return e.result
+
+    def _fetch_all_shared(self, tables: Tuple[str, ...], query: str,
+                          params: tuple = None) -> List[Dict]:
+        """Menjalankan fetch_all melalui cache lintas sesi jika tersedia."""
+        try:
+            return self._shared(('all', query, params), tables,
+                                lambda: self._cached('all', query, params))
+        except _QueryFailed as e:
+            return e.result
+
+    def _fetch_one_shared(self, tables: Tuple[str, ...], query: str,
+                          params: tuple = None) -> Optional[Dict]:
+        """Menjalankan fetch_one melalui cache lintas sesi jika tersedia."""
+        try:
+            return self._shared(('one', query, params), tables,
+                                lambda: self._cached('one', query, params))
+        except _QueryFailed as e:
+            return e.result
+
+    def _fetch_labels_shared(self, table: str, label: str) -> Dict[int, str]:
+        """
+        Mengambil pemetaan id -> kolom label sebuah tabel melalui cache lintas sesi.
+        
+        Args:
+            table: Nama tabel (sekaligus nama versinya di table_versions)
+            label: Kolom yang dipakai sebagai label
+            
+        Returns:
+            Dict[int, str]: ID -> label, kosong jika query gagal
+        """
+        query = f"SELECT id, {label} FROM {table} ORDER BY id ASC"
+        try:
+            return self._shared(('labels', query, None), (table,),
+                                lambda: {row['id']: row[label] for row in self._cached('all', query, None)})
+        except _QueryFailed as e:
+            return {}
+
+    def _shared(self, key: tuple, tables: Tuple[str, ...], loader: Callable[[], Any]) -> Any:
+        """
+        Mengambil hasil dari SharedCache, divalidasi dengan versi tabel sumber.
+        Key diawali identitas database karena cache dipakai bersama oleh semua
+        koneksi dalam satu proses.
+        
+        Args:
+            key: Kunci cache (jenis fetch, query, parameter)
+            tables: Tabel yang dibaca query
+            loader: Fungsi yang menjalankan query (melalui cache per rerun)
+            
+        Returns:
+            Any: Hasil query
+            
+        Raises:
+            _QueryFailed: Jika loader gagal (hasilnya tidak disimpan)
         """
-        self.db = db 
\ No newline at end of file
+        shared = self.cache.shared if self.cache is not None else None
+        # Di dalam transaksi data belum di-commit, jadi tidak boleh dibagi ke sesi lain
+        if shared is None or self.db._transaction is not None:
+            return loader()
+        
+        from .tableVersion import TableVersion
+        # Versi dan data dibaca dari primary: jika keduanya dibaca dari replika yang
+        # berbeda, baris dari replika yang tertinggal tersimpan di bawah versi yang
+        # lebih baru dan ikut disajikan ke sesi dalam jendela read-your-writes
+        with self.db.read_from_primary():
+            # Versi dibaca sekali per rerun (melalui cache per rerun) untuk semua tabel
+            versions = TableVersion(self.db, self.cache).get_versions()
+            if not all(table in versions for table in tables):
+                return loader()
+            return shared.get_or_load((self.db.host, self.db.database) + key,
+                                      tuple(versions[table] for table in tables), loader)
+
+    def _search(self, table: str, columns: str, prefix_columns: Tuple[str, ...],
+                fulltext_columns: Tuple[str, ...], term: str, limit: int,
+                where: str = "", where_params: tuple = (),
+                where_tables: Tuple[str, ...] = ()) -> List[Dict]:
+        """
+        Pencarian untuk picker: ID yang persis sama, lalu awalan kolom (index
+        B-tree), lalu kata di kolom teks (FULLTEXT di MySQL, LIKE di SQLite).
+        Hasil melalui cache lintas sesi tabel tersebut.
+        
+        Args:
+            table: Nama tabel
+            columns: Kolom yang dikembalikan (harus memuat id)
+            prefix_columns: Kolom ber-index untuk pencocokan awalan
+            fulltext_columns: Kolom index FULLTEXT
+            term: Kata kunci pencarian
+            limit: Jumlah hasil maksimum
+            where: Syarat tambahan untuk setiap cabang pencarian (optional)
+            where_params: Parameter untuk where
+            where_tables: Tabel lain yang dibaca where, ikut menentukan validitas cache
+            
+        Returns:
+            List[Dict]: Hasil tanpa duplikat, urut dari kecocokan terkuat
+        """
+        tables = (table,) + tuple(where_tables)
+        
+        def condition(sql: str, values: list) -> Tuple[str, list]:
+            if not where:
+                return sql, values
+            return f"({sql}) AND {where}", values + list(where_params)
+        
+        term = (term or "").strip()
+        if not term:
+            filter_sql = f" WHERE {where}" if where else ""
+            query = f"SELECT {columns} FROM {table}{filter_sql} ORDER BY id ASC LIMIT %s"
+            return self._fetch_all_shared(tables, query, tuple(where_params) + (limit,))
+        
+        parts, params = [], []
+        if term.isdigit():
+            sql, values = condition("id = %s", [int(term)])
+            parts.append(f"SELECT {columns} FROM {table} WHERE {sql}")
+            params += values
+        
+        # '!' sebagai karakter escape LIKE berlaku sama di MySQL dan SQLite
+        pattern = re.sub(r"([!%_])", r"!\1", term)
+        for column in prefix_columns:
+            sql, values = condition(f"{column} LIKE %s ESCAPE '!'", [pattern + "%"])
+            parts.append(f"SELECT * FROM (SELECT {columns} FROM {table} "
+                         f"WHERE {sql} ORDER BY {column} LIMIT %s) AS awalan_{column}")
+            params += values + [limit]
+        
+        words = re.findall(r"\w+", term)
+        if words and self.db.dialect == 'sqlite':
+            contains = " OR ".join(f"{column} LIKE %s ESCAPE '!'" for column in fulltext_columns)
+            sql, values = condition(contains, ["%" + pattern + "%"] * len(fulltext_columns))
+            parts.append(f"SELECT * FROM (SELECT {columns} FROM {table} WHERE {sql} LIMIT %s) AS kata")
+            params += values + [limit]
+        elif words:
+            # Boolean mode: setiap kata wajib ada, boleh sebagai awalan kata
+            against = " ".join(f"+{word}*" for word in words)
+            sql, values = condition(
+                f"MATCH({', '.join(fulltext_columns)}) AGAINST (%s IN BOOLEAN MODE)", [against]
+            )
+            parts.append(f"SELECT * FROM (SELECT {columns} FROM {table} WHERE {sql} LIMIT %s) AS kata")
+            params += values + [limit]
+        
+        rows = self._fetch_all_shared(tables, " UNION ALL ".join(parts), tuple(params))
+        seen, results = set(), []
+        for row in rows:
+            if row['id'] not in seen:
+                seen.add(row['id'])
+                results.append(row)
+        return results[:limit]
+
+    def _id_chunks(self, ids: Iterable[int]) -> Iterator[Tuple[List[int], tuple, str]]:
+        """
+        Membagi ID unik menjadi potongan ID_CHUNK_SIZE untuk query IN (...).
+        Jumlah placeholder dibulatkan ke pangkat dua (diisi ID terakhir) agar
+        teks SQL, dan prepared statement-nya, hanya ada beberapa variasi.
+        
+        Args:
+            ids: ID yang akan dibagi (duplikat diabaikan)
+            
+        Returns:
+            Iterator[Tuple[List[int], tuple, str]]: (ID potongan, parameter, placeholder)
+        """
+        unique = list(dict.fromkeys(int(i) for i in ids))
+        for start in range(0, len(unique), self.ID_CHUNK_SIZE):
+            chunk = unique[start:start + self.ID_CHUNK_SIZE]
+            size = min(1 << (len(chunk) - 1).bit_length(), self.ID_CHUNK_SIZE)
+            params = tuple(chunk + [chunk[-1]] * (size - len(chunk)))
+            yield chunk, params, ", ".join(["%s"] * size)
+
+    def _fetch_by_ids(self, table: str, columns: str, ids: Iterable[int]) -> Dict[int, Dict]:
+        """
+        Mengambil banyak baris berdasarkan ID dengan satu query IN (...) per
+        potongan, melalui cache lintas sesi tabel tersebut.
+        
+        Args:
+            table: Nama tabel
+            columns: Kolom yang dikembalikan (harus memuat id)
+            ids: ID yang dicari (duplikat diabaikan)
+            
+        Returns:
+            Dict[int, Dict]: ID -> baris, urut sesuai ids; ID yang tidak ada dilewati
+        """
+        requested, found = [], {}
+        for chunk, params, placeholders in self._id_chunks(ids):
+            requested += chunk
+            query = f"SELECT {columns} FROM {table} WHERE id IN ({placeholders})"
+            for row in self._fetch_all_shared((table,), query, params):
+                found[row['id']] = row
+        return {i: found[i] for i in requested if i in found}
+
+    def _delete_by_ids(self, ids: Iterable[int],
+                       delete_chunk: Callable[[tuple, str], Optional[int]]) -> Dict[str, int]:
+        """
+        Menghapus banyak baris per potongan ID, satu transaksi per potongan.
+        
+        Args:
+            ids: ID yang akan dihapus
+            delete_chunk: Fungsi (parameter, placeholder) -> jumlah baris terhapus,
+                atau None jika transaksinya gagal
+            
+        Returns:
+            Dict[str, int]: Ringkasan dengan key deleted dan failed (jumlah ID)
+        """
+        summary = {'deleted': 0, 'failed': 0}
+        for chunk, params, placeholders in self._id_chunks(ids):
+            deleted = delete_chunk(params, placeholders)
+            if deleted is None:
+                summary['failed'] += len(chunk)
+            else:
+                summary['deleted'] += deleted
+        return summary
+
+    def _execute(self, query: str, params: tuple = None) -> bool:
+        """Menjalankan query tulis (prepared jika berparameter) dan mengosongkan cache."""
+        try:
+            return self.db.execute_query(query, params, prepared=params is not None)
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate()
+
+    def _execute_many(self, query: str, seq_params: List[tuple]) -> bool:
+        """Menjalankan executemany dan mengosongkan cache."""
+        try:
+            return self.db.execute_many(query, seq_params)
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate()
@@ -2,13 +2,17 @@
 
 from datetime import datetime
 from .baseModel import BaseModel
-from typing import List, Dict, Optional
+from .statCounter import StatCounter
+from .tableVersion import TableVersion
+from typing import List, Dict, Optional, Iterator, Iterable, Sequence
 
 class Course(BaseModel):
     """
     Model untuk mengelola data kelas.
     """
     
+    COLUMNS = ('id', 'nama_kelas', 'deskripsi', 'instruktur', 'tanggal_dibuat')
+    
     def create(self, nama_kelas: str, deskripsi: str, instruktur: str) -> bool:
         """
         Menambah kelas baru.
@@ -26,17 +30,128 @@ class Course(BaseModel):
         VALUES (%s, %s, %s, %s)
         """
         params = (nama_kelas, deskripsi, instruktur, datetime.now())
-        return self.db.execute_query(query, params)
+        counters = StatCounter(self.db, self.cache)
+        versions = TableVersion(self.db, self.cache)
+        
+        with self.db.transaction() as tx:
+            ok = (
+                self._execute(query, params)
+                and counters.add(StatCounter.COURSES)
+                and versions.bump(TableVersion.COURSES)
+            )
+        return bool(ok and tx.committed)
     
-    def get_all(self) -> List[Dict]:
+    def get_all(self, columns: Optional[Sequence[str]] = None) -> List[Dict]:
         """
         Mengambil semua data kelas.
         
+        Args:
+            columns: Kolom yang diambil, dari COLUMNS (optional, default semua)
+            
         Returns:
             List[Dict]: List kelas
         """
-        query = "SELECT * FROM courses ORDER BY id ASC"
-        return self.db.fetch_all(query)
+        query = f"SELECT {self._projection(columns, self.COLUMNS)} FROM courses ORDER BY id ASC"
+        return self._fetch_all_shared((TableVersion.COURSES,), query)
+    
+    def iter_all(self, chunk_size: int = 1000,
+                 columns: Optional[Sequence[str]] = None) -> Iterator[Dict]:
+        """
+        Mengalirkan semua data kelas tanpa memuat seluruhnya ke memori.
+        
+        Args:
+            chunk_size: Jumlah baris per pengambilan dari server
+            columns: Kolom yang diambil, dari COLUMNS (optional, default semua)
+            
+        Returns:
+            Iterator[Dict]: Data kelas satu per satu
+        """
+        query = f"SELECT {self._projection(columns, self.COLUMNS)} FROM courses ORDER BY id ASC"
+        return self.db.iter_rows(query, chunk_size=chunk_size)
+    
+    def get_page(self, after_id: Optional[int] = None, limit: int = 50,
+                 columns: Optional[Sequence[str]] = None) -> List[Dict]:
+        """
+        Mengambil satu halaman data kelas dengan keyset pagination.
+        
+        Args:
+            after_id: ID terakhir dari halaman sebelumnya (None untuk halaman pertama)
+            limit: Jumlah baris per halaman
+            columns: Kolom yang diambil, dari COLUMNS; sertakan id untuk cursor (optional)
+            
+        Returns:
+            List[Dict]: List kelas dengan id > after_id, urut berdasarkan id
+        """
+        query = (f"SELECT {self._projection(columns, self.COLUMNS)} FROM courses "
+                 "WHERE id > %s ORDER BY id ASC LIMIT %s")
+        return self._fetch_all_shared((TableVersion.COURSES,), query, (after_id or 0, limit))
+    
+    def count(self) -> int:
+        """
+        Menghitung jumlah seluruh kelas.
+        
+        Returns:
+            int: Jumlah kelas
+        """
+        row = self._fetch_one_shared((TableVersion.COURSES,), "SELECT COUNT(*) AS total FROM courses")
+        return int(row['total']) if row else 0
+    
+    def get_labels(self) -> Dict[int, str]:
+        """
+        Mengambil pemetaan id -> nama_kelas untuk label picker. Hanya dua kolom
+        yang diambil dan hasilnya di-cache lintas sesi sampai tabel berubah.
+        
+        Returns:
+            Dict[int, str]: ID kelas -> nama_kelas
+        """
+        return self._fetch_labels_shared(TableVersion.COURSES, 'nama_kelas')
+    
+    def search(self, term: str, limit: int = 20) -> List[Dict]:
+        """
+        Mencari kelas untuk picker berdasarkan ID, awalan, atau kata di nama kelas atau deskripsi.
+        
+        Args:
+            term: Kata kunci pencarian (kosong untuk kelas pertama berdasarkan ID)
+            limit: Jumlah hasil maksimum
+            
+        Returns:
+            List[Dict]: id, nama_kelas, instruktur dari kelas yang paling cocok
+        """
+        return self._search("courses", "id, nama_kelas, instruktur",
+                            ('nama_kelas',), ('nama_kelas', 'deskripsi'), term, limit)
+    
+    def search_available(self, participant_id: int, term: str = "", limit: int = 20,
+                         after_id: Optional[int] = None) -> List[Dict]:
+        """
+        Mencari kelas yang belum diikuti peserta. Penyaringan dilakukan di database
+        dengan NOT EXISTS terhadap enrollments (memakai index unique_enrollment),
+        sehingga hanya baris yang ditampilkan yang diambil.
+        
+        Args:
+            participant_id: ID peserta
+            term: Kata kunci pencarian seperti search (kosong untuk daftar per halaman)
+            limit: Jumlah hasil maksimum
+            after_id: ID terakhir halaman sebelumnya, hanya untuk term kosong (optional)
+            
+        Returns:
+            List[Dict]: id, nama_kelas, instruktur dari kelas yang belum diikuti
+        """
+        not_enrolled = """NOT EXISTS (
+            SELECT 1 FROM enrollments e
+            WHERE e.participant_id = %s AND e.course_id = courses.id
+        )"""
+        if (term or "").strip():
+            return self._search("courses", "id, nama_kelas, instruktur",
+                                ('nama_kelas',), ('nama_kelas', 'deskripsi'), term, limit,
+                                where=not_enrolled, where_params=(participant_id,),
+                                where_tables=('enrollments',))
+        
+        query = f"""
+        SELECT id, nama_kelas, instruktur FROM courses
+        WHERE id > %s AND {not_enrolled}
+        ORDER BY id ASC LIMIT %s
+        """
+        return self._fetch_all(query, (after_id or 0, participant_id, limit))
     
     def get_by_id(self, course_id: int) -> Optional[Dict]:
         """
@@ -49,7 +164,24 @@ class Course(BaseModel):
             Optional[Dict]: Data kelas atau None
         """
         query = "SELECT * FROM courses WHERE id = %s"
-        return self.db.fetch_one(query, (course_id,))
+        return self._fetch_one_shared((TableVersion.COURSES,), query, (course_id,))
+    
+    def get_by_ids(self, ids: Iterable[int],
+                   columns: Optional[Sequence[str]] = None) -> Dict[int, Dict]:
+        """
+        Mengambil banyak kelas sekaligus berdasarkan ID, dengan query IN (...)
+        per potongan alih-alih satu query per ID.
+        
+        Args:
+            ids: ID kelas yang dicari
+            columns: Kolom yang diambil, dari COLUMNS; id selalu disertakan (optional)
+            
+        Returns:
+            Dict[int, Dict]: ID -> data kelas, ID yang tidak ada dilewati
+        """
+        if columns:
+            columns = ('id',) + tuple(c for c in columns if c != 'id')
+        return self._fetch_by_ids("courses", self._projection(columns, self.COLUMNS), ids)
     
     def update(self, course_id: int, nama_kelas: str, 
                deskripsi: str, instruktur: str) -> bool:
@@ -71,7 +203,14 @@ class Course(BaseModel):
         WHERE id = %s
         """
         params = (nama_kelas, deskripsi, instruktur, course_id)
-        return self.db.execute_query(query, params)
+        versions = TableVersion(self.db, self.cache)
+        
+        with self.db.transaction() as tx:
+            ok = (
+                self._execute(query, params)
+                and versions.bump(TableVersion.COURSES)
+            )
+        return bool(ok and tx.committed)
     
     def delete(self, course_id: int) -> bool:
         """
@@ -83,10 +222,40 @@ class Course(BaseModel):
         Returns:
             bool: True jika berhasil, False jika gagal
         """
-        # Hapus relasi di tabel enrollments terlebih dahulu
-        delete_enrollments = "DELETE FROM enrollments WHERE course_id = %s"
-        self.db.execute_query(delete_enrollments, (course_id,))
+        return self._delete_chunk((course_id,), "%s") is not None
+    
+    def delete_many(self, course_ids: Iterable[int]) -> Dict[str, int]:
+        """
+        Menghapus banyak kelas beserta relasinya, per potongan ID_CHUNK_SIZE
+        dengan satu transaksi per potongan.
+        
+        Args:
+            course_ids: ID kelas
+            
+        Returns:
+            Dict[str, int]: Ringkasan: deleted (kelas terhapus), failed (ID pada potongan yang gagal)
+        """
+        return self._delete_by_ids(course_ids, self._delete_chunk)
+    
+    def _delete_chunk(self, ids: tuple, placeholders: str) -> Optional[int]:
+        """Menghapus kelas dengan ID tertentu dalam satu transaksi; None jika gagal."""
+        counters = StatCounter(self.db, self.cache)
+        versions = TableVersion(self.db, self.cache)
+        delete_enrollments = f"DELETE FROM enrollments WHERE course_id IN ({placeholders})"
+        query = f"DELETE FROM courses WHERE id IN ({placeholders})"
         
-        # Hapus kelas
-        query = "DELETE FROM courses WHERE id = %s"
-        return self.db.execute_query(query, (course_id,))
\ No newline at end of file
+        # Relasi, kelas, dan counter-nya dihapus dalam satu transaksi
+        with self.db.transaction() as tx:
+            ok = (
+                self._execute(delete_enrollments, ids)
+                and counters.subtract(StatCounter.ENROLLMENTS, self.db.rowcount)
+                and counters.remove_course(*ids)
+                and self._execute(query, ids)
+            )
+            deleted = self.db.rowcount if ok else 0
+            ok = (
+                ok
+                and counters.subtract(StatCounter.COURSES, deleted)
+                and versions.bump(TableVersion.COURSES, TableVersion.ENROLLMENTS)
+            )
+        return deleted if ok and tx.committed else None
\ No newline at end of file
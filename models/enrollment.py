@@ -1,80 +1,267 @@
 # ==================== ENROLLMENT MODEL ====================
 from .baseModel import BaseModel
+from .statCounter import StatCounter
+from .participant import Participant
+from .course import Course
+from .tableVersion import TableVersion
+from databaseConnection import ER_DUP_ENTRY, ER_NO_REFERENCED_ROW
 from datetime import datetime
-from typing import List, Dict
-import streamlit as st
+from enum import Enum
+from typing import List, Dict, Optional, Tuple, Iterable, Iterator, Sequence
+
+
+class EnrollmentStatus(Enum):
+    """
+    Hasil pendaftaran satu peserta ke satu kelas.
+    """
+    CREATED = "created"
+    ALREADY_ENROLLED = "already_enrolled"
+    UNKNOWN_PARTICIPANT = "unknown_participant"
+    UNKNOWN_COURSE = "unknown_course"
+    FAILED = "failed"
+
 
 class Enrollment(BaseModel):
     """
     Model untuk mengelola pendaftaran peserta ke kelas.
     """
     
-    def create(self, participant_id: int, course_id: int) -> bool:
+    # Jumlah pasangan per statement INSERT multi-baris
+    BULK_CHUNK_SIZE = 1000
+    
+    def create(self, participant_id: int, course_id: int) -> EnrollmentStatus:
         """
-        Mendaftarkan peserta ke kelas.
+        Mendaftarkan peserta ke kelas dengan satu INSERT atomik.
+        Duplikasi dicegah oleh constraint unique_enrollment, bukan SELECT terpisah.
         
         Args:
             participant_id: ID peserta
             course_id: ID kelas
             
         Returns:
-            bool: True jika berhasil, False jika gagal
+            EnrollmentStatus: CREATED, ALREADY_ENROLLED, UNKNOWN_PARTICIPANT,
+                              UNKNOWN_COURSE, atau FAILED
         """
-        # Cek apakah sudah terdaftar
-        check_query = """
-        SELECT * FROM enrollments 
-        WHERE participant_id = %s AND course_id = %s
-        """
-        existing = self.db.fetch_one(check_query, (participant_id, course_id))
-        
-        if existing:
-            st.warning("Peserta sudah terdaftar di kelas ini!")
-            return False
-        
         query = """
         INSERT INTO enrollments (participant_id, course_id, tanggal_daftar)
         VALUES (%s, %s, %s)
         """
         params = (participant_id, course_id, datetime.now())
-        return self.db.execute_query(query, params)
+        counters = StatCounter(self.db, self.cache)
+        versions = TableVersion(self.db, self.cache)
+        
+        with self.db.transaction() as tx:
+            inserted = self._execute(query, params)
+            error = self.db.last_error
+            ok = (
+                inserted
+                and counters.add(StatCounter.ENROLLMENTS)
+                and counters.add_course_enrollments(course_id)
+                and versions.bump(TableVersion.ENROLLMENTS)
+            )
+        
+        if ok and tx.committed:
+            return EnrollmentStatus.CREATED
+        if inserted:
+            return EnrollmentStatus.FAILED
+        
+        errno = getattr(error, 'errno', None)
+        if errno == ER_DUP_ENTRY:
+            return EnrollmentStatus.ALREADY_ENROLLED
+        if errno == ER_NO_REFERENCED_ROW:
+            # Jalur gagal saja: cari tahu referensi mana yang tidak ada
+            if not self._fetch_one("SELECT id FROM participants WHERE id = %s", (participant_id,)):
+                return EnrollmentStatus.UNKNOWN_PARTICIPANT
+            return EnrollmentStatus.UNKNOWN_COURSE
+        return EnrollmentStatus.FAILED
+    
+    def enroll_participants(self, course_id: int, participant_ids: List[int]) -> Dict[str, int]:
+        """
+        Mendaftarkan banyak peserta ke satu kelas sekaligus.
+        
+        Args:
+            course_id: ID kelas
+            participant_ids: List ID peserta
+            
+        Returns:
+            Dict[str, int]: inserted (pendaftaran baru), skipped (sudah terdaftar/tidak valid)
+        """
+        return self._bulk_insert(participant_ids, [course_id])
+    
+    def enroll_courses(self, participant_id: int, course_ids: List[int]) -> Dict[str, int]:
+        """
+        Mendaftarkan satu peserta ke banyak kelas sekaligus.
+        
+        Args:
+            participant_id: ID peserta
+            course_ids: List ID kelas
+            
+        Returns:
+            Dict[str, int]: inserted (pendaftaran baru), skipped (sudah terdaftar/tidak valid)
+        """
+        return self._bulk_insert([participant_id], course_ids)
+    
+    def _bulk_insert(self, participant_ids: List[int], course_ids: List[int]) -> Dict[str, int]:
+        """
+        Mendaftarkan setiap peserta ke setiap kelas dengan INSERT IGNORE ... SELECT.
+        ID yang tidak ada disaring oleh join ke participants dan courses, bukan oleh
+        foreign key: MySQL melewati baris yang melanggar FK saat IGNORE, sedangkan
+        INSERT OR IGNORE di SQLite menolak seluruh statement. Pasangan yang melanggar
+        unique_enrollment dilewati oleh database.
+        """
+        participant_ids = list(dict.fromkeys(participant_ids))
+        course_ids = list(dict.fromkeys(course_ids))
+        result = {'inserted': 0, 'skipped': 0}
+        if not participant_ids or not course_ids:
+            return result
+        
+        now = datetime.now()
+        counters = StatCounter(self.db, self.cache)
+        versions = TableVersion(self.db, self.cache)
+        inserted = 0
+        
+        with self.db.transaction() as tx:
+            ok = True
+            for p_start in range(0, len(participant_ids), self.BULK_CHUNK_SIZE):
+                p_chunk = participant_ids[p_start:p_start + self.BULK_CHUNK_SIZE]
+                for c_start in range(0, len(course_ids), self.BULK_CHUNK_SIZE):
+                    c_chunk = course_ids[c_start:c_start + self.BULK_CHUNK_SIZE]
+                    query = f"""
+                    INSERT IGNORE INTO enrollments (participant_id, course_id, tanggal_daftar)
+                    SELECT p.id, c.id, %s
+                    FROM participants p CROSS JOIN courses c
+                    WHERE p.id IN ({", ".join(["%s"] * len(p_chunk))})
+                      AND c.id IN ({", ".join(["%s"] * len(c_chunk))})
+                    """
+                    if not self._execute(query, (now, *p_chunk, *c_chunk)):
+                        ok = False
+                        break
+                    inserted += self.db.rowcount
+                if not ok:
+                    break
+            
+            ok = (
+                ok
+                and counters.add(StatCounter.ENROLLMENTS, inserted)
+                and counters.refresh_course_enrollments(course_ids)
+                and (not inserted or versions.bump(TableVersion.ENROLLMENTS))
+            )
+        
+        if ok and tx.committed:
+            result['inserted'] = inserted
+            result['skipped'] = len(participant_ids) * len(course_ids) - inserted
+        return result
     
-    def get_courses_by_participant(self, participant_id: int) -> List[Dict]:
+    def get_courses_by_participant(self, participant_id: int,
+                                   columns: Optional[Sequence[str]] = None) -> List[Dict]:
         """
         Mengambil daftar kelas yang diikuti peserta.
         
         Args:
             participant_id: ID peserta
+            columns: Kolom kelas yang diambil, dari Course.COLUMNS (optional, default semua)
             
         Returns:
-            List[Dict]: List kelas yang diikuti
+            List[Dict]: List kelas yang diikuti beserta tanggal_daftar
         """
-        query = """
-        SELECT c.*, e.tanggal_daftar
+        query = f"""
+        SELECT {self._projection(columns, Course.COLUMNS, "c")}, e.tanggal_daftar
         FROM courses c
         JOIN enrollments e ON c.id = e.course_id
         WHERE e.participant_id = %s
         ORDER BY e.tanggal_daftar ASC
         """
-        return self.db.fetch_all(query, (participant_id,))
+        return self._fetch_all(query, (participant_id,))
     
-    def get_participants_by_course(self, course_id: int) -> List[Dict]:
+    def get_participants_by_course(self, course_id: int,
+                                   columns: Optional[Sequence[str]] = None) -> List[Dict]:
         """
         Mengambil daftar peserta yang terdaftar di kelas.
         
         Args:
             course_id: ID kelas
+            columns: Kolom peserta yang diambil, dari Participant.COLUMNS (optional, default semua)
             
         Returns:
-            List[Dict]: List peserta yang terdaftar
+            List[Dict]: List peserta yang terdaftar beserta tanggal_daftar
         """
-        query = """
-        SELECT p.*, e.tanggal_daftar
+        query = f"""
+        SELECT {self._projection(columns, Participant.COLUMNS, "p")}, e.tanggal_daftar
         FROM participants p
         JOIN enrollments e ON p.id = e.participant_id
         WHERE e.course_id = %s
         ORDER BY e.tanggal_daftar ASC
         """
-        return self.db.fetch_all(query, (course_id,))
+        return self._fetch_all(query, (course_id,))
+    
+    def get_participant_detail(self, participant_id: int) -> Optional[Dict]:
+        """
+        Mengambil data peserta beserta kelas yang diikutinya dalam satu query.
+        
+        Args:
+            participant_id: ID peserta
+            
+        Returns:
+            Optional[Dict]: Data peserta dengan key 'courses' (seperti
+            get_courses_by_participant), atau None jika peserta tidak ada
+        """
+        return self._get_with_related(
+            "participants p", Participant.COLUMNS, "p",
+            "courses c", Course.COLUMNS, "c",
+            "e.participant_id = p.id", "c.id = e.course_id", participant_id, 'courses'
+        )
+    
+    def get_course_detail(self, course_id: int) -> Optional[Dict]:
+        """
+        Mengambil data kelas beserta peserta yang terdaftar dalam satu query.
+        
+        Args:
+            course_id: ID kelas
+            
+        Returns:
+            Optional[Dict]: Data kelas dengan key 'participants' (seperti
+            get_participants_by_course), atau None jika kelas tidak ada
+        """
+        return self._get_with_related(
+            "courses c", Course.COLUMNS, "c",
+            "participants p", Participant.COLUMNS, "p",
+            "e.course_id = c.id", "p.id = e.participant_id", course_id, 'participants'
+        )
+    
+    def _get_with_related(self, table: str, columns: Tuple[str, ...], alias: str,
+                          related_table: str, related_columns: Tuple[str, ...],
+                          related_alias: str, enrollment_join: str, related_join: str,
+                          record_id: int, key: str) -> Optional[Dict]:
+        """
+        Menjalankan LEFT JOIN record -> enrollments -> tabel relasi lalu memisahkan
+        hasilnya menjadi satu record dan list relasinya. Kolom relasi diberi awalan
+        rel_ agar tidak bentrok dengan kolom record.
+        """
+        # tanggal_daftar pada relasi adalah tanggal pendaftaran di kelas, seperti get_*_by_*
+        related = [c for c in related_columns if c != 'tanggal_daftar']
+        select = ", ".join(
+            [f"{alias}.{c}" for c in columns]
+            + [f"{related_alias}.{c} AS rel_{c}" for c in related]
+            + ["e.tanggal_daftar AS rel_tanggal_daftar"]
+        )
+        query = f"""
+        SELECT {select}
+        FROM {table}
+        LEFT JOIN enrollments e ON {enrollment_join}
+        LEFT JOIN {related_table} ON {related_join}
+        WHERE {alias}.id = %s
+        ORDER BY e.tanggal_daftar ASC
+        """
+        rows = self._fetch_all(query, (record_id,))
+        if not rows:
+            return None
+        
+        record = {c: rows[0][c] for c in columns}
+        record[key] = [
+            {c: row[f"rel_{c}"] for c in related + ['tanggal_daftar']}
+            for row in rows if row['rel_id'] is not None
+        ]
+        return record
     
     def delete(self, participant_id: int, course_id: int) -> bool:
         """
@@ -91,7 +278,54 @@ class Enrollment(BaseModel):
         DELETE FROM enrollments 
         WHERE participant_id = %s AND course_id = %s
         """
-        return self.db.execute_query(query, (participant_id, course_id))
+        counters = StatCounter(self.db, self.cache)
+        versions = TableVersion(self.db, self.cache)
+        
+        with self.db.transaction() as tx:
+            ok = self._execute(query, (participant_id, course_id))
+            deleted = self.db.rowcount
+            ok = (
+                ok
+                and counters.subtract(StatCounter.ENROLLMENTS, deleted)
+                and counters.subtract_course_enrollments(course_id, deleted)
+                and versions.bump(TableVersion.ENROLLMENTS)
+            )
+        return bool(ok and tx.committed)
+    
+    def delete_courses(self, participant_id: int, course_ids: Iterable[int]) -> Dict[str, int]:
+        """
+        Menghapus pendaftaran satu peserta dari banyak kelas sekaligus, per
+        potongan ID_CHUNK_SIZE dengan satu transaksi per potongan.
+        
+        Args:
+            participant_id: ID peserta
+            course_ids: ID kelas
+            
+        Returns:
+            Dict[str, int]: deleted (pendaftaran terhapus), failed (ID pada potongan yang gagal)
+        """
+        counters = StatCounter(self.db, self.cache)
+        versions = TableVersion(self.db, self.cache)
+        
+        def delete_chunk(ids: tuple, placeholders: str) -> Optional[int]:
+            query = f"""
+            DELETE FROM enrollments
+            WHERE participant_id = %s AND course_id IN ({placeholders})
+            """
+            with self.db.transaction() as tx:
+                ok = (
+                    counters.subtract_enrolled(participant_id, list(ids))
+                    and self._execute(query, (participant_id, *ids))
+                )
+                deleted = self.db.rowcount if ok else 0
+                ok = (
+                    ok
+                    and counters.subtract(StatCounter.ENROLLMENTS, deleted)
+                    and versions.bump(TableVersion.ENROLLMENTS)
+                )
+            return deleted if ok and tx.committed else None
+        
+        return self._delete_by_ids(course_ids, delete_chunk)
     
     def get_all_enrollments(self) -> List[Dict]:
         """
@@ -113,4 +347,81 @@ class Enrollment(BaseModel):
         JOIN courses c ON e.course_id = c.id
         ORDER BY e.tanggal_daftar ASC
         """
-        return self.db.fetch_all(query)
\ No newline at end of file
+        return self._fetch_all(query)
+    
+    def iter_all_enrollments(self, chunk_size: int = 1000) -> Iterator[Dict]:
+        """
+        Mengalirkan semua pendaftaran (dengan detail peserta dan kelas)
+        tanpa memuat seluruhnya ke memori.
+        
+        Args:
+            chunk_size: Jumlah baris per pengambilan dari server
+            
+        Returns:
+            Iterator[Dict]: Data pendaftaran satu per satu, kolom sama dengan get_all_enrollments
+        """
+        query = """
+        SELECT 
+            e.id,
+            e.participant_id,
+            p.nama as nama_peserta,
+            e.course_id,
+            c.nama_kelas,
+            e.tanggal_daftar
+        FROM enrollments e
+        JOIN participants p ON e.participant_id = p.id
+        JOIN courses c ON e.course_id = c.id
+        ORDER BY e.tanggal_daftar ASC, e.id ASC
+        """
+        return self.db.iter_rows(query, chunk_size=chunk_size)
+    
+    def get_enrollments_page(self, after: Optional[Tuple[Optional[datetime], int]] = None,
+                             limit: int = 50) -> List[Dict]:
+        """
+        Mengambil satu halaman pendaftaran (dengan detail peserta dan kelas)
+        memakai keyset pagination pada (tanggal_daftar, id).
+        
+        Args:
+            after: Cursor (tanggal_daftar, id) dari baris terakhir halaman sebelumnya
+                   (None untuk halaman pertama)
+            limit: Jumlah baris per halaman
+            
+        Returns:
+            List[Dict]: List pendaftaran setelah cursor, urutan sama dengan get_all_enrollments
+        """
+        select = """
+        SELECT 
+            e.id,
+            e.participant_id,
+            p.nama as nama_peserta,
+            e.course_id,
+            c.nama_kelas,
+            e.tanggal_daftar
+        FROM enrollments e
+        JOIN participants p ON e.participant_id = p.id
+        JOIN courses c ON e.course_id = c.id
+        """
+        order = "ORDER BY e.tanggal_daftar ASC, e.id ASC LIMIT %s"
+        
+        if after is None:
+            return self._fetch_all(select + order, (limit,))
+        
+        after_date, after_id = after
+        if after_date is None:
+            # NULL diurutkan paling awal, jadi sisa NULL lalu semua baris bertanggal
+            where = "WHERE (e.tanggal_daftar IS NULL AND e.id > %s) OR e.tanggal_daftar IS NOT NULL "
+            params = (after_id, limit)
+        else:
+            where = "WHERE e.tanggal_daftar > %s OR (e.tanggal_daftar = %s AND e.id > %s) "
+            params = (after_date, after_date, after_id, limit)
+        return self._fetch_all(select + where + order, params)
+    
+    def count_enrollments(self) -> int:
+        """
+        Menghitung jumlah seluruh pendaftaran.
+        
+        Returns:
+            int: Jumlah pendaftaran
+        """
+        row = self._fetch_one("SELECT COUNT(*) AS total FROM enrollments")
+        return int(row['total']) if row else 0
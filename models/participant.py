@@ -1,6 +1,9 @@
 # ==================== PARTICIPANT MODEL ====================
 from .baseModel import BaseModel
-from typing import List, Dict, Optional
+from .statCounter import StatCounter
+from .tableVersion import TableVersion
+from databaseConnection import ER_DUP_ENTRY
+from typing import List, Dict, Optional, Iterator, Sequence, Iterable, Callable
 from datetime import datetime
 
 class Participant(BaseModel):
@@ -8,6 +11,8 @@ class Participant(BaseModel):
     Model untuk mengelola data peserta.
     """
     
+    COLUMNS = ('id', 'nama', 'email', 'no_telp', 'alamat', 'tanggal_daftar')
+    
     def create(self, nama: str, email: str, no_telp: str, alamat: str) -> bool:
         """
         Menambah peserta baru.
@@ -26,17 +31,197 @@ class Participant(BaseModel):
         VALUES (%s, %s, %s, %s, %s)
         """
         params = (nama, email, no_telp, alamat, datetime.now())
-        return self.db.execute_query(query, params)
+        counters = StatCounter(self.db, self.cache)
+        versions = TableVersion(self.db, self.cache)
+        
+        with self.db.transaction() as tx:
+            ok = (
+                self._execute(query, params)
+                and counters.add(StatCounter.PARTICIPANTS)
+                and versions.bump(TableVersion.PARTICIPANTS)
+            )
+        return bool(ok and tx.committed)
     
-    def get_all(self) -> List[Dict]:
+    def bulk_create(self, rows: Iterable[Dict], batch_size: int = 500,
+                    on_batch: Optional[Callable[[Dict], None]] = None) -> Dict:
+        """
+        Menambah banyak peserta sekaligus dengan executemany per batch
+        (satu commit per batch). Baris dibaca secara bertahap sehingga
+        iterable besar (misalnya csv.DictReader) tidak dimuat sekaligus.
+        
+        Args:
+            rows: Iterable dict dengan key nama, email, no_telp, alamat
+            batch_size: Jumlah baris per batch INSERT
+            on_batch: Callback dipanggil dengan ringkasan setelah setiap batch (optional)
+            
+        Returns:
+            Dict: inserted (jumlah baris masuk), duplicates (email yang sudah ada),
+                  invalid (nomor baris tanpa nama/email), failed (jumlah baris di batch gagal)
+        """
+        summary = {'inserted': 0, 'duplicates': [], 'invalid': [], 'failed': 0}
+        seen = set()
+        batch = []
+        
+        for line, row in enumerate(rows, start=1):
+            nama = (row.get('nama') or '').strip()
+            email = (row.get('email') or '').strip()
+            if not nama or not email:
+                summary['invalid'].append(line)
+                continue
+            
+            # Email unik tanpa membedakan huruf besar/kecil (collation *_ci)
+            key = email.lower()
+            if key in seen:
+                summary['duplicates'].append(email)
+                continue
+            seen.add(key)
+            
+            batch.append((nama, email, (row.get('no_telp') or '').strip(),
+                          (row.get('alamat') or '').strip()))
+            if len(batch) >= batch_size:
+                self._insert_batch(batch, summary)
+                batch = []
+                if on_batch:
+                    on_batch(summary)
+        
+        if batch:
+            self._insert_batch(batch, summary)
+            if on_batch:
+                on_batch(summary)
+        
+        return summary
+    
+    def _insert_batch(self, batch: List[tuple], summary: Dict):
+        """Menyisipkan satu batch peserta, melewati email yang sudah terdaftar."""
+        placeholders = ", ".join(["%s"] * len(batch))
+        existing_query = f"SELECT email FROM participants WHERE email IN ({placeholders})"
+        # Replika yang tertinggal bisa belum melihat email yang baru terdaftar
+        with self.db.read_from_primary():
+            existing = {
+                r['email'].lower()
+                for r in self.db.fetch_all(existing_query, tuple(b[1] for b in batch))
+            }
+        
+        new_rows = []
+        for nama, email, no_telp, alamat in batch:
+            if email.lower() in existing:
+                summary['duplicates'].append(email)
+            else:
+                new_rows.append((nama, email, no_telp, alamat, datetime.now()))
+        
+        if not new_rows:
+            return
+        
+        if self._insert_rows(new_rows):
+            summary['inserted'] += len(new_rows)
+        elif getattr(self.db.last_error, 'errno', None) == ER_DUP_ENTRY:
+            # Email didaftarkan proses lain setelah pengecekan; unique key menolak
+            # seluruh batch, jadi ulangi per baris dan lewati yang bentrok saja
+            for row in new_rows:
+                if self._insert_rows([row]):
+                    summary['inserted'] += 1
+                elif getattr(self.db.last_error, 'errno', None) == ER_DUP_ENTRY:
+                    summary['duplicates'].append(row[1])
+                else:
+                    summary['failed'] += 1
+        else:
+            summary['failed'] += len(new_rows)
+    
+    def _insert_rows(self, rows: List[tuple]) -> bool:
+        """Menyisipkan baris peserta beserta counter dan versi tabel dalam satu transaksi."""
+        query = """
+        INSERT INTO participants (nama, email, no_telp, alamat, tanggal_daftar)
+        VALUES (%s, %s, %s, %s, %s)
+        """
+        counters = StatCounter(self.db, self.cache)
+        versions = TableVersion(self.db, self.cache)
+        
+        with self.db.transaction() as tx:
+            ok = (
+                self._execute_many(query, rows)
+                and counters.add(StatCounter.PARTICIPANTS, len(rows))
+                and versions.bump(TableVersion.PARTICIPANTS)
+            )
+        return bool(ok and tx.committed)
+    
+    def get_all(self, columns: Optional[Sequence[str]] = None) -> List[Dict]:
         """
         Mengambil semua data peserta.
         
+        Args:
+            columns: Kolom yang diambil, dari COLUMNS (optional, default semua)
+            
         Returns:
             List[Dict]: List peserta
         """
-        query = "SELECT * FROM participants ORDER BY id ASC"
-        return self.db.fetch_all(query)
+        query = f"SELECT {self._projection(columns, self.COLUMNS)} FROM participants ORDER BY id ASC"
+        return self._fetch_all_shared((TableVersion.PARTICIPANTS,), query)
+    
+    def iter_all(self, chunk_size: int = 1000,
+                 columns: Optional[Sequence[str]] = None) -> Iterator[Dict]:
+        """
+        Mengalirkan semua data peserta tanpa memuat seluruhnya ke memori.
+        
+        Args:
+            chunk_size: Jumlah baris per pengambilan dari server
+            columns: Kolom yang diambil, dari COLUMNS (optional, default semua)
+            
+        Returns:
+            Iterator[Dict]: Data peserta satu per satu
+        """
+        query = f"SELECT {self._projection(columns, self.COLUMNS)} FROM participants ORDER BY id ASC"
+        return self.db.iter_rows(query, chunk_size=chunk_size)
+    
+    def get_page(self, after_id: Optional[int] = None, limit: int = 50,
+                 columns: Optional[Sequence[str]] = None) -> List[Dict]:
+        """
+        Mengambil satu halaman data peserta dengan keyset pagination.
+        
+        Args:
+            after_id: ID terakhir dari halaman sebelumnya (None untuk halaman pertama)
+            limit: Jumlah baris per halaman
+            columns: Kolom yang diambil, dari COLUMNS; sertakan id untuk cursor (optional)
+            
+        Returns:
+            List[Dict]: List peserta dengan id > after_id, urut berdasarkan id
+        """
+        query = (f"SELECT {self._projection(columns, self.COLUMNS)} FROM participants "
+                 "WHERE id > %s ORDER BY id ASC LIMIT %s")
+        return self._fetch_all_shared((TableVersion.PARTICIPANTS,), query, (after_id or 0, limit))
+    
+    def count(self) -> int:
+        """
+        Menghitung jumlah seluruh peserta.
+        
+        Returns:
+            int: Jumlah peserta
+        """
+        row = self._fetch_one_shared((TableVersion.PARTICIPANTS,), "SELECT COUNT(*) AS total FROM participants")
+        return int(row['total']) if row else 0
+    
+    def get_labels(self) -> Dict[int, str]:
+        """
+        Mengambil pemetaan id -> nama untuk label picker. Hanya dua kolom
+        yang diambil dan hasilnya di-cache lintas sesi sampai tabel berubah.
+        
+        Returns:
+            Dict[int, str]: ID peserta -> nama
+        """
+        return self._fetch_labels_shared(TableVersion.PARTICIPANTS, 'nama')
+    
+    def search(self, term: str, limit: int = 20) -> List[Dict]:
+        """
+        Mencari peserta untuk picker berdasarkan ID, awalan, atau kata di nama atau email.
+        
+        Args:
+            term: Kata kunci pencarian (kosong untuk peserta pertama berdasarkan ID)
+            limit: Jumlah hasil maksimum
+            
+        Returns:
+            List[Dict]: id, nama, email dari peserta yang paling cocok
+        """
+        return self._search("participants", "id, nama, email",
+                            ('nama', 'email'), ('nama', 'email'), term, limit)
     
     def get_by_id(self, participant_id: int) -> Optional[Dict]:
         """
@@ -49,7 +234,24 @@ class Participant(BaseModel):
             Optional[Dict]: Data peserta atau None
         """
         query = "SELECT * FROM participants WHERE id = %s"
-        return self.db.fetch_one(query, (participant_id,))
+        return self._fetch_one_shared((TableVersion.PARTICIPANTS,), query, (participant_id,))
+    
+    def get_by_ids(self, ids: Iterable[int],
+                   columns: Optional[Sequence[str]] = None) -> Dict[int, Dict]:
+        """
+        Mengambil banyak peserta sekaligus berdasarkan ID, dengan query IN (...)
+        per potongan alih-alih satu query per ID.
+        
+        Args:
+            ids: ID peserta yang dicari
+            columns: Kolom yang diambil, dari COLUMNS; id selalu disertakan (optional)
+            
+        Returns:
+            Dict[int, Dict]: ID -> data peserta, ID yang tidak ada dilewati
+        """
+        if columns:
+            columns = ('id',) + tuple(c for c in columns if c != 'id')
+        return self._fetch_by_ids("participants", self._projection(columns, self.COLUMNS), ids)
     
     def update(self, participant_id: int, nama: str, email: str, 
                no_telp: str, alamat: str) -> bool:
@@ -72,7 +274,14 @@ class Participant(BaseModel):
         WHERE id = %s
         """
         params = (nama, email, no_telp, alamat, participant_id)
-        return self.db.execute_query(query, params)
+        versions = TableVersion(self.db, self.cache)
+        
+        with self.db.transaction() as tx:
+            ok = (
+                self._execute(query, params)
+                and versions.bump(TableVersion.PARTICIPANTS)
+            )
+        return bool(ok and tx.committed)
     
     def delete(self, participant_id: int) -> bool:
         """
@@ -84,10 +293,40 @@ class Participant(BaseModel):
         Returns:
             bool: True jika berhasil, False jika gagal
         """
-        # Hapus relasi di tabel enrollments terlebih dahulu
-        delete_enrollments = "DELETE FROM enrollments WHERE participant_id = %s"
-        self.db.execute_query(delete_enrollments, (participant_id,))
+        return self._delete_chunk((participant_id,), "%s") is not None
+    
+    def delete_many(self, participant_ids: Iterable[int]) -> Dict[str, int]:
+        """
+        Menghapus banyak peserta beserta relasinya, per potongan ID_CHUNK_SIZE
+        dengan satu transaksi per potongan.
+        
+        Args:
+            participant_ids: ID peserta
+            
+        Returns:
+            Dict[str, int]: Ringkasan: deleted (peserta terhapus), failed (ID pada potongan yang gagal)
+        """
+        return self._delete_by_ids(participant_ids, self._delete_chunk)
+    
+    def _delete_chunk(self, ids: tuple, placeholders: str) -> Optional[int]:
+        """Menghapus peserta dengan ID tertentu dalam satu transaksi; None jika gagal."""
+        counters = StatCounter(self.db, self.cache)
+        versions = TableVersion(self.db, self.cache)
+        delete_enrollments = f"DELETE FROM enrollments WHERE participant_id IN ({placeholders})"
+        query = f"DELETE FROM participants WHERE id IN ({placeholders})"
         
-        # Hapus peserta
-        query = "DELETE FROM participants WHERE id = %s"
-        return self.db.execute_query(query, (participant_id,))
\ No newline at end of file
+        # Counter per kelas dikurangi sebelum relasinya dihapus, semuanya dalam satu transaksi
+        with self.db.transaction() as tx:
+            ok = (
+                counters.subtract_participant_courses(*ids)
+                and self._execute(delete_enrollments, ids)
+                and counters.subtract(StatCounter.ENROLLMENTS, self.db.rowcount)
+                and self._execute(query, ids)
+            )
+            deleted = self.db.rowcount if ok else 0
+            ok = (
+                ok
+                and counters.subtract(StatCounter.PARTICIPANTS, deleted)
+                and versions.bump(TableVersion.PARTICIPANTS, TableVersion.ENROLLMENTS)
+            )
+        return deleted if ok and tx.committed else None
\ No newline at end of file
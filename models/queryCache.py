@@ -0,0 +1,50 @@
+# ==================== QUERY CACHE CLASS ====================
+from typing import Any, Callable, Dict, Hashable, Optional
+from .sharedCache import SharedCache
+
+
+class QueryCache:
+    """
+    Cache hasil query untuk satu siklus rerun (request-scoped).
+    Query SELECT yang sama dengan parameter yang sama hanya dijalankan sekali;
+    cache dikosongkan setiap kali ada operasi tulis melalui model.
+    """
+
+    def __init__(self, shared: Optional[SharedCache] = None):
+        """
+        Inisialisasi cache kosong.
+
+        Args:
+            shared: Cache lintas sesi untuk data referensi (optional)
+        """
+        self.shared = shared
+        self._entries: Dict[Hashable, Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Mengambil hasil dari cache, atau menjalankan loader jika belum ada.
+
+        Args:
+            key: Kunci cache (jenis fetch, query, parameter)
+            loader: Fungsi yang menjalankan query ke database
+
+        Returns:
+            Any: Hasil query (jangan diubah oleh pemanggil)
+        """
+        if key in self._entries:
+            self.hits += 1
+            return self._entries[key]
+
+        self.misses += 1
+        result = loader()
+        self._entries[key] = result
+        return result
+
+    def invalidate(self):
+        """Mengosongkan seluruh isi cache setelah operasi tulis."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
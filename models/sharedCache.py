@@ -0,0 +1,82 @@
+# ==================== SHARED CACHE CLASS ====================
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+
+class SharedCache:
+    """
+    Cache hasil query lintas sesi dalam satu proses.
+    Setiap entri disimpan bersama versi tabel sumbernya (tabel table_versions);
+    entri hanya dipakai selama versi tersebut belum berubah, sehingga
+    perubahan dari proses lain terlihat pada pengecekan versi berikutnya.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        """
+        Inisialisasi cache kosong.
+
+        Args:
+            max_entries: Jumlah entri maksimum; entri yang paling lama tidak dipakai dibuang
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[Tuple, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_load(self, key: Hashable, versions: Tuple, loader: Callable[[], Any]) -> Any:
+        """
+        Mengambil hasil dari cache jika versinya masih sama, atau menjalankan loader.
+
+        Args:
+            key: Kunci cache (jenis fetch, query, parameter)
+            versions: Versi tabel sumber saat ini
+            loader: Fungsi yang menjalankan query ke database
+
+        Returns:
+            Any: Hasil query (dipakai bersama antar sesi, jangan diubah oleh pemanggil)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == versions:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        result = loader()
+        with self._lock:
+            self._entries[key] = (versions, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+    def clear(self):
+        """Mengosongkan seluruh isi cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_shared_cache: Optional[SharedCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_shared_cache() -> SharedCache:
+    """
+    Mengambil cache bersama untuk satu proses. Ukurannya diatur lewat
+    environment variable DB_SHARED_CACHE_SIZE (default 512 entri).
+
+    Returns:
+        SharedCache: Cache bersama
+    """
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = SharedCache(int(os.getenv("DB_SHARED_CACHE_SIZE", "512")))
+        return _shared_cache
@@ -0,0 +1,230 @@
+# ==================== STAT COUNTER MODEL ====================
+from .baseModel import BaseModel
+from typing import Dict, List
+
+class StatCounter(BaseModel):
+    """
+    Model untuk tabel stat_counters: jumlah peserta, kelas, pendaftaran,
+    dan jumlah pendaftaran per kelas. Dipanggil oleh model lain di dalam
+    transaksi yang sama dengan operasi tulisnya.
+    """
+    
+    PARTICIPANTS = 'participants'
+    COURSES = 'courses'
+    ENROLLMENTS = 'enrollments'
+    COURSE_ENROLLMENTS = 'course_enrollments'
+    
+    def add(self, scope: str, amount: int = 1) -> bool:
+        """
+        Menambah counter total.
+        
+        Args:
+            scope: Nama counter (PARTICIPANTS, COURSES, ENROLLMENTS)
+            amount: Jumlah penambahan
+            
+        Returns:
+            bool: True jika berhasil, False jika gagal
+        """
+        query = """
+        UPDATE stat_counters SET counter_value = counter_value + %s
+        WHERE scope = %s AND scope_id = 0
+        """
+        return self._execute(query, (amount, scope))
+    
+    def subtract(self, scope: str, amount: int = 1) -> bool:
+        """
+        Mengurangi counter total.
+        
+        Args:
+            scope: Nama counter (PARTICIPANTS, COURSES, ENROLLMENTS)
+            amount: Jumlah pengurangan
+            
+        Returns:
+            bool: True jika berhasil, False jika gagal
+        """
+        query = """
+        UPDATE stat_counters SET counter_value = counter_value - %s
+        WHERE scope = %s AND scope_id = 0
+        """
+        return self._execute(query, (amount, scope))
+    
+    def add_course_enrollments(self, course_id: int, amount: int = 1) -> bool:
+        """
+        Menambah jumlah pendaftaran sebuah kelas (baris dibuat jika belum ada).
+        
+        Args:
+            course_id: ID kelas
+            amount: Jumlah penambahan
+            
+        Returns:
+            bool: True jika berhasil, False jika gagal
+        """
+        query = """
+        INSERT INTO stat_counters (scope, scope_id, counter_value)
+        VALUES (%s, %s, %s)
+        ON DUPLICATE KEY UPDATE counter_value = counter_value + VALUES(counter_value)
+        """
+        return self._execute(query, (self.COURSE_ENROLLMENTS, course_id, amount))
+    
+    def subtract_course_enrollments(self, course_id: int, amount: int = 1) -> bool:
+        """
+        Mengurangi jumlah pendaftaran sebuah kelas.
+        
+        Args:
+            course_id: ID kelas
+            amount: Jumlah pengurangan
+            
+        Returns:
+            bool: True jika berhasil, False jika gagal
+        """
+        query = """
+        UPDATE stat_counters SET counter_value = counter_value - %s
+        WHERE scope = %s AND scope_id = %s
+        """
+        return self._execute(query, (amount, self.COURSE_ENROLLMENTS, course_id))
+    
+    def refresh_course_enrollments(self, course_ids: List[int]) -> bool:
+        """
+        Menghitung ulang jumlah pendaftaran untuk kelas tertentu (memakai idx_course).
+        
+        Args:
+            course_ids: List ID kelas
+            
+        Returns:
+            bool: True jika berhasil, False jika gagal
+        """
+        if not course_ids:
+            return True
+        placeholders = ", ".join(["%s"] * len(course_ids))
+        query = f"""
+        INSERT INTO stat_counters (scope, scope_id, counter_value)
+        SELECT %s, course_id, COUNT(*) FROM enrollments
+        WHERE course_id IN ({placeholders})
+        GROUP BY course_id
+        ON DUPLICATE KEY UPDATE counter_value = VALUES(counter_value)
+        """
+        return self._execute(query, (self.COURSE_ENROLLMENTS, *course_ids))
+    
+    def subtract_participant_courses(self, *participant_ids: int) -> bool:
+        """
+        Mengurangi jumlah pendaftaran setiap kelas yang diikuti peserta.
+        Harus dipanggil sebelum pendaftaran peserta dihapus.
+        
+        Args:
+            participant_ids: ID peserta (duplikat diabaikan)
+            
+        Returns:
+            bool: True jika berhasil, False jika gagal
+        """
+        placeholders = ", ".join(["%s"] * len(participant_ids))
+        query = f"""
+        UPDATE stat_counters SET counter_value = counter_value - (
+            SELECT COUNT(*) FROM enrollments
+            WHERE course_id = stat_counters.scope_id AND participant_id IN ({placeholders})
+        )
+        WHERE scope = %s
+          AND scope_id IN (SELECT course_id FROM enrollments WHERE participant_id IN ({placeholders}))
+        """
+        return self._execute(query, (*participant_ids, self.COURSE_ENROLLMENTS, *participant_ids))
+    
+    def subtract_enrolled(self, participant_id: int, course_ids: List[int]) -> bool:
+        """
+        Mengurangi satu pendaftaran dari setiap kelas di course_ids yang diikuti
+        peserta. Harus dipanggil sebelum pendaftarannya dihapus.
+        
+        Args:
+            participant_id: ID peserta
+            course_ids: List ID kelas
+            
+        Returns:
+            bool: True jika berhasil, False jika gagal
+        """
+        placeholders = ", ".join(["%s"] * len(course_ids))
+        query = f"""
+        UPDATE stat_counters SET counter_value = counter_value - 1
+        WHERE scope = %s
+          AND scope_id IN (
+              SELECT course_id FROM enrollments
+              WHERE participant_id = %s AND course_id IN ({placeholders})
+          )
+        """
+        return self._execute(query, (self.COURSE_ENROLLMENTS, participant_id, *course_ids))
+    
+    def remove_course(self, *course_ids: int) -> bool:
+        """
+        Menghapus counter pendaftaran milik kelas yang dihapus.
+        
+        Args:
+            course_ids: ID kelas
+            
+        Returns:
+            bool: True jika berhasil, False jika gagal
+        """
+        placeholders = ", ".join(["%s"] * len(course_ids))
+        query = f"DELETE FROM stat_counters WHERE scope = %s AND scope_id IN ({placeholders})"
+        return self._execute(query, (self.COURSE_ENROLLMENTS, *course_ids))
+    
+    def get_totals(self) -> Dict[str, int]:
+        """
+        Mengambil counter total dengan lookup primary key.
+        
+        Returns:
+            Dict[str, int]: participants, courses, enrollments
+        """
+        query = """
+        SELECT scope, counter_value FROM stat_counters
+        WHERE scope IN (%s, %s, %s) AND scope_id = 0
+        """
+        rows = self._fetch_all(query, (self.PARTICIPANTS, self.COURSES, self.ENROLLMENTS))
+        totals = {self.PARTICIPANTS: 0, self.COURSES: 0, self.ENROLLMENTS: 0}
+        for row in rows:
+            totals[row['scope']] = int(row['counter_value'])
+        return totals
+    
+    def get_course_enrollments(self, course_id: int) -> int:
+        """
+        Mengambil jumlah pendaftaran sebuah kelas.
+        
+        Args:
+            course_id: ID kelas
+            
+        Returns:
+            int: Jumlah pendaftaran kelas
+        """
+        query = """
+        SELECT counter_value FROM stat_counters
+        WHERE scope = %s AND scope_id = %s
+        """
+        row = self._fetch_one(query, (self.COURSE_ENROLLMENTS, course_id))
+        return int(row['counter_value']) if row else 0
+    
+    def reconcile(self) -> bool:
+        """
+        Menghitung ulang seluruh counter dari tabel sumber dalam satu transaksi.
+        
+        Returns:
+            bool: True jika berhasil, False jika gagal
+        """
+        with self.db.transaction() as tx:
+            ok = (
+                self._execute("DELETE FROM stat_counters")
+                and self._execute(RECOMPUTE_TOTALS)
+                and self._execute(RECOMPUTE_COURSE_ENROLLMENTS)
+            )
+        return bool(ok and tx.committed)
+
+
+# Query pengisian ulang counter, dipakai oleh reconcile() dan migrasi skema
+RECOMPUTE_TOTALS = """
+INSERT INTO stat_counters (scope, scope_id, counter_value)
+SELECT 'participants', 0, COUNT(*) FROM participants
+UNION ALL
+SELECT 'courses', 0, COUNT(*) FROM courses
+UNION ALL
+SELECT 'enrollments', 0, COUNT(*) FROM enrollments
+"""
+
+RECOMPUTE_COURSE_ENROLLMENTS = """
+INSERT INTO stat_counters (scope, scope_id, counter_value)
+SELECT 'course_enrollments', course_id, COUNT(*) FROM enrollments GROUP BY course_id
+"""
@@ -0,0 +1,100 @@
+# ==================== STATISTICS MODEL ====================
+from .baseModel import BaseModel
+from .statCounter import StatCounter
+from typing import Dict
+
+class Statistics(BaseModel):
+    """
+    Model untuk statistik ringkas dashboard (jumlah data dan data terbaru).
+    """
+    
+    def get_dashboard_stats(self, recent_participants: int = 3, recent_courses: int = 3,
+                            recent_enrollments: int = 5) -> Dict:
+        """
+        Mengambil jumlah peserta, kelas, pendaftaran (dari tabel stat_counters)
+        beserta data terbarunya dalam satu query (satu round trip, satu snapshot).
+        
+        Args:
+            recent_participants: Jumlah peserta terbaru yang diambil
+            recent_courses: Jumlah kelas terbaru yang diambil
+            recent_enrollments: Jumlah pendaftaran terbaru yang diambil
+            
+        Returns:
+            Dict: total_peserta, total_kelas, total_pendaftaran, peserta_terbaru,
+                  kelas_terbaru, pendaftaran_terbaru (data terbaru urut dari yang lama)
+        """
+        # Semua bagian memakai bentuk kolom yang sama agar bisa digabung dengan UNION ALL
+        query = """
+        SELECT scope AS bagian, NULL AS id, NULL AS label,
+               NULL AS keterangan, NULL AS tanggal, counter_value AS jumlah
+        FROM stat_counters
+        WHERE scope IN ('participants', 'courses', 'enrollments') AND scope_id = 0
+        UNION ALL
+        SELECT * FROM (
+            SELECT 'peserta' AS bagian, id, nama AS label, email AS keterangan,
+                   tanggal_daftar AS tanggal, NULL AS jumlah
+            FROM participants
+            ORDER BY id DESC LIMIT %s
+        ) AS peserta_terbaru
+        UNION ALL
+        SELECT * FROM (
+            SELECT 'kelas' AS bagian, id, nama_kelas AS label, instruktur AS keterangan,
+                   tanggal_dibuat AS tanggal, NULL AS jumlah
+            FROM courses
+            ORDER BY id DESC LIMIT %s
+        ) AS kelas_terbaru
+        UNION ALL
+        SELECT * FROM (
+            SELECT 'pendaftaran' AS bagian, e.id, p.nama AS label, c.nama_kelas AS keterangan,
+                   e.tanggal_daftar AS tanggal, NULL AS jumlah
+            FROM enrollments e
+            JOIN participants p ON e.participant_id = p.id
+            JOIN courses c ON e.course_id = c.id
+            ORDER BY e.tanggal_daftar DESC, e.id DESC LIMIT %s
+        ) AS pendaftaran_terbaru
+        """
+        params = (recent_participants, recent_courses, recent_enrollments)
+        rows = self._fetch_all(query, params)
+        
+        stats = {
+            'total_peserta': 0,
+            'total_kelas': 0,
+            'total_pendaftaran': 0,
+            'peserta_terbaru': [],
+            'kelas_terbaru': [],
+            'pendaftaran_terbaru': [],
+        }
+        
+        totals = {
+            StatCounter.PARTICIPANTS: 'total_peserta',
+            StatCounter.COURSES: 'total_kelas',
+            StatCounter.ENROLLMENTS: 'total_pendaftaran',
+        }
+        
+        for row in rows:
+            bagian = row['bagian']
+            if bagian in totals:
+                stats[totals[bagian]] = int(row['jumlah'] or 0)
+            elif bagian == 'peserta':
+                stats['peserta_terbaru'].append({
+                    'id': row['id'], 'nama': row['label'],
+                    'email': row['keterangan'], 'tanggal_daftar': row['tanggal']
+                })
+            elif bagian == 'kelas':
+                stats['kelas_terbaru'].append({
+                    'id': row['id'], 'nama_kelas': row['label'],
+                    'instruktur': row['keterangan'], 'tanggal_dibuat': row['tanggal']
+                })
+            elif bagian == 'pendaftaran':
+                stats['pendaftaran_terbaru'].append({
+                    'id': row['id'], 'nama_peserta': row['label'],
+                    'nama_kelas': row['keterangan'], 'tanggal_daftar': row['tanggal']
+                })
+        
+        # Urutan tampilan sama seperti sebelumnya: dari yang lama ke yang terbaru
+        stats['peserta_terbaru'].sort(key=lambda r: r['id'])
+        stats['kelas_terbaru'].sort(key=lambda r: r['id'])
+        stats['pendaftaran_terbaru'].sort(
+            key=lambda r: (r['tanggal_daftar'] is not None, r['tanggal_daftar'] or 0, r['id'])
+        )
+        return stats
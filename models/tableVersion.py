@@ -0,0 +1,63 @@
+# ==================== TABLE VERSION MODEL ====================
+from .baseModel import BaseModel
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
+
+class TableVersion(BaseModel):
+    """
+    Model untuk tabel table_versions: nomor versi per tabel yang dinaikkan
+    oleh setiap operasi tulis, di dalam transaksi yang sama dengan operasi
+    tulisnya, beserta waktu perubahan terakhirnya (UTC). Dipakai SharedCache
+    untuk mengetahui kapan hasil cache basi, dan HTTP API untuk ETag dan
+    Last-Modified.
+    """
+
+    PARTICIPANTS = 'participants'
+    COURSES = 'courses'
+    ENROLLMENTS = 'enrollments'
+
+    def bump(self, *tables: str) -> bool:
+        """
+        Menaikkan versi tabel.
+
+        Args:
+            tables: Nama tabel yang berubah (PARTICIPANTS, COURSES, ENROLLMENTS)
+
+        Returns:
+            bool: True jika berhasil, False jika gagal
+        """
+        placeholders = ", ".join(["%s"] * len(tables))
+        query = f"""
+        UPDATE table_versions SET version = version + 1, updated_at = %s
+        WHERE table_name IN ({placeholders})
+        """
+        # Waktu UTC dari aplikasi, sama untuk MySQL (zona waktu sesi) dan SQLite
+        now = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+        return self._execute(query, (now,) + tables)
+
+    def get_versions(self) -> Dict[str, int]:
+        """
+        Mengambil versi semua tabel dalam satu query (tabelnya hanya beberapa baris).
+
+        Returns:
+            Dict[str, int]: Nama tabel -> versi
+        """
+        rows = self._fetch_all("SELECT table_name, version FROM table_versions")
+        return {row['table_name']: int(row['version']) for row in rows}
+
+    def get_stamps(self) -> Dict[str, Tuple[int, Optional[datetime]]]:
+        """
+        Mengambil versi dan waktu perubahan terakhir semua tabel dalam satu query.
+
+        Returns:
+            Dict[str, Tuple[int, Optional[datetime]]]: Nama tabel -> (versi, updated_at UTC)
+        """
+        rows = self._fetch_all("SELECT table_name, version, updated_at FROM table_versions")
+        return {row['table_name']: (int(row['version']), row['updated_at']) for row in rows}
+
+
+# Baris awal table_versions, dipakai oleh migrasi skema
+SEED_TABLE_VERSIONS = """
+INSERT IGNORE INTO table_versions (table_name, version)
+VALUES ('participants', 0), ('courses', 0)
+"""
@@ -0,0 +1,180 @@
+# ==================== QUERY MONITOR CLASS ====================
+
+import logging
+import math
+import os
+import re
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+logger = logging.getLogger("skillhub.query")
+
+_COMMENT = re.compile(r"--[^\n]*|/\*.*?\*/", re.S)
+_STRING = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%s|\?")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_VALUES_LIST = re.compile(r"(\(\s*\?(?:\s*,\s*\?)*\s*\))(?:\s*,\s*\(\s*\?(?:\s*,\s*\?)*\s*\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(query: str) -> str:
+    """
+    Menormalkan SQL menjadi fingerprint: literal dan placeholder diganti '?',
+    daftar IN/VALUES dipadatkan, spasi dirapikan, huruf dikecilkan.
+
+    Args:
+        query: SQL query string
+
+    Returns:
+        str: Fingerprint query
+    """
+    text = _COMMENT.sub(" ", query)
+    text = _STRING.sub("?", text)
+    text = _NUMBER.sub("?", text)
+    text = _PLACEHOLDER.sub("?", text)
+    text = _VALUES_LIST.sub(r"\1, ...", text)
+    text = _IN_LIST.sub("(?+)", text)
+    return _WHITESPACE.sub(" ", text).strip().lower()
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    """Percentile nearest-rank dari list yang sudah terurut."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class QueryMonitor:
+    """
+    Mencatat waktu eksekusi setiap query: agregat per fingerprint
+    (jumlah, p50/p95/max) dan log query lambat. Aman dipakai antar thread.
+    """
+
+    def __init__(self, slow_threshold: float = 0.2, slow_log_size: int = 100,
+                 sample_size: int = 1000):
+        """
+        Inisialisasi monitor.
+
+        Args:
+            slow_threshold: Batas (detik) sebuah query dianggap lambat
+            slow_log_size: Jumlah maksimum entri log query lambat yang disimpan
+            sample_size: Jumlah durasi terakhir per fingerprint untuk menghitung percentile
+        """
+        self.slow_threshold = slow_threshold
+        self.sample_size = sample_size
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict] = {}
+        self._slow_log: Deque[Dict] = deque(maxlen=slow_log_size)
+
+    def record(self, query: str, duration: float, rows: int = 0,
+               error: Optional[BaseException] = None):
+        """
+        Mencatat satu eksekusi query.
+
+        Args:
+            query: SQL query string
+            duration: Durasi eksekusi (detik)
+            rows: Jumlah baris yang dikembalikan atau terpengaruh
+            error: Exception jika query gagal (optional)
+        """
+        key = fingerprint(query)
+        error_class = type(error).__name__ if error is not None else None
+
+        with self._lock:
+            stat = self._stats.get(key)
+            if stat is None:
+                stat = {
+                    'count': 0, 'errors': 0, 'rows': 0, 'total': 0.0, 'max': 0.0,
+                    'samples': deque(maxlen=self.sample_size), 'last_error': None,
+                }
+                self._stats[key] = stat
+            stat['count'] += 1
+            stat['rows'] += max(rows or 0, 0)
+            stat['total'] += duration
+            stat['max'] = max(stat['max'], duration)
+            stat['samples'].append(duration)
+            if error_class:
+                stat['errors'] += 1
+                stat['last_error'] = error_class
+
+            if duration >= self.slow_threshold:
+                self._slow_log.append({
+                    'waktu': time.time(),
+                    'fingerprint': key,
+                    'durasi_ms': round(duration * 1000, 2),
+                    'rows': rows,
+                    'error': error_class,
+                })
+
+        if duration >= self.slow_threshold:
+            logger.warning("Query lambat (%.1f ms, %s baris): %s", duration * 1000, rows, key)
+
+    def top(self, limit: int = 10, order_by: str = 'total_ms') -> List[Dict]:
+        """
+        Mengambil fingerprint dengan biaya terbesar.
+
+        Args:
+            limit: Jumlah fingerprint yang dikembalikan
+            order_by: Kolom pengurutan (total_ms, p95_ms, max_ms, count)
+
+        Returns:
+            List[Dict]: fingerprint, count, errors, rows, total_ms, p50_ms, p95_ms, max_ms
+        """
+        with self._lock:
+            items = [(key, dict(stat), sorted(stat['samples'])) for key, stat in self._stats.items()]
+
+        result = []
+        for key, stat, samples in items:
+            result.append({
+                'fingerprint': key,
+                'count': stat['count'],
+                'errors': stat['errors'],
+                'last_error': stat['last_error'],
+                'rows': stat['rows'],
+                'total_ms': round(stat['total'] * 1000, 2),
+                'p50_ms': round(_percentile(samples, 0.50) * 1000, 2),
+                'p95_ms': round(_percentile(samples, 0.95) * 1000, 2),
+                'max_ms': round(stat['max'] * 1000, 2),
+            })
+        result.sort(key=lambda r: r[order_by], reverse=True)
+        return result[:limit]
+
+    def slow_queries(self) -> List[Dict]:
+        """
+        Mengambil log query lambat, terbaru lebih dulu.
+
+        Returns:
+            List[Dict]: waktu, fingerprint, durasi_ms, rows, error
+        """
+        with self._lock:
+            return list(reversed(self._slow_log))
+
+    def reset(self):
+        """Menghapus semua statistik dan log query lambat."""
+        with self._lock:
+            self._stats.clear()
+            self._slow_log.clear()
+
+
+_default_monitor: Optional[QueryMonitor] = None
+_default_lock = threading.Lock()
+
+
+def get_default_monitor() -> QueryMonitor:
+    """
+    Mengambil monitor bersama untuk satu proses. Batas query lambat diatur
+    lewat environment variable DB_SLOW_QUERY_MS (default 200).
+
+    Returns:
+        QueryMonitor: Monitor bersama
+    """
+    global _default_monitor
+    with _default_lock:
+        if _default_monitor is None:
+            threshold_ms = float(os.getenv("DB_SLOW_QUERY_MS", "200"))
+            _default_monitor = QueryMonitor(slow_threshold=threshold_ms / 1000)
+        return _default_monitor
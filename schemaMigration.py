@@ -0,0 +1,504 @@
+"""
+Migrasi skema database SkillHub berbasis versi.
+
+Jalankan dari command line:
+    python schemaMigration.py            # terapkan migrasi yang belum dijalankan
+    python schemaMigration.py --status   # tampilkan versi skema saat ini
+"""
+
+import argparse
+import threading
+from datetime import datetime
+from typing import List, Optional, Union
+
+from databaseConnection import DatabaseConnection
+from models.statCounter import RECOMPUTE_TOTALS, RECOMPUTE_COURSE_ENROLLMENTS
+from models.tableVersion import SEED_TABLE_VERSIONS
+
+
+class GuardedStatement:
+    """
+    Statement migrasi yang hanya dijalankan jika query when mengembalikan baris,
+    untuk DDL MySQL yang tidak transaksional: migrasi yang terhenti di tengah
+    bisa diulang dan melewati langkah yang sudah diterapkan.
+    """
+
+    def __init__(self, statement: str, when: str):
+        """
+        Inisialisasi statement bersyarat.
+
+        Args:
+            statement: Statement SQL yang dijalankan
+            when: Query SELECT; statement dijalankan hanya jika hasilnya tidak kosong
+        """
+        self.statement = statement
+        self.when = when
+
+    def __str__(self) -> str:
+        return self.statement
+
+
+class Migration:
+    """
+    Satu langkah perubahan skema dengan nomor versi yang berurutan.
+    """
+
+    def __init__(self, version: int, description: str,
+                 statements: List[Union[str, GuardedStatement]],
+                 sqlite_statements: Optional[List[str]] = None):
+        """
+        Inisialisasi migrasi.
+
+        Args:
+            version: Nomor versi skema setelah migrasi diterapkan
+            description: Keterangan singkat perubahan
+            statements: Daftar statement SQL (MySQL) yang dijalankan berurutan
+            sqlite_statements: Statement pengganti untuk SQLite jika DDL-nya berbeda (optional)
+        """
+        self.version = version
+        self.description = description
+        self.statements = statements
+        self.sqlite_statements = sqlite_statements
+
+    def statements_for(self, dialect: str) -> List[Union[str, GuardedStatement]]:
+        """
+        Mengambil statement migrasi untuk dialek backend.
+
+        Args:
+            dialect: Dialek SQL koneksi ('mysql' atau 'sqlite')
+
+        Returns:
+            List[Union[str, GuardedStatement]]: Statement yang dijalankan berurutan
+        """
+        if dialect == 'sqlite' and self.sqlite_statements is not None:
+            return self.sqlite_statements
+        return self.statements
+
+
+# Foreign key enrollments yang masih tanpa ON DELETE CASCADE (MySQL)
+_ENROLLMENT_FKS = """
+SELECT 1 FROM information_schema.REFERENTIAL_CONSTRAINTS
+WHERE CONSTRAINT_SCHEMA = DATABASE() AND TABLE_NAME = 'enrollments'
+  AND CONSTRAINT_NAME IN ('enrollments_ibfk_1', 'enrollments_ibfk_2')
+"""
+
+
+def _missing_index(table: str, index: str) -> str:
+    """Query syarat GuardedStatement: mengembalikan baris jika index belum ada (MySQL)."""
+    return f"""
+    SELECT 1 AS missing FROM DUAL WHERE NOT EXISTS (
+        SELECT 1 FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = '{table}' AND INDEX_NAME = '{index}'
+    )
+    """
+
+
+def _missing_column(table: str, column: str) -> str:
+    """Query syarat GuardedStatement: mengembalikan baris jika kolom belum ada (MySQL)."""
+    return f"""
+    SELECT 1 AS missing FROM DUAL WHERE NOT EXISTS (
+        SELECT 1 FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = '{table}' AND COLUMN_NAME = '{column}'
+    )
+    """
+
+
+# ==================== DAFTAR MIGRASI ====================
+MIGRATIONS: List[Migration] = [
+    Migration(1, "Skema awal: participants, courses, enrollments", [
+        """
+        CREATE TABLE IF NOT EXISTS participants (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            nama VARCHAR(100) NOT NULL,
+            email VARCHAR(100) UNIQUE NOT NULL,
+            no_telp VARCHAR(20),
+            alamat TEXT,
+            tanggal_daftar DATETIME,
+            INDEX idx_email (email)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS courses (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            nama_kelas VARCHAR(100) NOT NULL,
+            deskripsi TEXT,
+            instruktur VARCHAR(100),
+            tanggal_dibuat DATETIME,
+            INDEX idx_nama_kelas (nama_kelas)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS enrollments (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            participant_id INT NOT NULL,
+            course_id INT NOT NULL,
+            tanggal_daftar DATETIME,
+            CONSTRAINT enrollments_ibfk_1 FOREIGN KEY (participant_id) REFERENCES participants(id),
+            CONSTRAINT enrollments_ibfk_2 FOREIGN KEY (course_id) REFERENCES courses(id),
+            UNIQUE KEY unique_enrollment (participant_id, course_id),
+            INDEX idx_participant (participant_id),
+            INDEX idx_course (course_id)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+        """,
+    ], sqlite_statements=[
+        """
+        CREATE TABLE IF NOT EXISTS participants (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nama VARCHAR(100) NOT NULL,
+            email VARCHAR(100) UNIQUE NOT NULL,
+            no_telp VARCHAR(20),
+            alamat TEXT,
+            tanggal_daftar DATETIME
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS courses (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nama_kelas VARCHAR(100) NOT NULL,
+            deskripsi TEXT,
+            instruktur VARCHAR(100),
+            tanggal_dibuat DATETIME
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_nama_kelas ON courses (nama_kelas)",
+        """
+        CREATE TABLE IF NOT EXISTS enrollments (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            participant_id INT NOT NULL,
+            course_id INT NOT NULL,
+            tanggal_daftar DATETIME,
+            CONSTRAINT enrollments_ibfk_1 FOREIGN KEY (participant_id) REFERENCES participants(id),
+            CONSTRAINT enrollments_ibfk_2 FOREIGN KEY (course_id) REFERENCES courses(id),
+            CONSTRAINT unique_enrollment UNIQUE (participant_id, course_id)
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_participant ON enrollments (participant_id)",
+        "CREATE INDEX IF NOT EXISTS idx_course ON enrollments (course_id)",
+    ]),
+    Migration(2, "Index keyset pagination pendaftaran (tanggal_daftar, id)", [
+        "ALTER TABLE enrollments ADD INDEX idx_tanggal_daftar (tanggal_daftar, id)",
+    ], sqlite_statements=[
+        "CREATE INDEX IF NOT EXISTS idx_tanggal_daftar ON enrollments (tanggal_daftar, id)",
+    ]),
+    Migration(3, "Tabel stat_counters untuk metrik dashboard", [
+        """
+        CREATE TABLE IF NOT EXISTS stat_counters (
+            scope VARCHAR(32) NOT NULL,
+            scope_id INT NOT NULL DEFAULT 0,
+            counter_value BIGINT NOT NULL DEFAULT 0,
+            PRIMARY KEY (scope, scope_id)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+        """,
+        RECOMPUTE_TOTALS,
+        RECOMPUTE_COURSE_ENROLLMENTS,
+    ], sqlite_statements=[
+        """
+        CREATE TABLE IF NOT EXISTS stat_counters (
+            scope VARCHAR(32) NOT NULL,
+            scope_id INT NOT NULL DEFAULT 0,
+            counter_value BIGINT NOT NULL DEFAULT 0,
+            PRIMARY KEY (scope, scope_id)
+        )
+        """,
+        RECOMPUTE_TOTALS,
+        RECOMPUTE_COURSE_ENROLLMENTS,
+    ]),
+    Migration(4, "Tabel table_versions untuk cache lintas sesi", [
+        """
+        CREATE TABLE IF NOT EXISTS table_versions (
+            table_name VARCHAR(64) PRIMARY KEY,
+            version BIGINT NOT NULL DEFAULT 0
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+        """,
+        SEED_TABLE_VERSIONS,
+    ], sqlite_statements=[
+        """
+        CREATE TABLE IF NOT EXISTS table_versions (
+            table_name VARCHAR(64) PRIMARY KEY,
+            version BIGINT NOT NULL DEFAULT 0
+        )
+        """,
+        SEED_TABLE_VERSIONS,
+    ]),
+    Migration(5, "Index pencarian peserta dan kelas (awalan dan FULLTEXT)", [
+        # Setiap index dibuat terpisah dan dilewati jika sudah ada, agar migrasi
+        # yang terhenti di tengah (DDL MySQL langsung commit) bisa diulang
+        GuardedStatement("ALTER TABLE participants ADD INDEX idx_nama (nama)",
+                         when=_missing_index("participants", "idx_nama")),
+        GuardedStatement("ALTER TABLE participants ADD FULLTEXT INDEX ft_participants (nama, email)",
+                         when=_missing_index("participants", "ft_participants")),
+        GuardedStatement("ALTER TABLE courses ADD FULLTEXT INDEX ft_courses (nama_kelas, deskripsi)",
+                         when=_missing_index("courses", "ft_courses")),
+    ], sqlite_statements=[
+        # LIKE tanpa membedakan huruf besar/kecil hanya memakai index NOCASE
+        "CREATE INDEX IF NOT EXISTS idx_nama ON participants (nama COLLATE NOCASE)",
+        "CREATE INDEX IF NOT EXISTS idx_email_nocase ON participants (email COLLATE NOCASE)",
+        "CREATE INDEX IF NOT EXISTS idx_nama_kelas_nocase ON courses (nama_kelas COLLATE NOCASE)",
+    ]),
+    Migration(6, "ON DELETE CASCADE pada foreign key enrollments", [
+        # Constraint dengan nama yang sama tidak bisa dihapus dan dibuat dalam satu ALTER.
+        # DDL MySQL langsung commit, jadi setiap langkah memeriksa keadaan foreign key
+        # agar migrasi yang terhenti di antara dua ALTER bisa dilanjutkan
+        GuardedStatement(
+            "ALTER TABLE enrollments DROP FOREIGN KEY enrollments_ibfk_1, DROP FOREIGN KEY enrollments_ibfk_2",
+            when=_ENROLLMENT_FKS + " AND DELETE_RULE <> 'CASCADE' LIMIT 1",
+        ),
+        GuardedStatement(
+            """
+            ALTER TABLE enrollments
+                ADD CONSTRAINT enrollments_ibfk_1 FOREIGN KEY (participant_id)
+                    REFERENCES participants(id) ON DELETE CASCADE,
+                ADD CONSTRAINT enrollments_ibfk_2 FOREIGN KEY (course_id)
+                    REFERENCES courses(id) ON DELETE CASCADE
+            """,
+            when=f"SELECT 1 AS missing FROM DUAL WHERE NOT EXISTS ({_ENROLLMENT_FKS})",
+        ),
+    ], sqlite_statements=[
+        # Seluruh migrasi berjalan dalam satu transaksi (DDL SQLite transaksional),
+        # sehingga tabel lama tidak pernah hilang sebelum tabel baru menggantikannya
+        # SQLite tidak bisa mengubah foreign key, tabel dibangun ulang
+        "DROP TABLE IF EXISTS enrollments_new",
+        """
+        CREATE TABLE enrollments_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            participant_id INT NOT NULL,
+            course_id INT NOT NULL,
+            tanggal_daftar DATETIME,
+            CONSTRAINT enrollments_ibfk_1 FOREIGN KEY (participant_id)
+                REFERENCES participants(id) ON DELETE CASCADE,
+            CONSTRAINT enrollments_ibfk_2 FOREIGN KEY (course_id)
+                REFERENCES courses(id) ON DELETE CASCADE,
+            CONSTRAINT unique_enrollment UNIQUE (participant_id, course_id)
+        )
+        """,
+        """
+        INSERT INTO enrollments_new (id, participant_id, course_id, tanggal_daftar)
+        SELECT id, participant_id, course_id, tanggal_daftar FROM enrollments
+        """,
+        "DROP TABLE enrollments",
+        "ALTER TABLE enrollments_new RENAME TO enrollments",
+        "CREATE INDEX IF NOT EXISTS idx_participant ON enrollments (participant_id)",
+        "CREATE INDEX IF NOT EXISTS idx_course ON enrollments (course_id)",
+        "CREATE INDEX IF NOT EXISTS idx_tanggal_daftar ON enrollments (tanggal_daftar, id)",
+    ]),
+    Migration(7, "Waktu perubahan di table_versions dan versi tabel enrollments", [
+        # Statement berikutnya idempotent; hanya ALTER yang perlu dilewati saat diulang
+        GuardedStatement("ALTER TABLE table_versions ADD COLUMN updated_at DATETIME NULL",
+                         when=_missing_column("table_versions", "updated_at")),
+        "INSERT IGNORE INTO table_versions (table_name, version) VALUES ('enrollments', 0)",
+        "UPDATE table_versions SET updated_at = UTC_TIMESTAMP() WHERE updated_at IS NULL",
+    ], sqlite_statements=[
+        "ALTER TABLE table_versions ADD COLUMN updated_at DATETIME",
+        "INSERT IGNORE INTO table_versions (table_name, version) VALUES ('enrollments', 0)",
+        # CURRENT_TIMESTAMP di SQLite selalu UTC
+        "UPDATE table_versions SET updated_at = CURRENT_TIMESTAMP WHERE updated_at IS NULL",
+    ]),
+]
+
+
+class SchemaMigrator:
+    """
+    Menjalankan migrasi yang belum diterapkan dan mencatat versinya
+    di tabel schema_version.
+    """
+
+    LOCK_NAME = "skillhub_schema_migration"
+    LOCK_TIMEOUT = 30
+
+    def __init__(self, db: DatabaseConnection, migrations: List[Migration] = None):
+        """
+        Inisialisasi migrator.
+
+        Args:
+            db: Instance DatabaseConnection
+            migrations: Daftar migrasi (optional, default MIGRATIONS)
+        """
+        self.db = db
+        self.migrations = sorted(migrations if migrations is not None else MIGRATIONS,
+                                 key=lambda m: m.version)
+
+    def ensure_version_table(self) -> bool:
+        """
+        Membuat tabel schema_version jika belum ada.
+
+        Returns:
+            bool: True jika berhasil, False jika gagal
+        """
+        query = """
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INT PRIMARY KEY,
+            deskripsi VARCHAR(255),
+            applied_at DATETIME
+        )
+        """
+        if self.db.dialect == 'mysql':
+            query += " ENGINE=InnoDB DEFAULT CHARSET=utf8mb4"
+        return self.db.execute_query(query)
+
+    def current_version(self) -> int:
+        """
+        Mengambil versi skema yang sudah diterapkan.
+
+        Returns:
+            int: Versi tertinggi di schema_version, 0 jika belum ada
+        """
+        row = self.db.fetch_one("SELECT MAX(version) AS version FROM schema_version")
+        if row and row['version'] is not None:
+            return int(row['version'])
+        return 0
+
+    def pending(self) -> List[Migration]:
+        """
+        Mengambil migrasi yang belum diterapkan.
+
+        Returns:
+            List[Migration]: Migrasi dengan versi di atas versi saat ini
+        """
+        version = self.current_version()
+        return [m for m in self.migrations if m.version > version]
+
+    def migrate(self) -> bool:
+        """
+        Menerapkan semua migrasi yang tertunda secara berurutan.
+
+        Returns:
+            bool: True jika skema sudah versi terbaru, False jika ada yang gagal
+        """
+        # Versi skema dibaca dari primary, replika bisa tertinggal
+        with self.db.read_from_primary():
+            return self._migrate()
+
+    def _migrate(self) -> bool:
+        """Menerapkan migrasi tertunda dengan kunci GET_LOCK (MySQL)."""
+        if not self.ensure_version_table():
+            return False
+
+        latest = self.migrations[-1].version if self.migrations else 0
+        if self.current_version() >= latest:
+            return True
+
+        # SQLite tidak punya GET_LOCK; backend ini dipakai oleh satu instalasi lokal
+        if self.db.dialect != 'mysql':
+            return self._apply_pending()
+
+        # Kunci agar beberapa proses tidak menjalankan migrasi bersamaan
+        lock = self.db.fetch_one("SELECT GET_LOCK(%s, %s) AS acquired",
+                                 (self.LOCK_NAME, self.LOCK_TIMEOUT))
+        if not lock or not lock['acquired']:
+            return False
+
+        try:
+            return self._apply_pending()
+        finally:
+            self.db.fetch_one("SELECT RELEASE_LOCK(%s) AS released", (self.LOCK_NAME,))
+
+    def _apply_pending(self) -> bool:
+        """Menerapkan migrasi tertunda berurutan, berhenti pada yang gagal."""
+        for migration in self.pending():
+            if not self.apply(migration):
+                return False
+        return True
+
+    def apply(self, migration: Migration) -> bool:
+        """
+        Menerapkan satu migrasi dan mencatat versinya dalam satu transaksi.
+        Di SQLite DDL ikut di-rollback jika ada statement yang gagal; di MySQL
+        DDL langsung commit, sehingga langkah yang tidak idempotent memakai
+        GuardedStatement.
+
+        Args:
+            migration: Migrasi yang akan diterapkan
+
+        Returns:
+            bool: True jika berhasil, False jika gagal
+        """
+        query = """
+        INSERT INTO schema_version (version, deskripsi, applied_at)
+        VALUES (%s, %s, %s)
+        """
+        with self.db.transaction() as tx:
+            ok = all(self._run(statement) for statement in migration.statements_for(self.db.dialect))
+            ok = ok and self.db.execute_query(
+                query, (migration.version, migration.description, datetime.now())
+            )
+            if not ok:
+                tx.failed = True
+        return bool(ok and tx.committed)
+
+    def _run(self, statement: Union[str, GuardedStatement]) -> bool:
+        """Menjalankan satu statement migrasi, melewati GuardedStatement yang syaratnya tidak terpenuhi."""
+        if isinstance(statement, GuardedStatement):
+            needed = self.db.fetch_one(statement.when)
+            if self.db.last_error is not None:
+                return False
+            if not needed:
+                return True
+            statement = statement.statement
+        return self.db.execute_query(statement)
+
+
+# ==================== SEKALI PER PROSES ====================
+_verified = set()
+_verified_lock = threading.Lock()
+
+
+def ensure_schema(db: DatabaseConnection) -> bool:
+    """
+    Memastikan skema sudah versi terbaru, hanya dicek sekali per proses
+    untuk setiap database.
+
+    Args:
+        db: Instance DatabaseConnection
+
+    Returns:
+        bool: True jika skema sudah versi terbaru, False jika migrasi gagal
+    """
+    key = (db.host, db.database)
+    if key in _verified:
+        return True
+
+    with _verified_lock:
+        if key in _verified:
+            return True
+        if not SchemaMigrator(db).migrate():
+            return False
+        _verified.add(key)
+        return True
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point command line untuk menjalankan migrasi."""
+    parser = argparse.ArgumentParser(description="Migrasi skema database SkillHub")
+    parser.add_argument("--status", action="store_true",
+                        help="Tampilkan versi skema dan migrasi yang tertunda")
+    args = parser.parse_args(argv)
+
+    db = DatabaseConnection.from_env()
+    if db.connection is None:
+        print("Gagal terhubung ke database. Periksa konfigurasi database.")
+        return 1
+
+    try:
+        migrator = SchemaMigrator(db)
+        if not migrator.ensure_version_table():
+            print("Gagal membuat tabel schema_version.")
+            return 1
+
+        if args.status:
+            print(f"Versi skema: {migrator.current_version()}")
+            for migration in migrator.pending():
+                print(f"  tertunda: {migration.version} - {migration.description}")
+            return 0
+
+        if migrator.migrate():
+            print(f"Skema sudah versi terbaru ({migrator.current_version()}).")
+            return 0
+
+        print(f"Migrasi gagal pada versi {migrator.current_version() + 1}.")
+        return 1
+    finally:
+        db.disconnect()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,239 @@
+# ==================== SQLITE CONNECTION CLASS ====================
+"""
+Backend SQLite (file lokal, mode WAL) dengan kontrak yang sama seperti
+DatabaseConnection: execute_query / execute_many / fetch_all / fetch_one /
+iter_rows / transaction. Query model yang ditulis dalam gaya MySQL
+diterjemahkan ke dialek SQLite, dan error SQLite dipetakan ke kode error
+MySQL sehingga model berjalan tanpa perubahan.
+"""
+
+import re
+import sqlite3
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from mysql.connector import Error
+
+from databaseConnection import (DatabaseConnection, ER_DUP_ENTRY, ER_LOCK_WAIT_TIMEOUT,
+                                ER_NO_REFERENCED_ROW, ER_ROW_IS_REFERENCED)
+from queryMonitor import QueryMonitor
+
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(" "))
+sqlite3.register_converter("DATETIME", lambda raw: datetime.fromisoformat(raw.decode()))
+
+# Kolom tanggal yang dikembalikan sebagai datetime walaupun berasal dari
+# ekspresi tanpa tipe kolom (misalnya UNION ALL di Statistics)
+DATETIME_COLUMNS = {'tanggal', 'tanggal_daftar', 'tanggal_dibuat', 'applied_at'}
+
+_INSERT_IGNORE = re.compile(r"\bINSERT\s+IGNORE\b", re.I)
+_ON_DUPLICATE = re.compile(r"\bON\s+DUPLICATE\s+KEY\s+UPDATE\b", re.I)
+_VALUES_FN = re.compile(r"\bVALUES\s*\(\s*(\w+)\s*\)", re.I)
+_WRITE_STATEMENT = re.compile(r"^\s*(DELETE|UPDATE)\b", re.I)
+
+
+def translate(query: str) -> str:
+    """
+    Menerjemahkan query gaya MySQL yang dipakai model ke dialek SQLite.
+
+    Args:
+        query: SQL query string gaya MySQL
+
+    Returns:
+        str: SQL query untuk SQLite
+    """
+    query = _INSERT_IGNORE.sub("INSERT OR IGNORE", query)
+    if _ON_DUPLICATE.search(query):
+        head, update = _ON_DUPLICATE.split(query, maxsplit=1)
+        # "WHERE true" menghindari ambiguitas parser SQLite pada INSERT ... SELECT
+        if re.search(r"\bSELECT\b", head, re.I) and not re.search(r"\bGROUP\s+BY\b|\bWHERE\b", head, re.I):
+            head = head.rstrip() + " WHERE true"
+        update = _VALUES_FN.sub(r"excluded.\1", update)
+        query = f"{head} ON CONFLICT DO UPDATE SET {update}"
+    return query.replace("%s", "?")
+
+
+def _to_mysql_error(e: sqlite3.Error, query: str) -> Error:
+    """Memetakan error SQLite ke mysql.connector.Error dengan errno MySQL."""
+    message = str(e)
+    errno = None
+    if isinstance(e, sqlite3.IntegrityError):
+        if "UNIQUE" in message or "PRIMARY KEY" in message:
+            errno = ER_DUP_ENTRY
+        elif "FOREIGN KEY" in message:
+            # SQLite tidak membedakan baris induk yang hilang dan baris yang masih dirujuk
+            errno = ER_ROW_IS_REFERENCED if _WRITE_STATEMENT.match(query) else ER_NO_REFERENCED_ROW
+    elif isinstance(e, sqlite3.OperationalError) and "locked" in message:
+        # busy_timeout habis menunggu lock tulis
+        errno = ER_LOCK_WAIT_TIMEOUT
+    return Error(msg=message, errno=errno)
+
+
+class _DictCursor:
+    """Cursor SQLite yang menerjemahkan query dan mengembalikan baris sebagai dict."""
+
+    def __init__(self, connection: sqlite3.Connection):
+        self._cursor = connection.cursor()
+
+    @property
+    def rowcount(self) -> int:
+        return self._cursor.rowcount
+
+    @property
+    def lastrowid(self) -> Optional[int]:
+        return self._cursor.lastrowid
+
+    def execute(self, query: str, params: tuple = None):
+        try:
+            self._cursor.execute(translate(query), params or ())
+        except sqlite3.Error as e:
+            raise _to_mysql_error(e, query) from e
+
+    def executemany(self, query: str, seq_params: List[tuple]):
+        try:
+            self._cursor.executemany(translate(query), seq_params)
+        except sqlite3.Error as e:
+            raise _to_mysql_error(e, query) from e
+
+    def _as_dict(self, row: tuple) -> Dict:
+        result = {}
+        for column, value in zip(self._cursor.description, row):
+            name = column[0]
+            if isinstance(value, str) and name in DATETIME_COLUMNS:
+                try:
+                    value = datetime.fromisoformat(value)
+                except ValueError:
+                    pass
+            result[name] = value
+        return result
+
+    def fetchone(self) -> Optional[Dict]:
+        try:
+            row = self._cursor.fetchone()
+        except sqlite3.Error as e:
+            raise _to_mysql_error(e, "") from e
+        return self._as_dict(row) if row is not None else None
+
+    def fetchall(self) -> List[Dict]:
+        try:
+            return [self._as_dict(row) for row in self._cursor.fetchall()]
+        except sqlite3.Error as e:
+            raise _to_mysql_error(e, "") from e
+
+    def fetchmany(self, size: int) -> List[Dict]:
+        try:
+            return [self._as_dict(row) for row in self._cursor.fetchmany(size)]
+        except sqlite3.Error as e:
+            raise _to_mysql_error(e, "") from e
+
+    def close(self):
+        self._cursor.close()
+
+
+class _Connection:
+    """Pembungkus sqlite3.Connection dengan antarmuka yang dipakai DatabaseConnection."""
+
+    # Cursor SQLite selalu membaca bertahap, tidak ada sisa hasil yang perlu dibuang
+    unread_result = False
+
+    def __init__(self, path: str, busy_timeout: float):
+        self._conn = sqlite3.connect(path, timeout=busy_timeout,
+                                     detect_types=sqlite3.PARSE_DECLTYPES,
+                                     check_same_thread=False)
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+
+    def cursor(self, dictionary: bool = True, buffered: bool = True) -> _DictCursor:
+        return _DictCursor(self._conn)
+
+    def is_connected(self) -> bool:
+        return True
+
+    def ping(self, reconnect: bool = False, attempts: int = 1, delay: int = 0):
+        # File lokal tidak bisa terputus seperti koneksi jaringan
+        pass
+
+    @property
+    def in_transaction(self) -> bool:
+        return self._conn.in_transaction
+
+    def commit(self):
+        try:
+            self._conn.commit()
+        except sqlite3.Error as e:
+            raise _to_mysql_error(e, "") from e
+
+    def rollback(self):
+        try:
+            self._conn.rollback()
+        except sqlite3.Error as e:
+            raise _to_mysql_error(e, "") from e
+
+    def close(self):
+        self._conn.close()
+
+
+class SQLiteConnection(DatabaseConnection):
+    """
+    Kelas untuk mengelola koneksi ke database SQLite lokal (mode WAL),
+    untuk instalasi tanpa server MySQL.
+    """
+
+    dialect = 'sqlite'
+
+    def __init__(self, path: str, busy_timeout: float = 10.0,
+                 monitor: Optional[QueryMonitor] = None,
+                 replicas: Optional[List[DatabaseConnection]] = None,
+                 read_your_writes: float = 5.0):
+        """
+        Inisialisasi koneksi ke file SQLite.
+
+        Args:
+            path: Lokasi file database SQLite
+            busy_timeout: Batas waktu (detik) menunggu kunci tulis dari koneksi lain
+            monitor: Pencatat waktu query (optional, default monitor bersama per proses)
+            replicas: Koneksi replika untuk pembacaan (optional)
+            read_your_writes: Lama (detik) pembacaan tetap ke primary setelah menulis
+        """
+        self.busy_timeout = busy_timeout
+        super().__init__("sqlite", "", "", path, monitor=monitor, replicas=replicas,
+                         read_your_writes=read_your_writes)
+
+    def connect(self) -> bool:
+        """
+        Membuka file SQLite.
+
+        Returns:
+            bool: True jika koneksi berhasil, False jika gagal
+        """
+        if self.connection is not None:
+            return True
+        try:
+            self.connection = _Connection(self.database, self.busy_timeout)
+            self.cursor = self.connection.cursor(dictionary=True)
+            return True
+        except sqlite3.Error as e:
+            self.connection = None
+            return False
+
+    def _begin(self) -> bool:
+        """
+        Membuka transaksi secara eksplisit: sqlite3 hanya memulai transaksi
+        otomatis sebelum INSERT/UPDATE/DELETE, sehingga tanpa BEGIN statement
+        DDL dan SAVEPOINT di dalam blok transaction() langsung ter-commit.
+        """
+        if self.connection is None or self.connection.in_transaction:
+            return True
+        return self._savepoint("BEGIN")
+
+    def disconnect(self):
+        """Menutup file SQLite."""
+        for replica in self.replicas:
+            replica.disconnect()
+
+        if self.cursor:
+            self.cursor.close()
+            self.cursor = None
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
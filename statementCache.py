@@ -0,0 +1,119 @@
+# ==================== STATEMENT CACHE CLASS ====================
+
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+class StatementCache:
+    """
+    Cache prepared statement server-side untuk satu koneksi fisik, dengan
+    teks SQL sebagai key. Setiap statement memakai cursor prepared miliknya
+    sendiri sehingga hanya di-parse server sekali selama koneksi hidup;
+    statement yang paling lama tidak dipakai ditutup jika cache penuh.
+    """
+
+    def __init__(self, connection: Any, max_statements: int = 64):
+        """
+        Inisialisasi cache kosong.
+
+        Args:
+            connection: Koneksi mysql.connector tempat statement disiapkan
+            max_statements: Jumlah statement maksimum yang tetap disiapkan
+        """
+        self.connection = connection
+        self.max_statements = max_statements
+        # SQL -> (objek string SQL pertama, cursor prepared)
+        self._statements: "OrderedDict[str, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def execute(self, query: str, params: tuple) -> Any:
+        """
+        Menjalankan query sebagai prepared statement.
+
+        Args:
+            query: SQL query string dengan placeholder %s
+            params: Parameter untuk query
+
+        Returns:
+            Any: Cursor prepared (dictionary) yang berisi hasil query
+
+        Raises:
+            Error: Jika prepare atau eksekusi gagal (statement dibuang dari cache)
+        """
+        entry = self._statements.get(query)
+        if entry is None:
+            self.misses += 1
+            entry = (query, self.connection.cursor(prepared=True, dictionary=True))
+            self._statements[query] = entry
+            while len(self._statements) > self.max_statements:
+                _, (_, oldest) = self._statements.popitem(last=False)
+                self._close(oldest)
+        else:
+            self.hits += 1
+            self._statements.move_to_end(query)
+
+        # Cursor prepared hanya memakai ulang statement untuk objek string yang sama
+        sql, cursor = entry
+        try:
+            cursor.execute(sql, params)
+        except Exception:
+            self.discard(query)
+            raise
+        return cursor
+
+    def discard(self, query: str):
+        """Menutup dan membuang satu statement, misalnya setelah error."""
+        entry = self._statements.pop(query, None)
+        if entry is not None:
+            self._close(entry[1])
+
+    def close(self):
+        """Menutup semua statement."""
+        for _, cursor in self._statements.values():
+            self._close(cursor)
+        self._statements.clear()
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+    @staticmethod
+    def _close(cursor: Any):
+        """Menutup cursor tanpa melempar error."""
+        try:
+            cursor.close()
+        except Exception:
+            pass
+
+
+# ==================== CACHE PER KONEKSI ====================
+
+# Cache ikut koneksi fisik (juga saat koneksi dikembalikan ke pool) dan hilang bersamanya
+_caches: "weakref.WeakKeyDictionary[Any, StatementCache]" = weakref.WeakKeyDictionary()
+_caches_lock = threading.Lock()
+
+
+def statement_cache_for(connection: Any) -> Optional[StatementCache]:
+    """
+    Mengambil cache prepared statement milik sebuah koneksi fisik. Ukurannya
+    diatur lewat environment variable DB_PREPARED_STATEMENTS (default 64,
+    0 untuk mematikan prepared statement).
+
+    Args:
+        connection: Koneksi mysql.connector
+
+    Returns:
+        Optional[StatementCache]: Cache koneksi tersebut, atau None jika dimatikan
+    """
+    max_statements = int(os.getenv("DB_PREPARED_STATEMENTS", "64"))
+    if max_statements <= 0:
+        return None
+    with _caches_lock:
+        cache = _caches.get(connection)
+        if cache is None:
+            cache = StatementCache(connection, max_statements)
+            _caches[connection] = cache
+        return cache
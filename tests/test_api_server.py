@@ -0,0 +1,340 @@
+"""
+Unit tests for the headless HTTP API.
+"""
+
+import json
+import threading
+import time
+import http.client
+import pytest
+from unittest.mock import patch
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from apiServer import SkillHubApi, ApiServer, is_not_modified, validator_headers
+from databaseConnection import DatabaseUnavailableError, QueryTimeoutError
+from models.course import Course
+from models.tableVersion import TableVersion
+from schemaMigration import SchemaMigrator
+from sqliteConnection import SQLiteConnection
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    #Fixture for a migrated SQLite database file
+    path = str(tmp_path / "skillhub.db")
+    db = SQLiteConnection(path)
+    SchemaMigrator(db).migrate()
+    db.disconnect()
+    return path
+
+
+@pytest.fixture
+def api(db_path):
+    #Fixture for the API with one SQLite connection per request
+    return SkillHubApi(lambda: SQLiteConnection(db_path))
+
+
+class TestParticipantEndpoints:
+    #Test /participants endpoints
+
+    def test_create_and_get(self, api):
+        #Test a created participant can be read back
+        status, _ = api.handle("POST", "/participants", {}, {'nama': "John", 'email': "john@example.com"})
+        status_get, participant = api.handle("GET", "/participants/1", {})
+
+        assert status == 201
+        assert status_get == 200
+        assert participant['email'] == "john@example.com"
+
+    def test_create_validation(self, api):
+        #Test missing required fields give 400
+        status, payload = api.handle("POST", "/participants", {}, {'nama': "John"})
+
+        assert status == 400
+        assert "email" in payload['error']
+
+    def test_create_duplicate_email(self, api):
+        #Test duplicate email gives 409
+        body = {'nama': "John", 'email': "john@example.com"}
+        api.handle("POST", "/participants", {}, body)
+
+        status, _ = api.handle("POST", "/participants", {}, body)
+
+        assert status == 409
+
+    def test_get_missing(self, api):
+        #Test unknown participant gives 404
+        status, _ = api.handle("GET", "/participants/99", {})
+
+        assert status == 404
+
+    def test_list_pages_with_cursor(self, api):
+        #Test keyset pagination via after_id
+        for i in range(3):
+            api.handle("POST", "/participants", {}, {'nama': f"P{i}", 'email': f"p{i}@example.com"})
+
+        _, first = api.handle("GET", "/participants", {'limit': "2"})
+        _, second = api.handle("GET", "/participants", {'limit': "2", 'after_id': str(first['next'])})
+
+        assert [p['nama'] for p in first['data']] == ["P0", "P1"]
+        assert [p['nama'] for p in second['data']] == ["P2"]
+        assert second['next'] is None
+
+    def test_invalid_limit(self, api):
+        #Test non-numeric limit gives 400
+        status, _ = api.handle("GET", "/participants", {'limit': "abc"})
+
+        assert status == 400
+
+    def test_update_and_delete(self, api):
+        #Test update returns the new record and delete removes it
+        api.handle("POST", "/participants", {}, {'nama': "John", 'email': "john@example.com"})
+
+        status, updated = api.handle("PUT", "/participants/1", {}, {'nama': "Johnny", 'email': "john@example.com"})
+        status_delete, _ = api.handle("DELETE", "/participants/1", {})
+        status_get, _ = api.handle("GET", "/participants/1", {})
+
+        assert status == 200
+        assert updated['nama'] == "Johnny"
+        assert status_delete == 200
+        assert status_get == 404
+
+
+class TestEnrollmentEndpoints:
+    #Test /enrollments and roster endpoints
+
+    @pytest.fixture
+    def seeded(self, api):
+        #Fixture for one participant and one course
+        api.handle("POST", "/participants", {}, {'nama': "John", 'email': "john@example.com"})
+        api.handle("POST", "/courses", {}, {'nama_kelas': "Python", 'instruktur': "Budi"})
+        return api
+
+    def test_enroll_and_roster(self, seeded):
+        #Test enrollment shows up in both directions
+        status, payload = seeded.handle("POST", "/enrollments", {}, {'participant_id': 1, 'course_id': 1})
+        _, roster = seeded.handle("GET", "/courses/1/participants", {})
+        _, courses = seeded.handle("GET", "/participants/1/courses", {})
+
+        assert status == 201
+        assert payload['status'] == "created"
+        assert [p['nama'] for p in roster['data']] == ["John"]
+        assert [c['nama_kelas'] for c in courses['data']] == ["Python"]
+
+    def test_enroll_status_codes(self, seeded):
+        #Test duplicate and unknown references map to 409 and 404
+        seeded.handle("POST", "/enrollments", {}, {'participant_id': 1, 'course_id': 1})
+
+        duplicate, _ = seeded.handle("POST", "/enrollments", {}, {'participant_id': 1, 'course_id': 1})
+        unknown, _ = seeded.handle("POST", "/enrollments", {}, {'participant_id': 1, 'course_id': 9})
+        invalid, _ = seeded.handle("POST", "/enrollments", {}, {'participant_id': "x"})
+
+        assert duplicate == 409
+        assert unknown == 404
+        assert invalid == 400
+
+    def test_list_and_delete(self, seeded):
+        #Test enrollments list and delete
+        seeded.handle("POST", "/enrollments", {}, {'participant_id': 1, 'course_id': 1})
+
+        _, page = seeded.handle("GET", "/enrollments", {'limit': "1"})
+        status, _ = seeded.handle("DELETE", "/enrollments/1/1", {})
+        missing, _ = seeded.handle("DELETE", "/enrollments/1/1", {})
+
+        assert len(page['data']) == 1
+        assert page['next'] is None
+        assert status == 200
+        assert missing == 404
+
+    def test_routing_errors(self, seeded):
+        #Test unknown path gives 404 and wrong method gives 405
+        assert seeded.handle("GET", "/unknown", {})[0] == 404
+        assert seeded.handle("PATCH", "/courses/1", {})[0] == 405
+
+
+class TestConditionalGet:
+    #Test validator helpers
+
+    def test_validator_headers(self):
+        #Test Last-Modified is only sent when known
+        now = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+        assert validator_headers('"1"', now) == {
+            'ETag': '"1"', 'Cache-Control': "no-cache", 'Last-Modified': format_datetime(now, usegmt=True)
+        }
+        assert 'Last-Modified' not in validator_headers('"1"', None)
+
+    def test_validators_from_table_versions(self, api):
+        #Test validators come from persisted versions, identical across API instances
+        api.handle("POST", "/courses", {}, {'nama_kelas': "Python"})
+
+        _, _, first = api.dispatch("GET", "/courses", {})
+        _, _, second = SkillHubApi(api.connect).dispatch("GET", "/courses", {})
+        _, _, detail = api.dispatch("GET", "/courses/1", {})
+
+        assert first == second
+        assert first['ETag'] == detail['ETag'] == '"1"'
+        assert first['Last-Modified']
+
+    def test_not_modified_skips_data_query(self, api):
+        #Test a matching If-None-Match is answered without running the handler query
+        api.handle("POST", "/courses", {}, {'nama_kelas': "Python"})
+        _, _, validators = api.dispatch("GET", "/courses", {})
+
+        with patch('apiServer.Course.get_page') as get_page:
+            status, payload, headers = api.dispatch(
+                "GET", "/courses", {}, headers={'If-None-Match': validators['ETag']}
+            )
+
+        assert (status, payload) == (304, None)
+        assert headers['ETag'] == validators['ETag']
+        get_page.assert_not_called()
+
+    def test_enrollment_write_changes_validator(self, api):
+        #Test enrolling bumps the enrollments version used by roster and list ETags
+        api.handle("POST", "/participants", {}, {'nama': "John", 'email': "john@example.com"})
+        api.handle("POST", "/courses", {}, {'nama_kelas': "Python"})
+        _, _, before = api.dispatch("GET", "/courses/1/participants", {})
+
+        api.handle("POST", "/enrollments", {}, {'participant_id': 1, 'course_id': 1})
+        _, _, after = api.dispatch("GET", "/courses/1/participants", {})
+
+        assert before['ETag'] != after['ETag']
+
+    def test_stamp_and_data_from_same_snapshot(self, api):
+        #Test a write between the stamp read and the data query cannot pair an old ETag with new data
+        api.handle("POST", "/courses", {}, {'nama_kelas': "Python"})
+        get_stamps = TableVersion.get_stamps
+
+        def write_after_stamp(model):
+            stamps = get_stamps(model)
+            other = api.connect()
+            try:
+                assert Course(other).create("Java", "", "Sari")
+            finally:
+                other.disconnect()
+            return stamps
+
+        with patch.object(TableVersion, 'get_stamps', write_after_stamp):
+            status, payload, validators = api.dispatch("GET", "/courses", {})
+        _, fresh, latest = api.dispatch("GET", "/courses", {})
+
+        assert status == 200
+        assert [c['nama_kelas'] for c in payload['data']] == ["Python"]
+        assert validators['ETag'] == '"1"'
+        assert [c['nama_kelas'] for c in fresh['data']] == ["Python", "Java"]
+        assert latest['ETag'] == '"2"'
+
+    def test_unexpected_error_gives_json_500(self, api):
+        #Test an unhandled handler exception still produces a response
+        with patch('apiServer.Course.get_page', side_effect=RuntimeError("bug")):
+            status, payload, headers = api.dispatch("GET", "/courses", {})
+
+        assert status == 500
+        assert payload == {'error': "Terjadi kesalahan pada server"}
+        assert headers == {}
+
+    def test_is_not_modified(self):
+        #Test If-None-Match takes precedence over If-Modified-Since
+        now = datetime.now(timezone.utc).replace(microsecond=0)
+        since = format_datetime(now, usegmt=True)
+
+        assert is_not_modified({'If-None-Match': 'W/"a", "b"'}, '"a"', now)
+        assert not is_not_modified({'If-None-Match': '"b"', 'If-Modified-Since': since}, '"a"', now)
+        assert is_not_modified({'If-Modified-Since': since}, '"a"', now)
+        assert not is_not_modified({}, '"a"', now)
+
+
+class TestApiServer:
+    #Test the HTTP transport on a real socket
+
+    @pytest.fixture
+    def server(self, api):
+        #Fixture for a running server on a free port
+        server = ApiServer(("127.0.0.1", 0), api, workers=4)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+        server.server_close()
+
+    def request(self, server, method, path, body=None, headers=None):
+        conn = http.client.HTTPConnection("127.0.0.1", server.server_port, timeout=5)
+        try:
+            data = json.dumps(body).encode() if body is not None else None
+            conn.request(method, path, body=data, headers=headers or {})
+            response = conn.getresponse()
+            return response, response.read()
+        finally:
+            conn.close()
+
+    def test_etag_and_304(self, server):
+        #Test repeated GET with If-None-Match gives an empty 304
+        self.request(server, "POST", "/courses", {'nama_kelas': "Python"})
+
+        response, body = self.request(server, "GET", "/courses")
+        etag = response.getheader("ETag")
+        cached, cached_body = self.request(server, "GET", "/courses", headers={'If-None-Match': etag})
+
+        assert response.status == 200
+        assert json.loads(body)['data'][0]['nama_kelas'] == "Python"
+        assert response.getheader("Last-Modified")
+        assert cached.status == 304
+        assert cached_body == b""
+
+    def test_etag_changes_after_write(self, server):
+        #Test a write invalidates the client's copy
+        self.request(server, "POST", "/courses", {'nama_kelas': "Python"})
+        response, _ = self.request(server, "GET", "/courses")
+        etag = response.getheader("ETag")
+
+        self.request(server, "POST", "/courses", {'nama_kelas': "Java"})
+        fresh, _ = self.request(server, "GET", "/courses", headers={'If-None-Match': etag})
+
+        assert fresh.status == 200
+        assert fresh.getheader("ETag") != etag
+
+    def test_database_unavailable(self, server):
+        #Test an unreachable database gives 503 with Retry-After
+        with patch.object(SQLiteConnection, 'fetch_all',
+                          side_effect=DatabaseUnavailableError("down")):
+            response, body = self.request(server, "GET", "/courses")
+
+        assert response.status == 503
+        assert response.getheader("Retry-After") == "5"
+        assert json.loads(body) == {'error': "Database tidak tersedia"}
+
+    def test_query_timeout(self, server):
+        #Test a read cancelled by the server gives 503 instead of an empty page
+        with patch.object(SQLiteConnection, 'fetch_all',
+                          side_effect=QueryTimeoutError("timeout")):
+            response, body = self.request(server, "GET", "/courses")
+
+        assert response.status == 503
+        assert json.loads(body) == {'error': "Query melewati batas waktu"}
+
+    def test_invalid_json_body(self, server):
+        #Test malformed JSON gives 400
+        conn = http.client.HTTPConnection("127.0.0.1", server.server_port, timeout=5)
+        conn.request("POST", "/courses", body=b"{not json")
+        response = conn.getresponse()
+        conn.close()
+
+        assert response.status == 400
+
+    def test_concurrent_requests(self, server):
+        #Test several clients are served at the same time
+        self.request(server, "POST", "/courses", {'nama_kelas': "Python"})
+        statuses = []
+
+        def worker():
+            response, _ = self.request(server, "GET", "/courses/1")
+            statuses.append(response.status)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert statuses == [200] * 8
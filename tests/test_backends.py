@@ -0,0 +1,346 @@
+"""
+Behaviour tests for the models on real database backends.
+
+SQLite always runs. MySQL runs only when SKILLHUB_TEST_MYSQL_DB names a
+throwaway database (its tables are dropped), using DB_HOST/DB_USER/DB_PASSWORD.
+"""
+
+import os
+import pytest
+from datetime import datetime
+from databaseConnection import DatabaseConnection
+from models.participant import Participant
+from models.course import Course
+from models.enrollment import Enrollment, EnrollmentStatus
+from models.statCounter import StatCounter
+from models.statistics import Statistics
+from queryMonitor import QueryMonitor
+from schemaMigration import SchemaMigrator
+from sqliteConnection import SQLiteConnection
+
+MYSQL_TEST_DB = os.getenv("SKILLHUB_TEST_MYSQL_DB")
+
+
+def mysql_db():
+    #Helper: empty MySQL test database
+    db = DatabaseConnection(os.getenv("DB_HOST", "localhost"), os.getenv("DB_USER", "root"),
+                            os.getenv("DB_PASSWORD", ""), MYSQL_TEST_DB, monitor=QueryMonitor())
+    if db.connection is None:
+        pytest.fail("Tidak bisa terhubung ke database uji MySQL")
+    for table in ("enrollments", "stat_counters", "table_versions", "participants", "courses",
+                  "schema_version"):
+        db.execute_query(f"DROP TABLE IF EXISTS {table}")
+    return db
+
+
+@pytest.fixture(params=[
+    "sqlite",
+    pytest.param("mysql", marks=[
+        pytest.mark.integration,
+        pytest.mark.skipif(not MYSQL_TEST_DB, reason="SKILLHUB_TEST_MYSQL_DB tidak diatur"),
+    ]),
+])
+def db(request, tmp_path):
+    #Fixture for a migrated, empty database on each backend
+    if request.param == "sqlite":
+        connection = SQLiteConnection(str(tmp_path / "skillhub.db"), monitor=QueryMonitor())
+    else:
+        connection = mysql_db()
+    assert SchemaMigrator(connection).migrate()
+    yield connection
+    connection.disconnect()
+
+
+def participant_id(db, email):
+    #Helper: id of a participant by email
+    return db.fetch_one("SELECT id FROM participants WHERE email = %s", (email,))['id']
+
+
+def course_id(db, nama_kelas):
+    #Helper: id of a course by name
+    return db.fetch_one("SELECT id FROM courses WHERE nama_kelas = %s", (nama_kelas,))['id']
+
+
+@pytest.fixture
+def seeded(db):
+    #Fixture for two participants and two courses
+    assert Participant(db).create("John Doe", "john@example.com", "0811", "Jakarta")
+    assert Participant(db).create("Jane Doe", "jane@example.com", "0812", "Bandung")
+    assert Course(db).create("Python", "Dasar", "Budi")
+    assert Course(db).create("SQL", "Dasar", "Sari")
+    return {
+        'john': participant_id(db, "john@example.com"),
+        'jane': participant_id(db, "jane@example.com"),
+        'python': course_id(db, "Python"),
+        'sql': course_id(db, "SQL"),
+    }
+
+
+class TestParticipantBackend:
+    #Test Participant on real backends
+
+    def test_create_and_read(self, db, seeded):
+        #Test dict rows with datetime values
+        row = Participant(db).get_by_id(seeded['john'])
+
+        assert row['nama'] == "John Doe"
+        assert isinstance(row['tanggal_daftar'], datetime)
+        assert Participant(db).count() == 2
+
+    def test_duplicate_email_rejected(self, db, seeded):
+        #Test unique email constraint surfaces as ER_DUP_ENTRY
+        assert Participant(db).create("Johnny", "john@example.com", "", "") is False
+        assert db.last_error.errno == 1062
+        assert StatCounter(db).get_totals()['participants'] == 2
+
+    def test_search(self, db, seeded):
+        #Test search by id, name prefix, email prefix and word
+        model = Participant(db)
+
+        assert [p['id'] for p in model.search(str(seeded['jane']))][0] == seeded['jane']
+        assert [p['nama'] for p in model.search("jo")] == ["John Doe"]
+        assert [p['nama'] for p in model.search("jane@")] == ["Jane Doe"]
+        assert {p['nama'] for p in model.search("Doe")} == {"John Doe", "Jane Doe"}
+        assert model.search("zzz") == []
+
+    def test_bulk_create(self, db, seeded):
+        #Test bulk import skips duplicates and updates counters
+        rows = [
+            {'nama': "A", 'email': "a@example.com", 'no_telp': "", 'alamat': ""},
+            {'nama': "Dup", 'email': "john@example.com", 'no_telp': "", 'alamat': ""},
+            {'nama': "", 'email': "invalid", 'no_telp': "", 'alamat': ""},
+        ]
+
+        summary = Participant(db).bulk_create(rows)
+
+        assert summary['inserted'] == 1
+        assert summary['duplicates'] == ["john@example.com"]
+        assert summary['invalid'] == [3]
+        assert StatCounter(db).get_totals()['participants'] == 3
+
+    def test_get_page(self, db, seeded):
+        #Test keyset pagination
+        page = Participant(db).get_page(after_id=seeded['john'], limit=10)
+
+        assert [row['id'] for row in page] == [seeded['jane']]
+
+    def test_delete_with_enrollments(self, db, seeded):
+        #Test delete removes enrollments and keeps counters consistent
+        Enrollment(db).enroll_courses(seeded['john'], [seeded['python'], seeded['sql']])
+
+        assert Participant(db).delete(seeded['john'])
+
+        assert Enrollment(db).count_enrollments() == 0
+        assert StatCounter(db).get_totals() == {'participants': 1, 'courses': 2, 'enrollments': 0}
+        assert StatCounter(db).get_course_enrollments(seeded['python']) == 0
+
+
+class TestEnrollmentBackend:
+    #Test Enrollment on real backends
+
+    def test_create_outcomes(self, db, seeded):
+        #Test typed outcomes from constraint errors
+        enrollment = Enrollment(db)
+
+        assert enrollment.create(seeded['john'], seeded['python']) == EnrollmentStatus.CREATED
+        assert enrollment.create(seeded['john'], seeded['python']) == EnrollmentStatus.ALREADY_ENROLLED
+        assert enrollment.create(9999, seeded['python']) == EnrollmentStatus.UNKNOWN_PARTICIPANT
+        assert enrollment.create(seeded['john'], 9999) == EnrollmentStatus.UNKNOWN_COURSE
+        assert StatCounter(db).get_course_enrollments(seeded['python']) == 1
+
+    def test_bulk_enroll_skips_existing(self, db, seeded):
+        #Test INSERT IGNORE and counter upsert
+        enrollment = Enrollment(db)
+        enrollment.create(seeded['john'], seeded['python'])
+
+        result = enrollment.enroll_participants(seeded['python'], [seeded['john'], seeded['jane']])
+
+        assert result == {'inserted': 1, 'skipped': 1}
+        assert StatCounter(db).get_course_enrollments(seeded['python']) == 2
+        assert StatCounter(db).get_totals()['enrollments'] == 2
+
+    def test_bulk_enroll_skips_unknown_ids(self, db, seeded):
+        #Test stale ids are skipped without losing the valid pairs
+        enrollment = Enrollment(db)
+
+        by_course = enrollment.enroll_courses(seeded['john'], [seeded['python'], 9999])
+        by_participant = enrollment.enroll_participants(seeded['sql'], [9999, seeded['jane']])
+
+        assert by_course == {'inserted': 1, 'skipped': 1}
+        assert by_participant == {'inserted': 1, 'skipped': 1}
+        assert enrollment.count_enrollments() == 2
+        assert StatCounter(db).get_totals()['enrollments'] == 2
+
+    def test_enrollments_page_and_stream(self, db, seeded):
+        #Test keyset page on (tanggal_daftar, id) and streamed export
+        enrollment = Enrollment(db)
+        enrollment.enroll_courses(seeded['john'], [seeded['python'], seeded['sql']])
+
+        first = enrollment.get_enrollments_page(limit=1)
+        rest = enrollment.get_enrollments_page(after=(first[0]['tanggal_daftar'], first[0]['id']), limit=10)
+        streamed = list(enrollment.iter_all_enrollments(chunk_size=1))
+
+        assert len(first) == 1 and len(rest) == 1
+        assert {row['id'] for row in streamed} == {first[0]['id'], rest[0]['id']}
+
+    def test_delete(self, db, seeded):
+        #Test delete updates counters
+        enrollment = Enrollment(db)
+        enrollment.create(seeded['jane'], seeded['sql'])
+
+        assert enrollment.delete(seeded['jane'], seeded['sql'])
+        assert StatCounter(db).get_course_enrollments(seeded['sql']) == 0
+
+    def test_detail_loaders(self, db, seeded):
+        #Test record plus relations are loaded together, including records without any
+        enrollment = Enrollment(db)
+        enrollment.create(seeded['john'], seeded['python'])
+        enrollment.create(seeded['john'], seeded['sql'])
+
+        detail = enrollment.get_participant_detail(seeded['john'])
+        assert detail['email'] == "john@example.com"
+        assert [c['nama_kelas'] for c in detail['courses']] == ["Python", "SQL"]
+        assert enrollment.get_participant_detail(seeded['jane'])['courses'] == []
+        assert [p['nama'] for p in enrollment.get_course_detail(seeded['sql'])['participants']] == ["John Doe"]
+        assert enrollment.get_course_detail(999999) is None
+
+    def test_get_by_ids(self, db, seeded):
+        #Test batch lookup skips missing ids
+        found = Participant(db).get_by_ids([seeded['jane'], 999999, seeded['john']])
+
+        assert list(found) == [seeded['jane'], seeded['john']]
+        assert found[seeded['jane']]['nama'] == "Jane Doe"
+
+    def test_search_available(self, db, seeded):
+        #Test courses already taken are filtered out in SQL, with and without a term
+        Enrollment(db).create(seeded['john'], seeded['python'])
+        model = Course(db)
+
+        assert [c['id'] for c in model.search_available(seeded['john'])] == [seeded['sql']]
+        assert model.search_available(seeded['john'], "pyth") == []
+        assert [c['nama_kelas'] for c in model.search_available(seeded['jane'], "pyth")] == ["Python"]
+
+
+class TestBulkDeleteBackend:
+    #Test bulk deletes and cascading foreign keys on real backends
+
+    def enroll_all(self, db, seeded):
+        #Helper: enroll both participants in both courses
+        enrollment = Enrollment(db)
+        for course in (seeded['python'], seeded['sql']):
+            enrollment.enroll_participants(course, [seeded['john'], seeded['jane']])
+
+    def assert_counters_consistent(self, db):
+        #Helper: counters equal a full recount
+        counters = StatCounter(db)
+        totals = counters.get_totals()
+        courses = {row['id']: counters.get_course_enrollments(row['id'])
+                   for row in db.fetch_all("SELECT id FROM courses")}
+        assert counters.reconcile()
+        assert counters.get_totals() == totals
+        assert {cid: counters.get_course_enrollments(cid) for cid in courses} == courses
+
+    def test_participants_delete_many(self, db, seeded):
+        #Test bulk participant delete keeps counters consistent
+        self.enroll_all(db, seeded)
+
+        summary = Participant(db).delete_many([seeded['john'], seeded['jane'], 999999])
+
+        assert summary == {'deleted': 2, 'failed': 0}
+        assert StatCounter(db).get_totals() == {'participants': 0, 'courses': 2, 'enrollments': 0}
+        self.assert_counters_consistent(db)
+
+    def test_courses_delete_many(self, db, seeded):
+        #Test bulk course delete
+        self.enroll_all(db, seeded)
+
+        assert Course(db).delete_many([seeded['python']]) == {'deleted': 1, 'failed': 0}
+        assert StatCounter(db).get_totals() == {'participants': 2, 'courses': 1, 'enrollments': 2}
+        self.assert_counters_consistent(db)
+
+    def test_delete_courses_of_participant(self, db, seeded):
+        #Test removing several enrollments of one participant
+        self.enroll_all(db, seeded)
+
+        result = Enrollment(db).delete_courses(seeded['john'], [seeded['python'], seeded['sql'], 999999])
+
+        assert result == {'deleted': 2, 'failed': 0}
+        assert StatCounter(db).get_course_enrollments(seeded['python']) == 1
+        self.assert_counters_consistent(db)
+
+    def test_foreign_keys_cascade(self, db, seeded):
+        #Test deleting a parent row directly also removes its enrollments
+        self.enroll_all(db, seeded)
+
+        assert db.execute_query("DELETE FROM courses WHERE id = %s", (seeded['sql'],))
+
+        assert Enrollment(db).get_participants_by_course(seeded['sql']) == []
+        assert len(Enrollment(db).get_courses_by_participant(seeded['john'])) == 1
+
+
+class TestCourseAndStatisticsBackend:
+    #Test Course, StatCounter and Statistics on real backends
+
+    def test_course_delete(self, db, seeded):
+        #Test course delete with enrollments
+        Enrollment(db).enroll_participants(seeded['sql'], [seeded['john'], seeded['jane']])
+
+        assert Course(db).delete(seeded['sql'])
+        assert StatCounter(db).get_totals() == {'participants': 2, 'courses': 1, 'enrollments': 0}
+
+    def test_dashboard_stats(self, db, seeded):
+        #Test single UNION ALL dashboard query
+        Enrollment(db).create(seeded['john'], seeded['python'])
+
+        stats = Statistics(db).get_dashboard_stats()
+
+        assert stats['total_peserta'] == 2
+        assert stats['total_kelas'] == 2
+        assert stats['total_pendaftaran'] == 1
+        assert stats['pendaftaran_terbaru'][0]['nama_kelas'] == "Python"
+        assert isinstance(stats['peserta_terbaru'][0]['tanggal_daftar'], datetime)
+
+    def test_reconcile(self, db, seeded):
+        #Test counters rebuilt from source tables
+        db.execute_query("UPDATE stat_counters SET counter_value = 99")
+
+        assert StatCounter(db).reconcile()
+        assert StatCounter(db).get_totals() == {'participants': 2, 'courses': 2, 'enrollments': 0}
+
+    def test_transaction_rollback(self, db, seeded):
+        #Test failed statement rolls back the whole block
+        with db.transaction() as tx:
+            db.execute_query("UPDATE courses SET instruktur = %s WHERE id = %s", ("X", seeded['python']))
+            db.execute_query("INSERT INTO enrollments (participant_id, course_id) VALUES (%s, %s)",
+                             (9999, seeded['python']))
+
+        assert tx.committed is False
+        assert Course(db).get_by_id(seeded['python'])['instruktur'] == "Budi"
+
+    def test_model_writes_in_unit_of_work(self, db, seeded):
+        #Test model writes nest as savepoints and commit together
+        participants = Participant(db)
+
+        with db.transaction() as tx:
+            assert participants.create("Ani", "ani@example.com", "", "")
+            assert Enrollment(db).create(seeded['jane'], seeded['sql']) == EnrollmentStatus.CREATED
+
+        assert tx.committed is True
+        assert StatCounter(db).get_totals() == {'participants': 3, 'courses': 2, 'enrollments': 1}
+        assert StatCounter(db).reconcile()
+        assert StatCounter(db).get_totals() == {'participants': 3, 'courses': 2, 'enrollments': 1}
+
+    def test_failed_model_write_rolls_back_unit_of_work(self, db, seeded):
+        #Test a model write that returns False rolls back the whole unit of work
+        participants = Participant(db)
+        before = StatCounter(db).get_totals()
+
+        with db.transaction() as tx:
+            assert participants.create("Ani", "ani@example.com", "", "")
+            assert not participants.create("Dup", "john@example.com", "", "")
+            assert Enrollment(db).create(seeded['jane'], seeded['sql']) == EnrollmentStatus.CREATED
+
+        assert tx.failed is True
+        assert tx.committed is False
+        assert [p['email'] for p in participants.get_all()] == ["john@example.com", "jane@example.com"]
+        assert StatCounter(db).get_totals() == before
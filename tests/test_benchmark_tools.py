@@ -0,0 +1,71 @@
+"""
+Unit tests for the benchmark data generator and result comparison.
+"""
+
+import random
+import pytest
+from benchmarks.compare import compare
+from benchmarks.dataGenerator import enrollment_rows, participant_rows, generate
+from queryMonitor import QueryMonitor
+from schemaMigration import SchemaMigrator
+from sqliteConnection import SQLiteConnection
+
+
+class TestDataGenerator:
+    #Test synthetic data generator
+
+    def test_deterministic(self):
+        #Test same seed gives the same rows
+        first = list(participant_rows(50, random.Random(7)))
+        second = list(participant_rows(50, random.Random(7)))
+
+        assert first == second
+
+    def test_enrollment_pairs_unique(self):
+        #Test enrollment pairs never repeat and stay in id range
+        rows = list(enrollment_rows(500, 30, 20, random.Random(1)))
+        pairs = {(p, c) for p, c, _ in rows}
+
+        assert len(pairs) == 500
+        assert all(1 <= p <= 30 and 1 <= c <= 20 for p, c in pairs)
+
+    def test_enrollment_count_too_large(self):
+        #Test impossible scale is rejected
+        with pytest.raises(ValueError):
+            list(enrollment_rows(11, 2, 5, random.Random(1)))
+
+    def test_generate_fills_tables_and_counters(self, tmp_path):
+        #Test generate fills the SQLite database and stat_counters
+        db = SQLiteConnection(str(tmp_path / "bench.db"), monitor=QueryMonitor())
+        try:
+            SchemaMigrator(db).migrate()
+            counts = generate(db, 'tiny', seed=1)
+            total = db.fetch_one("SELECT counter_value FROM stat_counters WHERE scope = 'enrollments'")
+        finally:
+            db.disconnect()
+
+        assert counts == {'participants': 200, 'courses': 20, 'enrollments': 1000}
+        assert total['counter_value'] == 1000
+
+
+class TestCompare:
+    #Test benchmark result comparison
+
+    def result(self, **medians):
+        #Helper: build a result file body
+        return {'results': {name: {'median_ms': ms} for name, ms in medians.items()}}
+
+    def test_flags_regression_above_threshold(self):
+        #Test slower median beyond threshold is a regression
+        rows = compare(self.result(a=10.0, b=10.0), self.result(a=13.0, b=10.5), threshold=0.2)
+
+        by_name = {row['name']: row for row in rows}
+        assert by_name['a']['regression'] is True
+        assert by_name['b']['regression'] is False
+
+    def test_ignores_noise_and_new_benchmarks(self):
+        #Test tiny absolute changes and benchmarks missing from baseline are not flagged
+        rows = compare(self.result(a=0.1), self.result(a=0.3, c=5.0))
+
+        assert [row['name'] for row in rows] == ['a']
+        assert rows[0]['regression'] is False
@@ -0,0 +1,82 @@
+"""
+Unit tests for CircuitBreaker class.
+"""
+
+import pytest
+from unittest.mock import patch
+from circuitBreaker import CircuitBreaker, get_circuit_breaker
+
+
+class TestCircuitBreaker:
+    #Test CircuitBreaker state transitions
+
+    @pytest.fixture
+    def breaker(self):
+        #Fixture for breaker opening after two failures
+        return CircuitBreaker(failure_threshold=2, reset_timeout=10.0)
+
+    def test_closed_allows(self, breaker):
+        #Test a new breaker lets requests through
+        assert breaker.allow() is True
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_opens_after_threshold(self, breaker):
+        #Test consecutive failures open the circuit and reject requests
+        breaker.record_failure()
+        assert breaker.allow() is True
+
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.allow() is False
+        assert breaker.stats()['rejected'] == 1
+
+    def test_success_resets_failures(self, breaker):
+        #Test a success in between keeps the circuit closed
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.stats()['failures'] == 1
+
+    def test_half_open_trial(self, breaker):
+        #Test one trial request after reset_timeout; success closes the circuit
+        with patch('circuitBreaker.time.monotonic', return_value=100.0):
+            breaker.record_failure()
+            breaker.record_failure()
+
+        with patch('circuitBreaker.time.monotonic', return_value=111.0):
+            assert breaker.allow() is True
+            assert breaker.state == CircuitBreaker.HALF_OPEN
+            assert breaker.allow() is False
+
+            breaker.record_success()
+
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow() is True
+
+    def test_half_open_failure_reopens(self, breaker):
+        #Test a failed trial request opens the circuit again
+        with patch('circuitBreaker.time.monotonic', return_value=100.0):
+            breaker.record_failure()
+            breaker.record_failure()
+
+        with patch('circuitBreaker.time.monotonic', return_value=111.0):
+            breaker.allow()
+            breaker.record_failure()
+
+            assert breaker.state == CircuitBreaker.OPEN
+            assert breaker.allow() is False
+
+    def test_invalid_threshold(self):
+        #Test threshold below one is rejected
+        with pytest.raises(ValueError):
+            CircuitBreaker(failure_threshold=0)
+
+    def test_shared_breaker_per_key(self):
+        #Test the registry returns one breaker per key
+        first = get_circuit_breaker(('test-host', 'db'))
+
+        assert get_circuit_breaker(('test-host', 'db')) is first
+        assert get_circuit_breaker(('other-host', 'db')) is not first
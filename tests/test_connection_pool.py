@@ -0,0 +1,105 @@
+"""
+Unit tests for ConnectionPool class.
+"""
+
+import threading
+import pytest
+from unittest.mock import MagicMock, patch
+from connectionPool import ConnectionPool, PoolTimeoutError, get_shared_pool
+
+
+class TestConnectionPoolAcquire:
+    #Test ConnectionPool acquire and release
+
+    @pytest.fixture
+    def pool(self):
+        #Fixture for pool with mock connections
+        return ConnectionPool(MagicMock, max_size=2, timeout=0.05)
+
+    def test_acquire_creates_connection(self, pool):
+        #Test first acquire creates a new connection
+        conn = pool.acquire()
+
+        assert conn is not None
+        stats = pool.stats()
+        assert stats['in_use'] == 1
+        assert stats['created'] == 1
+
+    def test_release_reuses_connection(self, pool):
+        #Test released connection is reused instead of creating a new one
+        conn = pool.acquire()
+        pool.release(conn)
+
+        again = pool.acquire()
+
+        assert again is conn
+        assert pool.stats()['created'] == 1
+
+    def test_acquire_timeout_when_exhausted(self, pool):
+        #Test acquire raises when pool is full
+        pool.acquire()
+        pool.acquire()
+
+        with pytest.raises(PoolTimeoutError):
+            pool.acquire()
+
+        stats = pool.stats()
+        assert stats['waits'] == 1
+        assert stats['timeouts'] == 1
+
+    def test_waiter_gets_released_connection(self, pool):
+        #Test a waiting caller receives a connection once one is released
+        pool.timeout = 2
+        first = pool.acquire()
+        pool.acquire()
+        result = {}
+
+        waiter = threading.Thread(target=lambda: result.setdefault('conn', pool.acquire()))
+        waiter.start()
+        pool.release(first)
+        waiter.join(timeout=2)
+
+        assert result['conn'] is first
+
+    def test_discard_closes_connection(self, pool):
+        #Test discarded connection is closed and not reused
+        conn = pool.acquire()
+        pool.release(conn, discard=True)
+
+        conn.close.assert_called_once()
+        assert pool.stats()['total'] == 0
+
+    def test_idle_connection_recycled(self, pool):
+        #Test idle connection older than idle_timeout is replaced
+        pool.idle_timeout = 0
+        conn = pool.acquire()
+        pool.release(conn)
+
+        with patch('connectionPool.time.monotonic', side_effect=lambda: 10**9):
+            again = pool.acquire()
+
+        assert again is not conn
+        conn.close.assert_called_once()
+        assert pool.stats()['recycled'] == 1
+
+    def test_connect_failure_frees_slot(self, pool):
+        #Test failed connection does not leak pool capacity
+        pool.connect_fn = MagicMock(side_effect=RuntimeError("down"))
+
+        with pytest.raises(RuntimeError):
+            pool.acquire()
+
+        assert pool.stats()['total'] == 0
+        assert pool.stats()['in_use'] == 0
+
+
+class TestSharedPool:
+    #Test process-wide pool registry
+
+    def test_same_key_returns_same_pool(self):
+        #Test shared pool is created once per key
+        first = get_shared_pool(('test-shared',), MagicMock, max_size=3)
+        second = get_shared_pool(('test-shared',), MagicMock, max_size=9)
+
+        assert first is second
+        assert first.max_size == 3
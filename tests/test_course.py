@@ -27,10 +27,10 @@ class TestCourseCreate:
         )
 
         assert result is True
-        course.db.execute_query.assert_called_once()
+        course.db.transaction.assert_called_once()
 
-        # Verify query and params
-        query, params = course.db.execute_query.call_args[0]
+        # Verify query and params (first statement; the second updates stat_counters)
+        query, params = course.db.execute_query.call_args_list[0][0]
         assert "INSERT INTO courses" in query
         assert params[0] == "Python Dasar"
         assert params[1] == "Belajar Python dari nol"
@@ -119,7 +119,8 @@ class TestCourseUpdate:
 
         assert result is True
 
-        query, params = course.db.execute_query.call_args[0]
+        # First statement; the second bumps table_versions
+        query, params = course.db.execute_query.call_args_list[0][0]
         assert "UPDATE courses" in query
         assert params[0] == "Updated"
         assert params[1] == "Updated Desc"
@@ -144,11 +145,163 @@ class TestCourseDelete:
 
         assert result is True
         
-        # Should call execute_query twice: delete enrollments + delete course
-        assert course.db.execute_query.call_count == 2
+        # Enrollments, course and counters are removed in one transaction
+        course.db.transaction.assert_called_once()
+        queries = [c[0][0] for c in course.db.execute_query.call_args_list]
 
-        first_call_query, _ = course.db.execute_query.call_args_list[0][0]
-        second_call_query, _ = course.db.execute_query.call_args_list[1][0]
+        assert "DELETE FROM enrollments" in queries[0]
+        assert any("DELETE FROM courses" in q for q in queries)
+        assert any("stat_counters" in q for q in queries)
 
-        assert "DELETE FROM enrollments" in first_call_query
-        assert "DELETE FROM courses" in second_call_query
+    def test_delete_failure_stops_transaction(self, course):
+        #Test failed statement stops remaining statements
+        course.db.execute_query.return_value = False
+
+        result = course.delete(10)
+
+        assert result is False
+        assert course.db.execute_query.call_count == 1
+
+
+class TestCoursePagination:
+    #Test Course keyset pagination
+
+    @pytest.fixture
+    def course(self):
+        #fixture For Connected Database
+        mock_db = MagicMock()
+        return Course(mock_db)
+
+    def test_get_page_after_cursor(self, course):
+        #Test page query uses id cursor and limit
+        course.db.fetch_all.return_value = [{"id": 11}]
+
+        result = course.get_page(after_id=10, limit=5)
+
+        assert result == [{"id": 11}]
+        query, params = course.db.fetch_all.call_args[0]
+        assert "FROM courses WHERE id > %s" in query
+        assert params == (10, 5)
+
+    def test_count_empty(self, course):
+        #Test count falls back to 0 when query fails
+        course.db.fetch_one.return_value = None
+
+        assert course.count() == 0
+
+
+class TestCourseSearch:
+    #Test Course search method
+
+    @pytest.fixture
+    def course(self):
+        #fixture For Connected Database
+        mock_db = MagicMock()
+        mock_db.fetch_all.return_value = []
+        return Course(mock_db)
+
+    def test_search_query(self, course):
+        #Test name prefix plus FULLTEXT over name and description
+        course.search("python")
+
+        query, params = course.db.fetch_all.call_args[0]
+        assert "nama_kelas LIKE %s ESCAPE '!'" in query
+        assert "MATCH(nama_kelas, deskripsi) AGAINST (%s IN BOOLEAN MODE)" in query
+        assert "python%" in params
+        assert "+python*" in params
+
+
+class TestCourseProjection:
+    #Test Course column projection and label lookup
+
+    @pytest.fixture
+    def course(self):
+        #fixture For Connected Database
+        mock_db = MagicMock()
+        mock_db.last_error = None
+        mock_db.fetch_all.return_value = []
+        return Course(mock_db)
+
+    def test_get_all_selected_columns(self, course):
+        #Test only the requested columns are selected
+        course.get_all(columns=('id', 'nama_kelas'))
+
+        assert course.db.fetch_all.call_args[0][0].startswith("SELECT id, nama_kelas FROM courses")
+
+    def test_unknown_column_rejected(self, course):
+        #Test a column from another table raises ValueError
+        with pytest.raises(ValueError):
+            course.get_page(columns=('email',))
+
+    def test_get_labels(self, course):
+        #Test labels map id to nama_kelas
+        course.db.fetch_all.return_value = [{'id': 3, 'nama_kelas': 'Python'}]
+
+        assert course.get_labels() == {3: 'Python'}
+
+
+class TestCourseGetByIds:
+    #Test Course batch lookup by id
+
+    @pytest.fixture
+    def course(self):
+        #fixture For Connected Database
+        mock_db = MagicMock()
+        mock_db.fetch_all.return_value = [{'id': 2, 'nama_kelas': 'SQL'}]
+        return Course(mock_db)
+
+    def test_get_by_ids(self, course):
+        #Test one IN query returns an id-keyed mapping
+        assert course.get_by_ids([2]) == {2: {'id': 2, 'nama_kelas': 'SQL'}}
+        assert "FROM courses WHERE id IN (%s)" in course.db.fetch_all.call_args[0][0]
+
+
+class TestCourseSearchAvailable:
+    #Test Course search_available anti-join
+
+    @pytest.fixture
+    def course(self):
+        #fixture For Connected Database
+        mock_db = MagicMock()
+        mock_db.fetch_all.return_value = []
+        return Course(mock_db)
+
+    def test_page_without_term(self, course):
+        #Test unenrolled courses are paged by id with NOT EXISTS
+        course.search_available(7, limit=10, after_id=30)
+
+        query, params = course.db.fetch_all.call_args[0]
+        assert "WHERE id > %s AND NOT EXISTS" in query
+        assert "e.participant_id = %s AND e.course_id = courses.id" in query
+        assert params == (30, 7, 10)
+
+    def test_search_branches_filtered(self, course):
+        #Test every search branch carries the anti-join with its own parameter
+        course.search_available(7, "12", limit=5)
+
+        query, params = course.db.fetch_all.call_args[0]
+        assert query.count("NOT EXISTS") == 3
+        assert params == (12, 7, "12%", 7, 5, "+12*", 7, 5)
+
+
+class TestCourseDeleteMany:
+    #Test Course bulk delete
+
+    @pytest.fixture
+    def course(self):
+        #fixture For Connected Database
+        mock_db = MagicMock()
+        mock_db.execute_query.return_value = True
+        mock_db.rowcount = 3
+        return Course(mock_db)
+
+    def test_delete_many(self, course):
+        #Test enrollments, counters and courses are removed with IN statements
+        summary = course.delete_many([4, 5, 6])
+
+        assert summary == {'deleted': 3, 'failed': 0}
+        course.db.transaction.assert_called_once()
+        calls = course.db.execute_query.call_args_list
+        delete_courses = next(c for c in calls if "DELETE FROM courses" in c[0][0])
+        assert delete_courses[0][1] == (4, 5, 6, 6)
+        assert any("DELETE FROM stat_counters" in c[0][0] for c in calls)
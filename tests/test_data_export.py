@@ -0,0 +1,90 @@
+"""
+Unit tests for streaming data export.
+"""
+
+import io
+import json
+import pytest
+from datetime import datetime
+from unittest.mock import MagicMock
+import dataExport
+
+
+class TestWriters:
+    #Test CSV and JSON Lines writers
+
+    def rows(self):
+        #Helper: lazy rows like a streaming cursor
+        yield {'id': 1, 'nama': 'John', 'tanggal_daftar': datetime(2025, 1, 2, 3, 4)}
+        yield {'id': 2, 'nama': 'Jane', 'tanggal_daftar': None}
+
+    def test_write_csv(self):
+        #Test CSV has header from first row and one line per row
+        out = io.StringIO()
+
+        count = dataExport.write_csv(self.rows(), out)
+
+        lines = out.getvalue().splitlines()
+        assert count == 2
+        assert lines[0] == "id,nama,tanggal_daftar"
+        assert lines[1] == "1,John,2025-01-02 03:04:00"
+
+    def test_write_csv_empty(self):
+        #Test empty input still gets the header when columns are known
+        out = io.StringIO()
+
+        assert dataExport.write_csv(iter([]), out, ('id', 'nama')) == 0
+        assert out.getvalue().splitlines() == ["id,nama"]
+
+    def test_write_jsonl(self):
+        #Test JSON Lines with ISO dates
+        out = io.StringIO()
+
+        count = dataExport.write_jsonl(self.rows(), out)
+
+        lines = out.getvalue().splitlines()
+        assert count == 2
+        assert json.loads(lines[0])['tanggal_daftar'] == "2025-01-02T03:04:00"
+        assert json.loads(lines[1])['tanggal_daftar'] is None
+
+
+class TestExport:
+    #Test dataset export through the models
+
+    def test_export_enrollments_streams_rows(self):
+        #Test export uses the streaming iterator, not fetch_all
+        db = MagicMock()
+        db.iter_rows.return_value = iter([{'id': 1, 'nama_peserta': 'John'}])
+        out = io.StringIO()
+
+        count = dataExport.export(db, 'enrollments', 'jsonl', out)
+
+        assert count == 1
+        db.fetch_all.assert_not_called()
+        query = db.iter_rows.call_args[0][0]
+        assert "JOIN participants" in query
+
+    def test_export_empty_csv_has_header(self):
+        #Test an empty dataset exports the column header
+        db = MagicMock()
+        db.iter_rows.return_value = iter([])
+        out = io.StringIO()
+
+        assert dataExport.export(db, 'courses', 'csv', out) == 0
+        assert out.getvalue().splitlines()[0].split(",")[0] == "id"
+
+    def test_export_size_limit(self):
+        #Test export stops and closes the stream once max_bytes is exceeded
+        db = MagicMock()
+        rows = MagicMock()
+        rows.__iter__.return_value = iter([{'id': i, 'nama_peserta': 'x' * 50} for i in range(10)])
+        db.iter_rows.return_value = rows
+
+        with pytest.raises(dataExport.ExportTooLargeError):
+            dataExport.export(db, 'enrollments', 'jsonl', io.StringIO(), max_bytes=100)
+        rows.close.assert_called_once()
+
+    def test_unknown_dataset(self):
+        #Test invalid dataset name
+        with pytest.raises(ValueError):
+            dataExport.export(MagicMock(), 'users', 'csv', io.StringIO())
@@ -4,8 +4,11 @@ Unit tests for DatabaseConnection class.
 
 import pytest
 from unittest.mock import patch, MagicMock
-from mysql.connector import Error
-from databaseConnection import DatabaseConnection
+from mysql.connector import Error, InterfaceError, OperationalError
+from circuitBreaker import CircuitBreaker
+from databaseConnection import (CircuitOpenError, DatabaseConnection, DatabaseUnavailableError,
+                                QueryTimeoutError)
+from connectionPool import PoolTimeoutError
 
 
 class TestDatabaseConnectionInit:
@@ -102,4 +105,603 @@ class TestDatabaseConnectionQueries:
         
         result = connected_db.fetch_one("SELECT * FROM test WHERE id = %s", (1,))
         
-        assert result == expected_data
\ No newline at end of file
+        assert result == expected_data
+
+class TestDatabaseConnectionPooled:
+    #Test DatabaseConnection pooled mode
+
+    @pytest.fixture
+    def pool(self):
+        #Fixture for pool with mock connections
+        pool = MagicMock()
+        pool.acquire.return_value = MagicMock()
+        return pool
+
+    def test_connect_borrows_once(self, pool):
+        #Test pooled connect borrows a single connection per instance
+        db = DatabaseConnection('localhost', 'root', '', 'test_db', pool=pool)
+
+        assert db.connect() is True
+        pool.acquire.assert_called_once()
+
+    def test_disconnect_returns_connection(self, pool):
+        #Test pooled disconnect releases connection back to pool
+        db = DatabaseConnection('localhost', 'root', '', 'test_db', pool=pool)
+        conn = db.connection
+
+        db.disconnect()
+
+        conn.rollback.assert_called_once()
+        pool.release.assert_called_once_with(conn, discard=False)
+        assert db.connection is None
+
+    def test_connect_pool_timeout(self, pool):
+        #Test pooled connect returns False when pool is exhausted
+        pool.acquire.side_effect = PoolTimeoutError("penuh")
+
+        db = DatabaseConnection('localhost', 'root', '', 'test_db', pool=pool)
+
+        assert db.connect() is False
+
+    def test_pooled_uses_shared_pool(self):
+        #Test pooled() reuses the same pool for the same configuration
+        with patch('mysql.connector.connect', return_value=MagicMock()):
+            first = DatabaseConnection.pooled('pool-host', 'root', '', 'test_db')
+            second = DatabaseConnection.pooled('pool-host', 'root', '', 'test_db')
+
+        assert first.pool is second.pool
+        assert first.pool_stats()['in_use'] == 2
+
+
+class TestDatabaseConnectionTransaction:
+    #Test DatabaseConnection transaction context manager
+
+    @pytest.fixture
+    def connected_db(self):
+        #fixture For Connected Database
+        mock_conn = MagicMock()
+        mock_conn.is_connected.return_value = True
+
+        with patch('mysql.connector.connect', return_value=mock_conn):
+            db = DatabaseConnection('localhost', 'root', '', 'test_db')
+            return db
+
+    def test_commit_once_at_end(self, connected_db):
+        #Test statements inside transaction are committed once
+        with connected_db.transaction() as tx:
+            connected_db.execute_query("INSERT INTO a VALUES (1)")
+            connected_db.execute_query("INSERT INTO a VALUES (2)")
+
+        connected_db.connection.commit.assert_called_once()
+        assert tx.committed is True
+
+    def test_failed_statement_rolls_back(self, connected_db):
+        #Test failed statement rolls back the whole transaction
+        connected_db.cursor.execute.side_effect = [None, Error("SQL Error")]
+
+        with connected_db.transaction() as tx:
+            assert connected_db.execute_query("INSERT INTO a VALUES (1)") is True
+            assert connected_db.execute_query("INVALID SQL") is False
+
+        connected_db.connection.commit.assert_not_called()
+        connected_db.connection.rollback.assert_called_once()
+        assert tx.committed is False
+
+    def test_exception_rolls_back(self, connected_db):
+        #Test exception inside block rolls back and propagates
+        with pytest.raises(ValueError):
+            with connected_db.transaction():
+                connected_db.execute_query("INSERT INTO a VALUES (1)")
+                raise ValueError("boom")
+
+        connected_db.connection.rollback.assert_called_once()
+        connected_db.connection.commit.assert_not_called()
+
+    def test_nested_uses_savepoint(self, connected_db):
+        #Test nested block runs inside a savepoint of the outer transaction
+        with connected_db.transaction() as outer:
+            with connected_db.transaction() as inner:
+                connected_db.execute_query("INSERT INTO a VALUES (1)")
+            connected_db.connection.commit.assert_not_called()
+
+        assert inner.committed is True
+        assert outer.committed is True
+        connected_db.connection.commit.assert_called_once()
+        executed = [c[0][0] for c in connected_db.cursor.execute.call_args_list]
+        assert executed == ["SAVEPOINT sp_1", "INSERT INTO a VALUES (1)", "RELEASE SAVEPOINT sp_1"]
+
+    def test_nested_failure_fails_outer(self, connected_db):
+        #Test failed nested block is undone and the outer transaction rolls back too
+        def execute(query, params=None):
+            if query == "INVALID SQL":
+                raise Error("SQL Error")
+        connected_db.cursor.execute.side_effect = execute
+
+        with connected_db.transaction() as outer:
+            with connected_db.transaction() as inner:
+                connected_db.execute_query("INVALID SQL")
+            connected_db.execute_query("INSERT INTO a VALUES (2)")
+
+        assert inner.committed is False
+        assert outer.committed is False
+        executed = [c[0][0] for c in connected_db.cursor.execute.call_args_list]
+        assert "ROLLBACK TO SAVEPOINT sp_1" in executed
+        connected_db.connection.commit.assert_not_called()
+        connected_db.connection.rollback.assert_called_once()
+
+    def test_lost_savepoint_fails_outer(self, connected_db):
+        #Test outer transaction rolls back when the savepoint no longer exists
+        def execute(query, params=None):
+            if query in ("INVALID SQL", "ROLLBACK TO SAVEPOINT sp_1"):
+                raise Error("SQL Error")
+        connected_db.cursor.execute.side_effect = execute
+
+        with connected_db.transaction() as outer:
+            with connected_db.transaction():
+                connected_db.execute_query("INVALID SQL")
+
+        assert outer.committed is False
+        connected_db.connection.rollback.assert_called_once()
+
+    def test_nested_savepoint_names(self, connected_db):
+        #Test deeper blocks get their own savepoint
+        with connected_db.transaction():
+            with connected_db.transaction() as second:
+                with connected_db.transaction() as third:
+                    pass
+
+        assert (second.savepoint, third.savepoint) == ("sp_1", "sp_2")
+
+    def test_rowcount_recorded(self, connected_db):
+        #Test affected rows are exposed after execute_query
+        connected_db.cursor.rowcount = 4
+
+        connected_db.execute_query("DELETE FROM a")
+
+        assert connected_db.rowcount == 4
+
+
+class TestDatabaseConnectionExecuteMany:
+    #Test DatabaseConnection execute_many
+
+    @pytest.fixture
+    def connected_db(self):
+        #fixture For Connected Database
+        mock_conn = MagicMock()
+        mock_conn.is_connected.return_value = True
+
+        with patch('mysql.connector.connect', return_value=mock_conn):
+            return DatabaseConnection('localhost', 'root', '', 'test_db')
+
+    def test_execute_many_commits_once(self, connected_db):
+        #Test executemany runs all rows with a single commit
+        rows = [("A",), ("B",), ("C",)]
+        connected_db.cursor.rowcount = 3
+
+        result = connected_db.execute_many("INSERT INTO test (name) VALUES (%s)", rows)
+
+        assert result is True
+        connected_db.cursor.executemany.assert_called_once_with("INSERT INTO test (name) VALUES (%s)", rows)
+        connected_db.connection.commit.assert_called_once()
+        assert connected_db.rowcount == 3
+
+    def test_execute_many_failure(self, connected_db):
+        #Test failed executemany rolls back
+        connected_db.cursor.executemany.side_effect = Error("Duplicate entry")
+
+        result = connected_db.execute_many("INSERT INTO test (name) VALUES (%s)", [("A",)])
+
+        assert result is False
+        connected_db.connection.rollback.assert_called_once()
+
+
+class TestDatabaseConnectionLastError:
+    #Test DatabaseConnection last_error tracking
+
+    @pytest.fixture
+    def connected_db(self):
+        #fixture For Connected Database
+        mock_conn = MagicMock()
+        mock_conn.is_connected.return_value = True
+
+        with patch('mysql.connector.connect', return_value=mock_conn):
+            return DatabaseConnection('localhost', 'root', '', 'test_db')
+
+    def test_last_error_set_and_cleared(self, connected_db):
+        #Test failed statement keeps its error until the next statement
+        connected_db.cursor.execute.side_effect = [Error(msg="Duplicate", errno=1062), None]
+
+        assert connected_db.execute_query("INSERT") is False
+        assert connected_db.last_error.errno == 1062
+
+        assert connected_db.execute_query("INSERT") is True
+        assert connected_db.last_error is None
+
+    @pytest.mark.parametrize("errno", [3024, 1205])
+    def test_read_timeout_raises(self, connected_db, errno):
+        #Test a timed-out read raises instead of returning an empty result
+        connected_db.cursor.execute.side_effect = Error(msg="timeout", errno=errno)
+
+        with pytest.raises(QueryTimeoutError):
+            connected_db.fetch_all("SELECT * FROM participants")
+        with pytest.raises(QueryTimeoutError):
+            connected_db.fetch_one("SELECT * FROM participants")
+        assert connected_db.last_error.errno == errno
+
+    def test_other_read_error_returns_empty(self, connected_db):
+        #Test non-timeout query errors keep the empty-result contract
+        connected_db.cursor.execute.side_effect = Error(msg="Unknown column", errno=1054)
+
+        assert connected_db.fetch_all("SELECT x FROM participants") == []
+        assert connected_db.last_error.errno == 1054
+
+
+class TestDatabaseConnectionIterRows:
+    #Test DatabaseConnection streaming iterator
+
+    @pytest.fixture
+    def connected_db(self):
+        #fixture For Connected Database
+        mock_conn = MagicMock()
+        mock_conn.is_connected.return_value = True
+        mock_conn.unread_result = False
+
+        with patch('mysql.connector.connect', return_value=mock_conn):
+            return DatabaseConnection('localhost', 'root', '', 'test_db')
+
+    def test_iter_rows_uses_unbuffered_fetchmany(self, connected_db):
+        #Test rows are streamed in chunks from an unbuffered cursor
+        stream_cursor = MagicMock()
+        stream_cursor.fetchmany.side_effect = [[{'id': 1}, {'id': 2}], [{'id': 3}], []]
+        connected_db.connection.cursor.return_value = stream_cursor
+
+        rows = list(connected_db.iter_rows("SELECT * FROM test", chunk_size=2))
+
+        assert [r['id'] for r in rows] == [1, 2, 3]
+        connected_db.connection.cursor.assert_called_with(dictionary=True, buffered=False)
+        stream_cursor.fetchmany.assert_called_with(2)
+        stream_cursor.close.assert_called_once()
+
+    def test_iter_rows_early_stop_consumes_results(self, connected_db):
+        #Test stopping early discards the unread result
+        stream_cursor = MagicMock()
+        stream_cursor.fetchmany.return_value = [{'id': 1}, {'id': 2}]
+        connected_db.connection.cursor.return_value = stream_cursor
+        connected_db.connection.unread_result = True
+
+        rows = connected_db.iter_rows("SELECT * FROM test")
+        next(rows)
+        rows.close()
+
+        connected_db.connection.consume_results.assert_called_once()
+        stream_cursor.close.assert_called_once()
+
+
+class TestReplicaRouting:
+    #Test read/write splitting with two SQLite files as primary and replica
+
+    @pytest.fixture
+    def files(self, tmp_path):
+        #Fixture for a primary and a replica file holding different rows
+        from sqliteConnection import SQLiteConnection
+        paths = {}
+        for name in ("primary", "replica"):
+            paths[name] = str(tmp_path / f"{name}.db")
+            db = SQLiteConnection(paths[name])
+            db.execute_query("CREATE TABLE t (id INTEGER PRIMARY KEY, sumber TEXT)")
+            db.execute_query("INSERT INTO t (sumber) VALUES (%s)", (name,))
+            db.disconnect()
+        return paths
+
+    def routed(self, files, read_your_writes=5.0, replicas=None):
+        #Helper: primary with one replica
+        from sqliteConnection import SQLiteConnection
+        replicas = replicas if replicas is not None else [SQLiteConnection(files["replica"])]
+        return SQLiteConnection(files["primary"], replicas=replicas, read_your_writes=read_your_writes)
+
+    def test_reads_go_to_replica(self, files):
+        #Test fetch_all, fetch_one and iter_rows are served by the replica
+        db = self.routed(files)
+
+        assert db.fetch_one("SELECT sumber FROM t")['sumber'] == "replica"
+        assert db.fetch_all("SELECT sumber FROM t") == [{'sumber': "replica"}]
+        assert list(db.iter_rows("SELECT sumber FROM t")) == [{'sumber': "replica"}]
+        db.disconnect()
+
+    def test_writes_go_to_primary_and_stick_reads(self, files):
+        #Test read-your-writes window after a write
+        db = self.routed(files)
+
+        assert db.execute_query("UPDATE t SET sumber = %s", ("primary-updated",))
+
+        assert db.fetch_one("SELECT sumber FROM t")['sumber'] == "primary-updated"
+        assert db.replicas[0].fetch_one("SELECT sumber FROM t")['sumber'] == "replica"
+        db.disconnect()
+
+    def test_window_expires(self, files):
+        #Test reads return to the replica once the window has passed
+        db = self.routed(files, read_your_writes=0)
+
+        db.execute_query("UPDATE t SET sumber = %s", ("primary-updated",))
+
+        assert db.fetch_one("SELECT sumber FROM t")['sumber'] == "replica"
+        db.disconnect()
+
+    def test_last_write_restored_from_session(self, files):
+        #Test a new connection honours a write made on the previous rerun
+        import time
+        db = self.routed(files)
+        db.last_write = time.monotonic()
+
+        assert db.fetch_one("SELECT sumber FROM t")['sumber'] == "primary"
+        db.disconnect()
+
+    def test_transaction_and_read_from_primary(self, files):
+        #Test reads inside a transaction or read_from_primary() use the primary
+        db = self.routed(files)
+
+        with db.read_from_primary():
+            assert db.fetch_one("SELECT sumber FROM t")['sumber'] == "primary"
+        with db.transaction():
+            assert db.fetch_one("SELECT sumber FROM t")['sumber'] == "primary"
+        assert db.fetch_one("SELECT sumber FROM t")['sumber'] == "replica"
+        db.disconnect()
+
+    def test_replica_error_falls_back_to_primary(self, files):
+        #Test a failed replica read is retried on the primary
+        db = self.routed(files)
+        db.replicas[0].execute_query("DROP TABLE t")
+
+        assert db.fetch_all("SELECT sumber FROM t") == [{'sumber': "primary"}]
+        assert db.last_error is None
+        db.disconnect()
+
+    def test_round_robin_and_disconnect(self, files):
+        #Test replicas take turns and are closed with the primary
+        from sqliteConnection import SQLiteConnection
+        replicas = [SQLiteConnection(files["replica"]), SQLiteConnection(files["primary"])]
+        db = self.routed(files, replicas=replicas)
+
+        served = [db.fetch_one("SELECT sumber FROM t")['sumber'] for _ in range(4)]
+        db.disconnect()
+
+        assert served == ["replica", "primary", "replica", "primary"]
+        assert all(replica.connection is None for replica in replicas)
+
+    def test_pooled_creates_replica_pools(self):
+        #Test pooled() builds one pooled connection per replica host
+        with patch('mysql.connector.connect', return_value=MagicMock()):
+            db = DatabaseConnection.pooled('primary', 'root', '', 'split_db',
+                                           replica_hosts=['replica1', 'replica2'])
+
+        assert [r.host for r in db.replicas] == ['replica1', 'replica2']
+        assert all(r.pool is not None and r.pool is not db.pool for r in db.replicas)
+
+
+class TestDatabaseConnectionPrepared:
+    #Test DatabaseConnection prepared statements
+
+    @pytest.fixture
+    def pool(self):
+        #Fixture for pool handing out the same mock connection every time
+        conn = MagicMock()
+        plain, prepared = MagicMock(), MagicMock()
+        conn.cursor.side_effect = lambda **kwargs: prepared if kwargs.get('prepared') else plain
+        prepared.fetchall.return_value = [{'id': 1}]
+        prepared.rowcount = 1
+        pool = MagicMock()
+        pool.acquire.return_value = conn
+        return pool
+
+    def test_prepared_fetch_uses_statement_cursor(self, pool):
+        #Test prepared reads go through a dictionary prepared cursor
+        db = DatabaseConnection('localhost', 'root', '', 'test_db', pool=pool)
+        db.connect()
+
+        rows = db.fetch_all("SELECT * FROM t WHERE id = %s", (1,), prepared=True)
+
+        assert rows == [{'id': 1}]
+        db.connection.cursor.assert_called_with(prepared=True, dictionary=True)
+        db.cursor.execute.assert_not_called()
+
+    def test_prepared_fetch_one_drains_result(self, pool):
+        #Test fetch_one reads the whole prepared result so the connection stays usable
+        db = DatabaseConnection('localhost', 'root', '', 'test_db', pool=pool)
+        db.connect()
+
+        prepared = db.connection.cursor(prepared=True)
+
+        assert db.fetch_one("SELECT * FROM t WHERE id = %s", (1,), prepared=True) == {'id': 1}
+        prepared.fetchall.assert_called_once()
+        prepared.fetchone.assert_not_called()
+
+    def test_statements_survive_pool_return(self, pool):
+        #Test a statement prepared by one borrower is reused by the next
+        first = DatabaseConnection('localhost', 'root', '', 'test_db', pool=pool)
+        first.connect()
+        first.execute_query("UPDATE t SET a = %s", (1,), prepared=True)
+        first.disconnect()
+
+        second = DatabaseConnection('localhost', 'root', '', 'test_db', pool=pool)
+        second.connect()
+        second.execute_query("UPDATE t SET a = %s", (2,), prepared=True)
+
+        assert second.statements.hits == 1
+        assert second.statements.misses == 1
+        assert second.rowcount == 1
+
+    def test_unparameterized_query_stays_plain(self, pool):
+        #Test queries without params use the normal cursor
+        db = DatabaseConnection('localhost', 'root', '', 'test_db', pool=pool)
+        db.connect()
+
+        db.fetch_all("SELECT * FROM t", prepared=True)
+
+        db.cursor.execute.assert_called_once_with("SELECT * FROM t", None)
+        assert len(db.statements) == 0
+
+
+class TestDatabaseConnectionReconnect:
+    #Test health checks, reconnect with backoff, and the circuit breaker
+
+    @pytest.fixture
+    def env(self):
+        #Fixture for a connection whose driver hands out a new mock per connect
+        connections = []
+
+        def connect(**kwargs):
+            conn = MagicMock()
+            conn.is_connected.return_value = True
+            connections.append(conn)
+            return conn
+
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60.0)
+        with patch('mysql.connector.connect', side_effect=connect) as mock_connect, \
+             patch('databaseConnection.time.sleep') as mock_sleep:
+            db = DatabaseConnection('localhost', 'root', '', 'test_db', breaker=breaker)
+            yield db, connections, mock_connect, mock_sleep
+
+    def test_read_reconnects_after_lost_connection(self, env):
+        #Test a read retries on a new connection after the server went away
+        db, connections, _, mock_sleep = env
+        connections[0].cursor.return_value.execute.side_effect = \
+            OperationalError(msg="Lost connection", errno=2013)
+        
+        rows = db.fetch_all("SELECT 1")
+        
+        assert len(connections) == 2
+        assert rows is connections[1].cursor.return_value.fetchall.return_value
+        connections[0].close.assert_called_once()
+        mock_sleep.assert_called_once_with(0.2)
+        assert db.last_error is None
+
+    def test_read_raises_after_attempts(self, env):
+        #Test a typed error instead of an empty result once retries run out
+        db, connections, mock_connect, mock_sleep = env
+        mock_connect.side_effect = Error(msg="Can't connect", errno=2003)
+        connections[0].cursor.return_value.execute.side_effect = \
+            OperationalError(msg="Gone away", errno=2006)
+        
+        with pytest.raises(DatabaseUnavailableError):
+            db.fetch_all("SELECT 1")
+        
+        # Putus di query + koneksi ulang gagal membuka circuit; percobaan ketiga ditolak
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.2, 0.4]
+        assert db.connection is None
+        assert db.breaker.state == CircuitBreaker.OPEN
+        assert mock_connect.call_count == 2
+
+    def test_sent_write_is_not_retried(self, env):
+        #Test a write that may have reached the server is not repeated
+        db, connections, _, mock_sleep = env
+        connections[0].cursor.return_value.execute.side_effect = \
+            OperationalError(msg="Lost connection", errno=2013)
+        
+        with pytest.raises(DatabaseUnavailableError):
+            db.execute_query("INSERT INTO test VALUES (1)")
+        
+        assert len(connections) == 1
+        connections[0].cursor.return_value.execute.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    def test_write_reconnects_before_sending(self, env):
+        #Test a write on a dropped connection reconnects first
+        db, connections, _, _ = env
+        db.disconnect()
+        db.connection = None
+        
+        assert db.execute_query("INSERT INTO test VALUES (1)") is True
+        assert len(connections) == 2
+        connections[1].commit.assert_called_once()
+
+    def test_query_error_not_retried(self, env):
+        #Test SQL errors keep the empty result and last_error contract
+        db, connections, mock_connect, mock_sleep = env
+        connections[0].cursor.return_value.execute.side_effect = Error(msg="Syntax", errno=1064)
+        
+        assert db.fetch_all("SELEC 1") == []
+        assert db.last_error.errno == 1064
+        assert mock_connect.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_idle_connection_pinged(self, env):
+        #Test an idle connection is pinged and replaced if the ping fails
+        db, connections, _, _ = env
+        connections[0].ping.side_effect = InterfaceError(msg="Connection not available")
+        db._last_used -= db.PING_INTERVAL + 1
+        
+        db.fetch_one("SELECT 1")
+        
+        connections[0].ping.assert_called_once_with(reconnect=False, attempts=1, delay=0)
+        connections[0].cursor.return_value.execute.assert_not_called()
+        assert len(connections) == 2
+
+    def test_recently_used_connection_not_pinged(self, env):
+        #Test no ping while the connection was used within PING_INTERVAL
+        db, connections, _, _ = env
+        
+        db.fetch_one("SELECT 1")
+        
+        connections[0].ping.assert_not_called()
+
+    def test_open_circuit_fails_fast(self, env):
+        #Test requests are rejected without touching the server while open
+        db, connections, mock_connect, _ = env
+        db.breaker.record_failure()
+        db.breaker.record_failure()
+        
+        with pytest.raises(CircuitOpenError):
+            db.fetch_all("SELECT 1")
+        
+        connections[0].cursor.return_value.execute.assert_not_called()
+        assert mock_connect.call_count == 1
+
+    def test_lost_connection_inside_transaction(self, env):
+        #Test no reconnect mid-transaction; the block fails instead
+        db, connections, _, mock_sleep = env
+        connections[0].cursor.return_value.execute.side_effect = \
+            OperationalError(msg="Lost connection", errno=2013)
+        
+        with pytest.raises(DatabaseUnavailableError):
+            with db.transaction() as tx:
+                db.execute_query("INSERT INTO test VALUES (1)")
+        
+        assert tx.committed is False
+        assert len(connections) == 1
+        mock_sleep.assert_not_called()
+
+    def test_lost_connection_during_commit(self, env):
+        #Test a commit that loses the connection raises a typed error, not a driver error
+        db, connections, _, mock_sleep = env
+        connections[0].commit.side_effect = OperationalError(msg="Lost connection", errno=2013)
+        
+        with pytest.raises(DatabaseUnavailableError):
+            db.execute_query("INSERT INTO test VALUES (1)")
+        
+        assert db.connection is None
+        assert len(connections) == 1
+        mock_sleep.assert_not_called()
+
+    def test_connect_failures_open_circuit(self):
+        #Test failed connects count towards the breaker and stop once it opens
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60.0)
+        with patch('mysql.connector.connect', side_effect=Error(msg="Refused", errno=2003)) as mock_connect:
+            for _ in range(4):
+                db = DatabaseConnection('localhost', 'root', '', 'test_db', breaker=breaker)
+                assert db.connection is None
+            
+            with pytest.raises(CircuitOpenError):
+                db.connect()
+        
+        assert mock_connect.call_count == 2
+        assert breaker.state == CircuitBreaker.OPEN
+
+    def test_pooled_connect_failures_open_circuit(self):
+        #Test pooled connections against a dead server fail fast after the threshold
+        with patch('mysql.connector.connect', side_effect=Error(msg="Refused", errno=2003)) as mock_connect:
+            for _ in range(8):
+                db = DatabaseConnection.pooled('dead-host', 'root', '', 'test_db')
+                assert db.connection is None
+        
+        assert mock_connect.call_count == db.breaker.failure_threshold
+        assert db.breaker.state == CircuitBreaker.OPEN
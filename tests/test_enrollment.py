@@ -3,8 +3,10 @@ Unit tests for Enrollment model.
 """
 
 import pytest
-from unittest.mock import MagicMock, patch
-from models.enrollment import Enrollment
+from unittest.mock import MagicMock
+from mysql.connector import Error
+from models.enrollment import Enrollment, EnrollmentStatus
+from datetime import datetime
 
 
 class TestEnrollmentCreate:
@@ -18,24 +20,64 @@ class TestEnrollmentCreate:
     
     def test_create_success(self, enrollment):
         #Test successful enrollment creation
-        # Mock: enrollment doesn't exist yet
-        enrollment.db.fetch_one.return_value = None
         enrollment.db.execute_query.return_value = True
+        enrollment.db.last_error = None
         
         result = enrollment.create(participant_id=1, course_id=1)
         
-        assert result is True
-        enrollment.db.execute_query.assert_called_once()
+        assert result == EnrollmentStatus.CREATED
+        enrollment.db.transaction.assert_called_once()
+        queries = [c[0][0] for c in enrollment.db.execute_query.call_args_list]
+        assert "INSERT INTO enrollments" in queries[0]
+        assert all("stat_counters" in q for q in queries[1:-1])
+        assert "UPDATE table_versions" in queries[-1]
+
+    def test_create_single_insert_without_check(self, enrollment):
+        #Test no SELECT duplicate check runs before the insert
+        enrollment.db.execute_query.return_value = True
+
+        enrollment.create(participant_id=1, course_id=1)
+
+        enrollment.db.fetch_one.assert_not_called()
     
     def test_create_duplicate(self, enrollment):
-        #Test creating duplicate enrollment
-        # Mock: enrollment already exists
-        enrollment.db.fetch_one.return_value = {'id': 1}
+        #Test creating duplicate enrollment relies on unique_enrollment
+        enrollment.db.execute_query.return_value = False
+        enrollment.db.last_error = Error(msg="Duplicate entry", errno=1062)
         
-        with patch('streamlit.warning'):
-            result = enrollment.create(participant_id=1, course_id=1)
+        result = enrollment.create(participant_id=1, course_id=1)
             
-            assert result is False
+        assert result == EnrollmentStatus.ALREADY_ENROLLED
+        assert enrollment.db.execute_query.call_count == 1
+
+    def test_create_unknown_participant(self, enrollment):
+        #Test foreign key failure on missing participant
+        enrollment.db.execute_query.return_value = False
+        enrollment.db.last_error = Error(msg="FK", errno=1452)
+        enrollment.db.fetch_one.return_value = None
+
+        result = enrollment.create(participant_id=99, course_id=1)
+
+        assert result == EnrollmentStatus.UNKNOWN_PARTICIPANT
+
+    def test_create_unknown_course(self, enrollment):
+        #Test foreign key failure on missing course
+        enrollment.db.execute_query.return_value = False
+        enrollment.db.last_error = Error(msg="FK", errno=1452)
+        enrollment.db.fetch_one.return_value = {'id': 1}
+
+        result = enrollment.create(participant_id=1, course_id=99)
+
+        assert result == EnrollmentStatus.UNKNOWN_COURSE
+
+    def test_create_other_failure(self, enrollment):
+        #Test other database errors
+        enrollment.db.execute_query.return_value = False
+        enrollment.db.last_error = Error(msg="Lost connection", errno=2013)
+
+        result = enrollment.create(participant_id=1, course_id=1)
+
+        assert result == EnrollmentStatus.FAILED
 
 
 class TestEnrollmentRelations:
@@ -72,6 +114,48 @@ class TestEnrollmentRelations:
         
         assert result == expected_participants
         assert len(result) == 2
+
+    def test_relation_projection(self, enrollment):
+        #Test requested columns are prefixed with the joined table alias
+        enrollment.db.fetch_all.return_value = []
+
+        enrollment.get_courses_by_participant(1, columns=('id', 'nama_kelas'))
+        assert "SELECT c.id, c.nama_kelas, e.tanggal_daftar" in enrollment.db.fetch_all.call_args[0][0]
+
+        enrollment.get_participants_by_course(1, columns=('nama',))
+        assert "SELECT p.nama, e.tanggal_daftar" in enrollment.db.fetch_all.call_args[0][0]
+
+    def test_relation_projection_unknown_column(self, enrollment):
+        #Test columns are validated against the joined table
+        with pytest.raises(ValueError):
+            enrollment.get_courses_by_participant(1, columns=('nama',))
+
+    def test_participant_detail_single_query(self, enrollment):
+        #Test one LEFT JOIN row per course is split into record and course list
+        row = {'id': 1, 'nama': 'John', 'email': 'john@test.com', 'no_telp': '', 'alamat': '',
+               'tanggal_daftar': 'd0', 'rel_nama_kelas': 'Python', 'rel_deskripsi': '',
+               'rel_instruktur': 'Prof. A', 'rel_tanggal_dibuat': 'd1', 'rel_tanggal_daftar': 'd2'}
+        enrollment.db.fetch_all.return_value = [dict(row, rel_id=10), dict(row, rel_id=11)]
+
+        detail = enrollment.get_participant_detail(1)
+
+        enrollment.db.fetch_all.assert_called_once()
+        assert "LEFT JOIN enrollments e" in enrollment.db.fetch_all.call_args[0][0]
+        assert detail['nama'] == 'John' and detail['tanggal_daftar'] == 'd0'
+        assert [c['id'] for c in detail['courses']] == [10, 11]
+        assert detail['courses'][0]['tanggal_daftar'] == 'd2'
+
+    def test_course_detail_without_participants(self, enrollment):
+        #Test a course without enrollments yields an empty list, a missing course None
+        enrollment.db.fetch_all.return_value = [{
+            'id': 1, 'nama_kelas': 'Python', 'deskripsi': '', 'instruktur': '', 'tanggal_dibuat': 'd',
+            'rel_id': None, 'rel_nama': None, 'rel_email': None, 'rel_no_telp': None,
+            'rel_alamat': None, 'rel_tanggal_daftar': None,
+        }]
+        assert enrollment.get_course_detail(1)['participants'] == []
+
+        enrollment.db.fetch_all.return_value = []
+        assert enrollment.get_course_detail(2) is None
     
     def test_get_all_enrollments(self, enrollment):
         #Test get all enrollments
@@ -88,4 +172,153 @@ class TestEnrollmentRelations:
         
         result = enrollment.get_all_enrollments()
         
-        assert result == expected_enrollments
\ No newline at end of file
+        assert result == expected_enrollments
+
+class TestEnrollmentPagination:
+    #Test Enrollment keyset pagination
+
+    @pytest.fixture
+    def enrollment(self):
+        #Fixture for Enrollment instance
+        mock_db = MagicMock()
+        return Enrollment(mock_db)
+
+    def test_first_page_has_no_cursor(self, enrollment):
+        #Test first page only limits
+        enrollment.db.fetch_all.return_value = []
+
+        enrollment.get_enrollments_page(limit=10)
+
+        query, params = enrollment.db.fetch_all.call_args[0]
+        assert "WHERE" not in query
+        assert "ORDER BY e.tanggal_daftar ASC, e.id ASC" in query
+        assert params == (10,)
+
+    def test_page_after_date_cursor(self, enrollment):
+        #Test cursor on (tanggal_daftar, id)
+        enrollment.db.fetch_all.return_value = []
+        cursor_date = datetime(2025, 1, 1, 10, 0)
+
+        enrollment.get_enrollments_page(after=(cursor_date, 7), limit=10)
+
+        query, params = enrollment.db.fetch_all.call_args[0]
+        assert "e.tanggal_daftar > %s OR (e.tanggal_daftar = %s AND e.id > %s)" in query
+        assert params == (cursor_date, cursor_date, 7, 10)
+
+    def test_page_after_null_date_cursor(self, enrollment):
+        #Test cursor whose date is NULL continues with remaining NULL rows
+        enrollment.db.fetch_all.return_value = []
+
+        enrollment.get_enrollments_page(after=(None, 3), limit=10)
+
+        query, params = enrollment.db.fetch_all.call_args[0]
+        assert "e.tanggal_daftar IS NULL AND e.id > %s" in query
+        assert params == (3, 10)
+
+    def test_count_enrollments(self, enrollment):
+        #Test total enrollments count
+        enrollment.db.fetch_one.return_value = {'total': 1000000}
+
+        assert enrollment.count_enrollments() == 1000000
+
+
+class TestEnrollmentDelete:
+    #Test Enrollment delete method
+
+    @pytest.fixture
+    def enrollment(self):
+        #Fixture for Enrollment instance
+        mock_db = MagicMock()
+        return Enrollment(mock_db)
+
+    def test_delete_updates_counters_by_deleted_rows(self, enrollment):
+        #Test counters are decremented by the number of deleted rows
+        enrollment.db.execute_query.return_value = True
+        enrollment.db.rowcount = 1
+
+        result = enrollment.delete(participant_id=1, course_id=2)
+
+        assert result is True
+        calls = enrollment.db.execute_query.call_args_list
+        assert "DELETE FROM enrollments" in calls[0][0][0]
+        assert calls[1][0][1] == (1, 'enrollments')
+        assert calls[2][0][1] == (1, 'course_enrollments', 2)
+
+    def test_delete_courses(self, enrollment):
+        #Test per-course counters are decremented before the enrollments are removed
+        enrollment.db.execute_query.return_value = True
+        enrollment.db.rowcount = 2
+
+        result = enrollment.delete_courses(1, [2, 3])
+
+        assert result == {'deleted': 2, 'failed': 0}
+        enrollment.db.transaction.assert_called_once()
+        calls = enrollment.db.execute_query.call_args_list
+        assert "UPDATE stat_counters" in calls[0][0][0]
+        assert "course_id IN (%s, %s)" in calls[1][0][0]
+        assert calls[1][0][1] == (1, 2, 3)
+        assert calls[2][0][1] == (2, 'enrollments')
+
+
+class TestEnrollmentBulk:
+    #Test Enrollment bulk enroll methods
+
+    @pytest.fixture
+    def enrollment(self):
+        #Fixture for Enrollment instance
+        mock_db = MagicMock()
+        mock_db.execute_query.return_value = True
+        return Enrollment(mock_db)
+
+    def test_enroll_participants_multi_row_insert(self, enrollment):
+        #Test many participants go into one INSERT IGNORE ... SELECT statement
+        enrollment.db.rowcount = 2
+
+        result = enrollment.enroll_participants(course_id=5, participant_ids=[1, 2, 3])
+
+        assert result == {'inserted': 2, 'skipped': 1}
+        enrollment.db.transaction.assert_called_once()
+        query, params = enrollment.db.execute_query.call_args_list[0][0]
+        assert "INSERT IGNORE INTO enrollments" in query
+        assert "FROM participants p CROSS JOIN courses c" in query
+        assert params[1:] == (1, 2, 3, 5)
+
+    def test_enroll_courses_refreshes_course_counters(self, enrollment):
+        #Test per-course counters are recomputed for the selected courses
+        enrollment.db.rowcount = 2
+
+        enrollment.enroll_courses(participant_id=1, course_ids=[4, 6])
+
+        queries = [c[0] for c in enrollment.db.execute_query.call_args_list]
+        refresh_query, refresh_params = queries[-2]
+        assert "GROUP BY course_id" in refresh_query
+        assert refresh_params == ('course_enrollments', 4, 6)
+        assert queries[-3][1] == (2, 'enrollments')
+        assert queries[-1][1][1:] == ('enrollments',)
+
+    def test_duplicate_ids_and_chunking(self, enrollment):
+        #Test duplicate ids are removed and large lists are chunked
+        enrollment.BULK_CHUNK_SIZE = 2
+        enrollment.db.rowcount = 1
+
+        result = enrollment.enroll_participants(course_id=1, participant_ids=[1, 1, 2, 3])
+
+        inserts = [c for c in enrollment.db.execute_query.call_args_list
+                   if "INSERT IGNORE" in c[0][0]]
+        assert len(inserts) == 2
+        assert result == {'inserted': 2, 'skipped': 1}
+
+    def test_empty_list(self, enrollment):
+        #Test empty selection does nothing
+        result = enrollment.enroll_courses(participant_id=1, course_ids=[])
+
+        assert result == {'inserted': 0, 'skipped': 0}
+        enrollment.db.execute_query.assert_not_called()
+
+    def test_failure_reports_nothing_inserted(self, enrollment):
+        #Test failed statement reports zero inserted
+        enrollment.db.execute_query.return_value = False
+
+        result = enrollment.enroll_participants(course_id=1, participant_ids=[1, 2])
+
+        assert result == {'inserted': 0, 'skipped': 0}
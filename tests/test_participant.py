@@ -4,6 +4,8 @@ Unit tests for Participant model.
 
 import pytest
 from unittest.mock import MagicMock
+from mysql.connector import Error
+from databaseConnection import ER_DUP_ENTRY
 from models.participant import Participant
 from datetime import datetime
 
@@ -29,10 +31,10 @@ class TestParticipantCreate:
         )
         
         assert result is True
-        participant.db.execute_query.assert_called_once()
+        participant.db.transaction.assert_called_once()
         
-        # Verify query structure
-        call_args = participant.db.execute_query.call_args
+        # Verify query structure (first statement; the second updates stat_counters)
+        call_args = participant.db.execute_query.call_args_list[0]
         query = call_args[0][0]
         params = call_args[0][1]
         
@@ -135,8 +137,8 @@ class TestParticipantUpdate:
         
         assert result is True
         
-        # Verify query
-        call_args = participant.db.execute_query.call_args
+        # Verify query (first statement; the second bumps table_versions)
+        call_args = participant.db.execute_query.call_args_list[0]
         query = call_args[0][0]
         params = call_args[0][1]
         
@@ -161,5 +163,320 @@ class TestParticipantDelete:
         result = participant.delete(1)
         
         assert result is True
-        # Should call execute_query twice (enrollments + participant)
-        assert participant.db.execute_query.call_count == 2
\ No newline at end of file
+        # Enrollments, participant and counters are removed in one transaction
+        participant.db.transaction.assert_called_once()
+        queries = [c[0][0] for c in participant.db.execute_query.call_args_list]
+        assert any("DELETE FROM enrollments" in q for q in queries)
+        assert any("DELETE FROM participants" in q for q in queries)
+
+    def test_delete_counters_before_enrollments(self, participant):
+        #Test per-course counters are decremented before enrollments are removed
+        participant.db.execute_query.return_value = True
+
+        participant.delete(1)
+
+        queries = [c[0][0] for c in participant.db.execute_query.call_args_list]
+        course_counter = next(i for i, q in enumerate(queries) if "scope_id IN" in q)
+        delete_enrollments = next(i for i, q in enumerate(queries) if "DELETE FROM enrollments" in q)
+        assert course_counter < delete_enrollments
+
+class TestParticipantPagination:
+    #Test Participant keyset pagination
+
+    @pytest.fixture
+    def participant(self):
+        #Fixture for Participant instance
+        mock_db = MagicMock()
+        return Participant(mock_db)
+
+    def test_get_page_first(self, participant):
+        #Test first page starts after id 0
+        participant.db.fetch_all.return_value = [{'id': 1}, {'id': 2}]
+
+        result = participant.get_page(limit=2)
+
+        assert len(result) == 2
+        query, params = participant.db.fetch_all.call_args[0]
+        assert "WHERE id > %s" in query
+        assert "LIMIT %s" in query
+        assert params == (0, 2)
+
+    def test_get_page_after_cursor(self, participant):
+        #Test next page uses last id as cursor
+        participant.db.fetch_all.return_value = []
+
+        participant.get_page(after_id=50, limit=25)
+
+        _, params = participant.db.fetch_all.call_args[0]
+        assert params == (50, 25)
+
+    def test_count(self, participant):
+        #Test count returns COUNT(*) result
+        participant.db.fetch_one.return_value = {'total': 200000}
+
+        assert participant.count() == 200000
+        assert "COUNT(*)" in participant.db.fetch_one.call_args[0][0]
+
+
+class TestParticipantBulkCreate:
+    #Test Participant bulk_create method
+
+    @pytest.fixture
+    def participant(self):
+        #Fixture for Participant instance
+        mock_db = MagicMock()
+        mock_db.execute_many.return_value = True
+        mock_db.execute_query.return_value = True
+        mock_db.fetch_all.return_value = []
+        return Participant(mock_db)
+
+    def rows(self, count):
+        #Helper: generate participant rows lazily
+        for i in range(count):
+            yield {'nama': f'Peserta {i}', 'email': f'p{i}@test.com', 'no_telp': '', 'alamat': ''}
+
+    def test_batches_with_executemany(self, participant):
+        #Test rows are inserted in batches with one transaction each
+        summary = participant.bulk_create(self.rows(5), batch_size=2)
+
+        assert summary['inserted'] == 5
+        assert participant.db.execute_many.call_count == 3
+        assert participant.db.transaction.call_count == 3
+        query, params = participant.db.execute_many.call_args_list[0][0]
+        assert "INSERT INTO participants" in query
+        assert len(params) == 2
+
+    def test_existing_emails_reported(self, participant):
+        #Test emails already in database are skipped and reported
+        participant.db.fetch_all.return_value = [{'email': 'P1@test.com'}]
+
+        summary = participant.bulk_create(self.rows(3))
+
+        assert summary['inserted'] == 2
+        assert summary['duplicates'] == ['p1@test.com']
+        _, params = participant.db.execute_many.call_args[0]
+        assert [p[1] for p in params] == ['p0@test.com', 'p2@test.com']
+
+    def test_duplicates_within_input_and_invalid_rows(self, participant):
+        #Test repeated email in the file and rows missing required fields
+        rows = [
+            {'nama': 'A', 'email': 'a@test.com'},
+            {'nama': 'A2', 'email': 'A@test.com'},
+            {'nama': '', 'email': 'b@test.com'},
+        ]
+
+        summary = participant.bulk_create(rows)
+
+        assert summary['inserted'] == 1
+        assert summary['duplicates'] == ['A@test.com']
+        assert summary['invalid'] == [3]
+
+    def test_existing_emails_checked_on_primary(self, participant):
+        #Test the duplicate check is not sent to a lagging replica
+        participant.bulk_create(self.rows(2))
+
+        participant.db.read_from_primary.assert_called_once()
+
+    def test_concurrent_duplicate_retried_per_row(self, participant):
+        #Test a batch rejected by the unique key is retried row by row
+        def execute_many(query, params):
+            ok = len(params) == 1 and params[0][1] != 'p1@test.com'
+            participant.db.last_error = None if ok else Error(errno=ER_DUP_ENTRY)
+            return ok
+        participant.db.execute_many.side_effect = execute_many
+
+        summary = participant.bulk_create(self.rows(3))
+
+        assert summary['inserted'] == 2
+        assert summary['duplicates'] == ['p1@test.com']
+        assert summary['failed'] == 0
+        assert participant.db.execute_many.call_count == 4
+
+    def test_failed_batch_counted(self, participant):
+        #Test failed batch is reported instead of raising
+        participant.db.execute_many.return_value = False
+
+        summary = participant.bulk_create(self.rows(2))
+
+        assert summary['inserted'] == 0
+        assert summary['failed'] == 2
+
+    def test_on_batch_callback(self, participant):
+        #Test progress callback is called per batch
+        progress = MagicMock()
+
+        participant.bulk_create(self.rows(3), batch_size=2, on_batch=progress)
+
+        assert progress.call_count == 2
+
+
+class TestParticipantSearch:
+    #Test Participant search method
+
+    @pytest.fixture
+    def participant(self):
+        #fixture For Connected Database
+        mock_db = MagicMock()
+        mock_db.fetch_all.return_value = []
+        return Participant(mock_db)
+
+    def test_empty_term_lists_first_rows(self, participant):
+        #Test empty search returns the first participants by id
+        participant.search("  ", limit=5)
+
+        query, params = participant.db.fetch_all.call_args[0]
+        assert "ORDER BY id ASC LIMIT %s" in query
+        assert params == (5,)
+
+    def test_prefix_and_fulltext(self, participant):
+        #Test prefix lookups on indexed columns plus a boolean FULLTEXT match
+        participant.search("budi san", limit=10)
+
+        query, params = participant.db.fetch_all.call_args[0]
+        assert "nama LIKE %s ESCAPE '!'" in query
+        assert "email LIKE %s ESCAPE '!'" in query
+        assert "MATCH(nama, email) AGAINST (%s IN BOOLEAN MODE)" in query
+        assert params == ("budi san%", 10, "budi san%", 10, "+budi* +san*", 10)
+
+    def test_numeric_term_matches_id(self, participant):
+        #Test a number also looks up the id directly
+        participant.search("42")
+
+        query, params = participant.db.fetch_all.call_args[0]
+        assert "WHERE id = %s" in query
+        assert params[0] == 42
+
+    def test_like_wildcards_escaped(self, participant):
+        #Test % and _ in the term are matched literally
+        participant.search("a_b%")
+
+        _, params = participant.db.fetch_all.call_args[0]
+        assert params[0] == "a!_b!%%"
+
+    def test_results_deduplicated_and_limited(self, participant):
+        #Test rows found by several branches appear once
+        participant.db.fetch_all.return_value = [
+            {'id': 1, 'nama': 'Budi', 'email': 'budi@test.com'},
+            {'id': 1, 'nama': 'Budi', 'email': 'budi@test.com'},
+            {'id': 2, 'nama': 'Budiman', 'email': 'b@test.com'},
+        ]
+
+        assert [p['id'] for p in participant.search("budi", limit=1)] == [1]
+
+
+class TestParticipantProjection:
+    #Test Participant column projection and label lookup
+
+    @pytest.fixture
+    def participant(self):
+        #fixture For Connected Database
+        mock_db = MagicMock()
+        mock_db.last_error = None
+        mock_db.fetch_all.return_value = []
+        return Participant(mock_db)
+
+    def test_get_page_selected_columns(self, participant):
+        #Test only the requested columns are selected
+        participant.get_page(limit=10, columns=('id', 'nama'))
+
+        query, _ = participant.db.fetch_all.call_args[0]
+        assert query.startswith("SELECT id, nama FROM participants")
+
+    def test_default_selects_all(self, participant):
+        #Test no columns keeps SELECT *
+        participant.get_all()
+
+        assert "SELECT * FROM participants" in participant.db.fetch_all.call_args[0][0]
+
+    def test_unknown_column_rejected(self, participant):
+        #Test unknown column names never reach the SQL
+        with pytest.raises(ValueError):
+            participant.get_all(columns=('id', 'nama; DROP TABLE participants'))
+
+        participant.db.fetch_all.assert_not_called()
+
+    def test_get_labels(self, participant):
+        #Test labels map id to name from a two-column query
+        participant.db.fetch_all.return_value = [{'id': 1, 'nama': 'John'}, {'id': 2, 'nama': 'Jane'}]
+
+        assert participant.get_labels() == {1: 'John', 2: 'Jane'}
+        assert "SELECT id, nama FROM participants" in participant.db.fetch_all.call_args[0][0]
+
+
+class TestParticipantGetByIds:
+    #Test Participant batch lookup by id
+
+    @pytest.fixture
+    def participant(self):
+        #fixture For Connected Database
+        mock_db = MagicMock()
+        mock_db.fetch_all.side_effect = lambda query, params, prepared: [
+            {'id': i, 'nama': f'P{i}'} for i in set(params) if i != 3
+        ]
+        return Participant(mock_db)
+
+    def test_keyed_by_id_in_input_order(self, participant):
+        #Test result maps ids in the requested order and skips missing ones
+        result = participant.get_by_ids([5, 3, 1, 5])
+
+        assert list(result) == [5, 1]
+        assert result[1]['nama'] == 'P1'
+        participant.db.fetch_all.assert_called_once()
+
+    def test_chunked_in_queries(self, participant):
+        #Test ids are split into chunks of ID_CHUNK_SIZE
+        participant.ID_CHUNK_SIZE = 4
+
+        result = participant.get_by_ids(range(1, 11))
+
+        assert len(result) == 9
+        assert participant.db.fetch_all.call_count == 3
+
+    def test_placeholders_rounded_to_power_of_two(self, participant):
+        #Test the statement text stays stable by padding with the last id
+        participant.get_by_ids([1, 2, 4])
+
+        query, params = participant.db.fetch_all.call_args[0]
+        assert "WHERE id IN (%s, %s, %s, %s)" in query
+        assert params == (1, 2, 4, 4)
+
+    def test_projection_keeps_id(self, participant):
+        #Test id is always selected so rows can be keyed
+        participant.get_by_ids([1], columns=('nama',))
+
+        assert participant.db.fetch_all.call_args[0][0].startswith("SELECT id, nama FROM participants")
+
+    def test_empty_ids(self, participant):
+        #Test no ids means no query
+        assert participant.get_by_ids([]) == {}
+        participant.db.fetch_all.assert_not_called()
+
+
+class TestParticipantDeleteMany:
+    #Test Participant bulk delete
+
+    @pytest.fixture
+    def participant(self):
+        #Fixture for Participant instance
+        mock_db = MagicMock()
+        mock_db.execute_query.return_value = True
+        mock_db.rowcount = 2
+        return Participant(mock_db)
+
+    def test_chunked_transactions(self, participant):
+        #Test one transaction and one IN statement per chunk
+        participant.ID_CHUNK_SIZE = 2
+
+        summary = participant.delete_many([1, 2, 3])
+
+        assert summary == {'deleted': 4, 'failed': 0}
+        assert participant.db.transaction.call_count == 2
+        queries = [c[0][0] for c in participant.db.execute_query.call_args_list]
+        assert sum("DELETE FROM participants WHERE id IN (%s, %s)" in q for q in queries) == 1
+        assert sum("DELETE FROM participants WHERE id IN (%s)" in q for q in queries) == 1
+
+    def test_failed_chunk_reported(self, participant):
+        #Test ids of a failed chunk are counted instead of raising
+        participant.db.execute_query.return_value = False
+
+        assert participant.delete_many([1, 2, 2]) == {'deleted': 0, 'failed': 2}
@@ -0,0 +1,86 @@
+"""
+Unit tests for per-rerun QueryCache shared by the models.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+from models.queryCache import QueryCache
+from models.participant import Participant
+from models.course import Course
+from models.enrollment import Enrollment
+
+
+class TestQueryCache:
+    #Test QueryCache behaviour
+
+    def test_loader_called_once_per_key(self):
+        #Test same key is loaded once
+        cache = QueryCache()
+        loader = MagicMock(return_value=[{'id': 1}])
+
+        first = cache.get_or_load(('all', 'SELECT 1', None), loader)
+        second = cache.get_or_load(('all', 'SELECT 1', None), loader)
+
+        assert first == second == [{'id': 1}]
+        loader.assert_called_once()
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_different_params_are_separate(self):
+        #Test different params are cached separately
+        cache = QueryCache()
+
+        cache.get_or_load(('one', 'q', (1,)), lambda: 'a')
+        cache.get_or_load(('one', 'q', (2,)), lambda: 'b')
+
+        assert len(cache) == 2
+
+    def test_invalidate_clears_entries(self):
+        #Test invalidate empties the cache
+        cache = QueryCache()
+        cache.get_or_load('key', lambda: 'value')
+
+        cache.invalidate()
+
+        assert len(cache) == 0
+
+
+class TestModelsShareCache:
+    #Test models use the shared cache
+
+    @pytest.fixture
+    def db(self):
+        #Fixture for mock database
+        db = MagicMock()
+        db.last_error = None
+        db.fetch_all.return_value = [{'id': 1, 'nama': 'John'}]
+        db.execute_query.return_value = True
+        return db
+
+    def test_repeated_get_all_hits_database_once(self, db):
+        #Test get_all from several model instances hits database once
+        cache = QueryCache()
+
+        Participant(db, cache).get_all()
+        Participant(db, cache).get_all()
+
+        db.fetch_all.assert_called_once()
+
+    def test_write_invalidates_cache(self, db):
+        #Test a write through any model invalidates cached reads
+        cache = QueryCache()
+        Participant(db, cache).get_all()
+
+        Course(db, cache).create("Python", "Desc", "Budi")
+        Participant(db, cache).get_all()
+
+        assert db.fetch_all.call_count == 2
+
+    def test_without_cache_passes_through(self, db):
+        #Test models without cache query every time
+        enrollment = Enrollment(db)
+
+        enrollment.get_all_enrollments()
+        enrollment.get_all_enrollments()
+
+        assert db.fetch_all.call_count == 2
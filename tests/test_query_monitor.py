@@ -0,0 +1,117 @@
+"""
+Unit tests for QueryMonitor and SQL fingerprinting.
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+from mysql.connector import Error
+from queryMonitor import QueryMonitor, fingerprint
+from databaseConnection import DatabaseConnection
+
+
+class TestFingerprint:
+    #Test SQL normalization
+
+    def test_literals_and_placeholders(self):
+        #Test literals and placeholders collapse to the same fingerprint
+        a = fingerprint("SELECT * FROM participants WHERE id = %s")
+        b = fingerprint("select *   from participants\n WHERE id = 42")
+
+        assert a == b == "select * from participants where id = ?"
+
+    def test_in_and_values_lists(self):
+        #Test variable-length lists share one fingerprint
+        short = fingerprint("SELECT email FROM participants WHERE email IN (%s, %s)")
+        long = fingerprint("SELECT email FROM participants WHERE email IN (%s, %s, %s, %s)")
+        values = fingerprint("INSERT INTO e (a, b) VALUES (%s, %s), (%s, %s), (%s, %s)")
+
+        assert short == long
+        assert values == "insert into e (a, b) values (?+), ..."
+
+    def test_strings_and_identifiers(self):
+        #Test quoted strings are replaced but identifiers with digits are kept
+        result = fingerprint("DELETE FROM stat_counters WHERE scope = 'course_1' AND enrollments_ibfk_1 = 1")
+
+        assert result == "delete from stat_counters where scope = ? and enrollments_ibfk_1 = ?"
+
+
+class TestQueryMonitor:
+    #Test QueryMonitor aggregates
+
+    def test_aggregates_per_fingerprint(self):
+        #Test count, percentiles and max per fingerprint
+        monitor = QueryMonitor(slow_threshold=10)
+        for i in range(1, 21):
+            monitor.record("SELECT * FROM courses WHERE id = %s", i / 1000, rows=1)
+
+        top = monitor.top()
+
+        assert len(top) == 1
+        assert top[0]['count'] == 20
+        assert top[0]['p50_ms'] == 10.0
+        assert top[0]['p95_ms'] == 19.0
+        assert top[0]['max_ms'] == 20.0
+        assert top[0]['rows'] == 20
+
+    def test_slow_log_and_errors(self):
+        #Test slow queries and error classes are recorded
+        monitor = QueryMonitor(slow_threshold=0.1, slow_log_size=2)
+
+        monitor.record("SELECT 1", 0.01)
+        monitor.record("SELECT * FROM enrollments", 0.5, error=Error("timeout"))
+        monitor.record("SELECT * FROM participants", 0.2)
+        monitor.record("SELECT * FROM courses", 0.3)
+
+        slow = monitor.slow_queries()
+        assert [s['fingerprint'] for s in slow] == ["select * from courses", "select * from participants"]
+        errors = {t['fingerprint']: t for t in monitor.top()}
+        assert errors["select * from enrollments"]['last_error'] == "Error"
+
+    def test_top_ordering(self):
+        #Test top offenders sorted by total time
+        monitor = QueryMonitor(slow_threshold=10)
+        monitor.record("SELECT a", 0.001)
+        monitor.record("SELECT b", 0.005)
+
+        assert monitor.top(limit=1)[0]['fingerprint'] == "select b"
+
+
+class TestDatabaseConnectionInstrumentation:
+    #Test DatabaseConnection records every statement
+
+    @pytest.fixture
+    def connected_db(self):
+        #fixture For Connected Database with private monitor
+        mock_conn = MagicMock()
+        mock_conn.is_connected.return_value = True
+
+        with patch('mysql.connector.connect', return_value=mock_conn):
+            return DatabaseConnection('localhost', 'root', '', 'test_db',
+                                      monitor=QueryMonitor(slow_threshold=10))
+
+    def test_fetch_all_records_rows(self, connected_db):
+        #Test fetch_all records returned rows
+        connected_db.cursor.fetchall.return_value = [{'id': 1}, {'id': 2}]
+
+        connected_db.fetch_all("SELECT * FROM test")
+
+        stat = connected_db.monitor.top()[0]
+        assert stat['rows'] == 2
+        assert stat['count'] == 1
+
+    def test_failed_fetch_records_error(self, connected_db):
+        #Test failed fetch is distinguishable from an empty result
+        connected_db.cursor.execute.side_effect = Error("Lost connection")
+
+        assert connected_db.fetch_all("SELECT * FROM test") == []
+
+        assert connected_db.last_error is not None
+        assert connected_db.monitor.top()[0]['errors'] == 1
+
+    def test_execute_query_records_affected_rows(self, connected_db):
+        #Test writes record affected rows
+        connected_db.cursor.rowcount = 3
+
+        connected_db.execute_query("DELETE FROM test")
+
+        assert connected_db.monitor.top()[0]['rows'] == 3
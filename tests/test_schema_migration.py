@@ -0,0 +1,174 @@
+"""
+Unit tests for schema migrations.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+import schemaMigration
+from schemaMigration import GuardedStatement, Migration, SchemaMigrator, ensure_schema, MIGRATIONS
+
+
+def version_db(version):
+    #Helper: mock db whose schema_version reports the given version
+    db = MagicMock()
+    db.dialect = 'mysql'
+    db.last_error = None
+    db.execute_query.return_value = True
+
+    def fetch_one(query, params=None):
+        if "MAX(version)" in query:
+            return {'version': version}
+        return {'acquired': 1, 'released': 1}
+
+    db.fetch_one.side_effect = fetch_one
+    return db
+
+
+class TestSchemaMigrator:
+    #Test SchemaMigrator
+
+    @pytest.fixture
+    def migrations(self):
+        #Fixture for two small migrations
+        return [
+            Migration(1, "satu", ["CREATE TABLE a (id INT)"]),
+            Migration(2, "dua", ["CREATE TABLE b (id INT)", "CREATE INDEX i ON b (id)"]),
+        ]
+
+    def test_first_migration_contains_initial_tables(self):
+        #Test initial schema lives in migration 1
+        ddl = " ".join(MIGRATIONS[0].statements)
+
+        assert MIGRATIONS[0].version == 1
+        for table in ("participants", "courses", "enrollments"):
+            assert f"CREATE TABLE IF NOT EXISTS {table}" in ddl
+        assert "unique_enrollment" in ddl
+
+    def test_cascade_migration(self):
+        #Test both foreign keys are recreated with ON DELETE CASCADE on each dialect
+        migration = next(m for m in MIGRATIONS if m.version == 6)
+
+        for dialect in ('mysql', 'sqlite'):
+            ddl = " ".join(str(s) for s in migration.statements_for(dialect))
+            assert ddl.count("ON DELETE CASCADE") == 2
+            assert "enrollments_ibfk_1" in ddl and "enrollments_ibfk_2" in ddl
+        assert "idx_tanggal_daftar" in " ".join(migration.statements_for('sqlite'))
+
+    def test_index_migration_resumable(self):
+        #Test every MySQL index step is skipped when the index already exists
+        migration = next(m for m in MIGRATIONS if m.version == 5)
+        statements = migration.statements_for('mysql')
+
+        assert all(isinstance(s, GuardedStatement) for s in statements)
+        for index in ("idx_nama", "ft_participants", "ft_courses"):
+            step = next(s for s in statements if index in s.statement)
+            assert f"INDEX_NAME = '{index}'" in step.when
+
+    def test_stamp_column_migration_resumable(self):
+        #Test the updated_at column is only added when missing
+        migration = next(m for m in MIGRATIONS if m.version == 7)
+        step = migration.statements_for('mysql')[0]
+
+        assert isinstance(step, GuardedStatement)
+        assert "COLUMN_NAME = 'updated_at'" in step.when
+
+    def test_current_version_empty(self):
+        #Test version 0 when nothing applied yet
+        migrator = SchemaMigrator(version_db(None), [])
+
+        assert migrator.current_version() == 0
+
+    def test_migrate_applies_pending_only(self, migrations):
+        #Test only migrations above the current version are applied
+        db = version_db(1)
+        migrator = SchemaMigrator(db, migrations)
+
+        assert migrator.migrate() is True
+
+        executed = [c[0][0] for c in db.execute_query.call_args_list]
+        assert "CREATE TABLE a (id INT)" not in executed
+        assert "CREATE TABLE b (id INT)" in executed
+        assert "CREATE INDEX i ON b (id)" in executed
+        version_insert = db.execute_query.call_args_list[-1][0]
+        assert "INSERT INTO schema_version" in version_insert[0]
+        assert version_insert[1][0] == 2
+
+    def test_migrate_up_to_date_runs_no_ddl(self, migrations):
+        #Test nothing but the version table check runs when up to date
+        db = version_db(2)
+
+        assert SchemaMigrator(db, migrations).migrate() is True
+        assert db.execute_query.call_count == 1
+
+    def test_migrate_stops_on_failure(self, migrations):
+        #Test failed statement stops migration without recording version
+        db = version_db(0)
+        db.execute_query.side_effect = lambda query, params=None: "CREATE TABLE a" not in query
+
+        assert SchemaMigrator(db, migrations).migrate() is False
+
+        executed = [c[0][0] for c in db.execute_query.call_args_list]
+        assert not any("INSERT INTO schema_version" in q for q in executed)
+
+    def test_migration_runs_in_transaction(self, migrations):
+        #Test a failed statement fails the migration's transaction
+        db = version_db(1)
+        tx = db.transaction.return_value.__enter__.return_value
+        db.execute_query.side_effect = lambda query, params=None: "CREATE INDEX" not in query
+
+        assert SchemaMigrator(db, migrations).migrate() is False
+        assert tx.failed is True
+
+    def test_guarded_statement_skipped_when_applied(self):
+        #Test a resumed migration skips steps whose check finds nothing to do
+        db = version_db(0)
+        migration = Migration(1, "fk", [
+            GuardedStatement("ALTER TABLE e DROP FOREIGN KEY fk", when="SELECT old fk"),
+            GuardedStatement("ALTER TABLE e ADD CONSTRAINT fk", when="SELECT missing fk"),
+        ])
+        db.fetch_one.side_effect = lambda query, params=None: (
+            {'missing': 1} if query == "SELECT missing fk" else None
+        )
+
+        assert SchemaMigrator(db, [migration]).apply(migration) is True
+
+        executed = [c[0][0] for c in db.execute_query.call_args_list]
+        assert "ALTER TABLE e DROP FOREIGN KEY fk" not in executed
+        assert "ALTER TABLE e ADD CONSTRAINT fk" in executed
+
+    def test_guarded_statement_check_error_fails(self):
+        #Test a failed state check stops the migration
+        db = version_db(0)
+        migration = Migration(1, "fk", [GuardedStatement("ALTER TABLE e ADD x", when="SELECT 1")])
+        db.fetch_one.side_effect = None
+        db.fetch_one.return_value = None
+        db.last_error = Exception("check failed")
+
+        assert SchemaMigrator(db, [migration]).apply(migration) is False
+        db.execute_query.assert_not_called()
+
+
+class TestEnsureSchema:
+    #Test once-per-process schema check
+
+    def test_checked_once_per_database(self, monkeypatch):
+        #Test second call does not touch the database
+        monkeypatch.setattr(schemaMigration, "_verified", set())
+        db = version_db(MIGRATIONS[-1].version)
+        db.host, db.database = "localhost", "test_db"
+
+        assert ensure_schema(db) is True
+        calls = db.execute_query.call_count + db.fetch_one.call_count
+        assert ensure_schema(db) is True
+
+        assert db.execute_query.call_count + db.fetch_one.call_count == calls
+
+    def test_failure_is_retried(self, monkeypatch):
+        #Test failed migration is not remembered as done
+        monkeypatch.setattr(schemaMigration, "_verified", set())
+        db = version_db(0)
+        db.host, db.database = "localhost", "test_db"
+        db.execute_query.return_value = False
+
+        assert ensure_schema(db) is False
+        assert ("localhost", "test_db") not in schemaMigration._verified
@@ -0,0 +1,210 @@
+"""
+Unit tests for the cross-session SharedCache and table version stamps.
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+from mysql.connector import Error
+from models.course import Course
+from models.participant import Participant
+from models.queryCache import QueryCache
+from models.sharedCache import SharedCache, get_shared_cache
+from models.tableVersion import TableVersion
+from schemaMigration import SchemaMigrator
+from sqliteConnection import SQLiteConnection
+
+
+class TestSharedCache:
+    #Test SharedCache behaviour
+
+    def test_hit_while_versions_unchanged(self):
+        #Test the loader runs once for the same versions
+        cache = SharedCache()
+        loader = MagicMock(return_value=[{'id': 1}])
+
+        cache.get_or_load('k', (1,), loader)
+        result = cache.get_or_load('k', (1,), loader)
+
+        assert result == [{'id': 1}]
+        loader.assert_called_once()
+        assert cache.hits == 1
+
+    def test_miss_when_version_changes(self):
+        #Test a new version reloads and replaces the entry
+        cache = SharedCache()
+
+        cache.get_or_load('k', (1,), lambda: 'old')
+        result = cache.get_or_load('k', (2,), lambda: 'new')
+
+        assert result == 'new'
+        assert cache.get_or_load('k', (2,), lambda: 'unused') == 'new'
+        assert len(cache) == 1
+
+    def test_bounded_lru(self):
+        #Test the least recently used entry is evicted
+        cache = SharedCache(max_entries=2)
+        cache.get_or_load('a', (0,), lambda: 1)
+        cache.get_or_load('b', (0,), lambda: 2)
+        cache.get_or_load('a', (0,), lambda: 1)
+
+        cache.get_or_load('c', (0,), lambda: 3)
+
+        assert list(cache._entries) == ['a', 'c']
+
+    def test_process_singleton(self):
+        #Test get_shared_cache returns the same instance
+        assert get_shared_cache() is get_shared_cache()
+
+
+class TestTableVersion:
+    #Test TableVersion model
+
+    @pytest.fixture
+    def versions(self):
+        #fixture For Connected Database
+        return TableVersion(MagicMock())
+
+    def test_bump_query(self, versions):
+        #Test bump increments every given table in one statement
+        versions.db.execute_query.return_value = True
+
+        assert versions.bump(TableVersion.PARTICIPANTS, TableVersion.COURSES) is True
+
+        query, params = versions.db.execute_query.call_args[0]
+        assert "UPDATE table_versions SET version = version + 1, updated_at = %s" in query
+        assert params[1:] == ('participants', 'courses')
+
+    def test_get_versions(self, versions):
+        #Test rows are returned as a mapping
+        versions.db.fetch_all.return_value = [{'table_name': 'courses', 'version': 3}]
+
+        assert versions.get_versions() == {'courses': 3}
+
+
+class TestCrossSessionCache:
+    #Test model reads through the shared cache on SQLite
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        #Fixture for a migrated database file with one course
+        path = str(tmp_path / "skillhub.db")
+        db = SQLiteConnection(path)
+        SchemaMigrator(db).migrate()
+        Course(db).create("Python", "", "Budi")
+        db.disconnect()
+        return path
+
+    @pytest.fixture
+    def db(self, db_path):
+        #Fixture for one session's connection
+        conn = SQLiteConnection(db_path)
+        yield conn
+        conn.disconnect()
+
+    def test_reused_across_sessions(self, db):
+        #Test a second rerun with a fresh request cache hits the shared cache
+        shared = SharedCache()
+
+        Course(db, QueryCache(shared)).get_all()
+        courses = Course(db, QueryCache(shared)).get_all()
+
+        assert [c['nama_kelas'] for c in courses] == ["Python"]
+        assert shared.hits == 1
+
+    def test_write_in_other_process_invalidates(self, db, db_path):
+        #Test a write through another connection and cache is seen on the next rerun
+        shared = SharedCache()
+        Course(db, QueryCache(shared)).get_all()
+
+        other = SQLiteConnection(db_path)
+        try:
+            assert Course(other, QueryCache(SharedCache())).create("Java", "", "Sari")
+        finally:
+            other.disconnect()
+
+        courses = Course(db, QueryCache(shared)).get_all()
+        assert [c['nama_kelas'] for c in courses] == ["Python", "Java"]
+
+    def test_update_and_delete_bump_version(self, db):
+        #Test update and delete invalidate the cached record
+        shared = SharedCache()
+        model = Course(db, QueryCache(shared))
+        model.get_by_id(1)
+
+        assert model.update(1, "Python Lanjut", "", "Budi")
+        assert Course(db, QueryCache(shared)).get_by_id(1)['nama_kelas'] == "Python Lanjut"
+
+        assert model.delete(1)
+        assert Course(db, QueryCache(shared)).get_by_id(1) is None
+
+    def test_tables_are_versioned_separately(self, db):
+        #Test participant writes leave cached course lists valid
+        shared = SharedCache()
+        Course(db, QueryCache(shared)).get_all()
+
+        assert Participant(db, QueryCache(shared)).create("John", "john@example.com", "", "")
+        Course(db, QueryCache(shared)).get_all()
+
+        assert shared.hits == 1
+
+    def test_bypassed_inside_transaction(self, db):
+        #Test uncommitted data is never stored in the shared cache
+        shared = SharedCache()
+
+        with db.transaction():
+            Course(db, QueryCache(shared)).get_all()
+
+        assert len(shared) == 0
+
+    def test_failed_query_not_cached(self, db):
+        #Test an interrupted query is retried on the next read instead of cached as empty
+        shared = SharedCache()
+        cache = QueryCache(shared)
+        fetch_all = db.fetch_all
+
+        def interrupted(query, params=None, prepared=False):
+            if "FROM courses" not in query:
+                return fetch_all(query, params, prepared)
+            db.last_error = Error(msg="Query execution was interrupted", errno=3024)
+            return []
+
+        with patch.object(db, 'fetch_all', side_effect=interrupted):
+            assert Course(db, cache).get_all() == []
+            assert Course(db, cache).get_labels() == {}
+
+        assert len(shared) == 0
+        assert [c['nama_kelas'] for c in Course(db, cache).get_all()] == ["Python"]
+        assert Course(db, QueryCache(shared)).get_labels() == {1: "Python"}
+
+    def test_versions_and_rows_read_from_primary(self, db_path, tmp_path):
+        #Test a lagging replica never fills the shared cache under a newer version
+        lagging = str(tmp_path / "lagging.db")
+        stale = SQLiteConnection(lagging)
+        SchemaMigrator(stale).migrate()
+        stale.disconnect()
+        replicas = [SQLiteConnection(db_path), SQLiteConnection(lagging)]
+        routed = SQLiteConnection(db_path, replicas=replicas, read_your_writes=0)
+        try:
+            shared = SharedCache()
+            courses = Course(routed, QueryCache(shared)).get_all()
+        finally:
+            routed.disconnect()
+
+        assert [c['nama_kelas'] for c in courses] == ["Python"]
+        assert len(shared) == 1
+
+    def test_keyed_by_database(self, db, tmp_path):
+        #Test two databases in one process do not share entries
+        other = SQLiteConnection(str(tmp_path / "other.db"))
+        try:
+            SchemaMigrator(other).migrate()
+            Course(other).create("Java", "", "Sari")
+            shared = SharedCache()
+
+            first = Course(db, QueryCache(shared)).get_all()
+            second = Course(other, QueryCache(shared)).get_all()
+        finally:
+            other.disconnect()
+
+        assert [c['nama_kelas'] for c in first] == ["Python"]
+        assert [c['nama_kelas'] for c in second] == ["Java"]
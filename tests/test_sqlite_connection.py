@@ -0,0 +1,170 @@
+"""
+Unit tests for the SQLite backend.
+"""
+
+import pytest
+from datetime import datetime
+from databaseConnection import DatabaseConnection
+from queryMonitor import QueryMonitor
+from schemaMigration import Migration, SchemaMigrator, MIGRATIONS
+from sqliteConnection import SQLiteConnection, translate
+
+
+class TestTranslate:
+    #Test MySQL to SQLite query translation
+
+    def test_placeholders(self):
+        #Test %s placeholders become ?
+        assert translate("SELECT * FROM t WHERE a = %s AND b = %s") == "SELECT * FROM t WHERE a = ? AND b = ?"
+
+    def test_insert_ignore(self):
+        #Test INSERT IGNORE becomes INSERT OR IGNORE
+        assert translate("INSERT IGNORE INTO e (a) VALUES (%s)") == "INSERT OR IGNORE INTO e (a) VALUES (?)"
+
+    def test_on_duplicate_key_update(self):
+        #Test upsert with VALUES() references
+        result = translate(
+            "INSERT INTO s (k, v) VALUES (%s, %s) "
+            "ON DUPLICATE KEY UPDATE v = v + VALUES(v)"
+        )
+
+        assert result == "INSERT INTO s (k, v) VALUES (?, ?)  ON CONFLICT DO UPDATE SET  v = v + excluded.v"
+
+    def test_insert_select_upsert_gets_where(self):
+        #Test INSERT ... SELECT without WHERE is disambiguated for the SQLite parser
+        result = translate("INSERT INTO s (k, v) SELECT k, v FROM t ON DUPLICATE KEY UPDATE v = VALUES(v)")
+
+        assert "FROM t WHERE true ON CONFLICT DO UPDATE SET" in result
+
+
+class TestSQLiteConnection:
+    #Test SQLiteConnection contract
+
+    @pytest.fixture
+    def db(self, tmp_path):
+        #Fixture for a SQLite database with a small table
+        connection = SQLiteConnection(str(tmp_path / "test.db"), monitor=QueryMonitor())
+        connection.execute_query(
+            "CREATE TABLE t (id INTEGER PRIMARY KEY, nama TEXT UNIQUE, tanggal_daftar DATETIME)")
+        yield connection
+        connection.disconnect()
+
+    def test_wal_mode(self, db):
+        #Test database runs in WAL mode
+        assert db.fetch_one("PRAGMA journal_mode")['journal_mode'] == "wal"
+
+    def test_dict_rows_and_datetime(self, db):
+        #Test rows are dicts and DATETIME columns round-trip
+        now = datetime(2025, 1, 2, 3, 4, 5)
+        assert db.execute_query("INSERT INTO t (nama, tanggal_daftar) VALUES (%s, %s)", ("a", now))
+
+        assert db.fetch_one("SELECT * FROM t") == {'id': 1, 'nama': "a", 'tanggal_daftar': now}
+        assert db.fetch_all("SELECT tanggal_daftar AS tanggal FROM t") == [{'tanggal': now}]
+
+    def test_rowcount_and_execute_many(self, db):
+        #Test executemany and rowcount
+        assert db.execute_many("INSERT INTO t (nama) VALUES (%s)", [("a",), ("b",), ("c",)])
+        assert db.rowcount == 3
+        assert [row['nama'] for row in db.iter_rows("SELECT nama FROM t ORDER BY id", chunk_size=2)] == ["a", "b", "c"]
+
+    def test_duplicate_maps_to_mysql_errno(self, db):
+        #Test unique violation reports ER_DUP_ENTRY
+        db.execute_query("INSERT INTO t (nama) VALUES (%s)", ("a",))
+
+        assert db.execute_query("INSERT INTO t (nama) VALUES (%s)", ("a",)) is False
+        assert db.last_error.errno == 1062
+
+    def test_syntax_error_returns_empty(self, db):
+        #Test failed read is reported through last_error
+        assert db.fetch_all("SELEC nope") == []
+        assert db.last_error is not None
+
+    def test_transaction_commit_and_rollback(self, db):
+        #Test one commit per block and rollback on failure
+        with db.transaction() as ok:
+            db.execute_query("INSERT INTO t (nama) VALUES (%s)", ("a",))
+        with db.transaction() as failed:
+            db.execute_query("INSERT INTO t (nama) VALUES (%s)", ("b",))
+            db.execute_query("INSERT INTO t (nama) VALUES (%s)", ("a",))
+
+        assert ok.committed is True
+        assert failed.committed is False
+        assert [row['nama'] for row in db.fetch_all("SELECT nama FROM t")] == ["a"]
+
+    def test_nested_savepoint(self, db):
+        #Test a failed nested block rolls back the whole outer transaction
+        with db.transaction() as outer:
+            with db.transaction() as first:
+                db.execute_query("INSERT INTO t (nama) VALUES (%s)", ("a",))
+            with db.transaction() as duplicate:
+                db.execute_query("INSERT INTO t (nama) VALUES (%s)", ("b",))
+                db.execute_query("INSERT INTO t (nama) VALUES (%s)", ("a",))
+            db.execute_query("INSERT INTO t (nama) VALUES (%s)", ("c",))
+
+        assert (first.committed, duplicate.committed, outer.committed) == (True, False, False)
+        assert db.fetch_all("SELECT nama FROM t") == []
+
+    def test_outer_rollback_after_savepoint_release(self, db):
+        #Test releasing the first savepoint does not commit the outer transaction early
+        with db.transaction() as outer:
+            with db.transaction():
+                db.execute_query("INSERT INTO t (nama) VALUES (%s)", ("a",))
+            outer.failed = True
+
+        assert outer.committed is False
+        assert db.fetch_all("SELECT nama FROM t") == []
+
+    def test_pool_stats_none(self, db):
+        #Test SQLite backend has no pool
+        assert db.pool_stats() is None
+
+
+class TestSQLiteMigrations:
+    #Test schema migrations on SQLite
+
+    def test_migrate_to_latest(self, tmp_path):
+        #Test every migration applies and is recorded
+        db = SQLiteConnection(str(tmp_path / "skillhub.db"), monitor=QueryMonitor())
+        try:
+            migrator = SchemaMigrator(db)
+
+            assert migrator.migrate() is True
+            assert migrator.current_version() == MIGRATIONS[-1].version
+            assert migrator.migrate() is True
+            tables = {row['name'] for row in db.fetch_all("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        finally:
+            db.disconnect()
+
+        assert {'participants', 'courses', 'enrollments', 'stat_counters', 'schema_version'} <= tables
+
+    def test_failed_migration_rolls_back_ddl(self, tmp_path):
+        #Test a migration failing halfway leaves the schema as it was
+        db = SQLiteConnection(str(tmp_path / "skillhub.db"), monitor=QueryMonitor())
+        try:
+            migrator = SchemaMigrator(db, MIGRATIONS[:1])
+            assert migrator.migrate() is True
+            broken = Migration(2, "rusak", [
+                "DROP TABLE enrollments",
+                "CREATE TABLE enrollments (id INTEGER PRIMARY KEY, bad_column)",
+                "SELECT * FROM no_such_table",
+            ])
+
+            assert migrator.apply(broken) is False
+            assert migrator.current_version() == 1
+            columns = {row['name'] for row in db.fetch_all("PRAGMA table_info(enrollments)")}
+        finally:
+            db.disconnect()
+
+        assert 'participant_id' in columns and 'bad_column' not in columns
+
+    def test_from_env_selects_sqlite(self, tmp_path, monkeypatch):
+        #Test DB_BACKEND=sqlite opens the SQLite file
+        monkeypatch.setenv("DB_BACKEND", "sqlite")
+        monkeypatch.setenv("DB_SQLITE_PATH", str(tmp_path / "env.db"))
+
+        db = DatabaseConnection.from_env()
+        try:
+            assert isinstance(db, SQLiteConnection)
+            assert db.dialect == 'sqlite'
+        finally:
+            db.disconnect()
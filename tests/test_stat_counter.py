@@ -0,0 +1,101 @@
+"""
+Unit tests for StatCounter model.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+from models.statCounter import StatCounter
+
+
+class TestStatCounterWrites:
+    #Test StatCounter update methods
+
+    @pytest.fixture
+    def counters(self):
+        #Fixture for StatCounter instance
+        mock_db = MagicMock()
+        mock_db.execute_query.return_value = True
+        return StatCounter(mock_db)
+
+    def test_add_total(self, counters):
+        #Test total counter increment
+        assert counters.add(StatCounter.PARTICIPANTS, 3) is True
+
+        query, params = counters.db.execute_query.call_args[0]
+        assert "counter_value + %s" in query
+        assert params == (3, 'participants')
+
+    def test_subtract_total(self, counters):
+        #Test total counter decrement
+        counters.subtract(StatCounter.ENROLLMENTS, 2)
+
+        query, params = counters.db.execute_query.call_args[0]
+        assert "counter_value - %s" in query
+        assert params == (2, 'enrollments')
+
+    def test_add_course_enrollments_upserts(self, counters):
+        #Test per-course counter row is created on first enrollment
+        counters.add_course_enrollments(7)
+
+        query, params = counters.db.execute_query.call_args[0]
+        assert "ON DUPLICATE KEY UPDATE" in query
+        assert params == ('course_enrollments', 7, 1)
+
+    def test_subtract_participant_courses_many(self, counters):
+        #Test per-course counters drop by the number of deleted participants enrolled
+        counters.subtract_participant_courses(1, 2)
+
+        query, params = counters.db.execute_query.call_args[0]
+        assert "counter_value - (" in query
+        assert params == (1, 2, 'course_enrollments', 1, 2)
+
+    def test_subtract_enrolled_only_existing(self, counters):
+        #Test only courses the participant is actually enrolled in are decremented
+        counters.subtract_enrolled(5, [7, 8])
+
+        query, params = counters.db.execute_query.call_args[0]
+        assert "WHERE participant_id = %s AND course_id IN (%s, %s)" in query
+        assert params == ('course_enrollments', 5, 7, 8)
+
+    def test_reconcile_single_transaction(self, counters):
+        #Test reconcile rebuilds counters inside one transaction
+        assert counters.reconcile() is True
+
+        counters.db.transaction.assert_called_once()
+        queries = [c[0][0] for c in counters.db.execute_query.call_args_list]
+        assert queries[0] == "DELETE FROM stat_counters"
+        assert "COUNT(*) FROM participants" in queries[1]
+        assert "GROUP BY course_id" in queries[2]
+
+    def test_reconcile_failure(self, counters):
+        #Test reconcile reports failure
+        counters.db.execute_query.return_value = False
+
+        assert counters.reconcile() is False
+
+
+class TestStatCounterReads:
+    #Test StatCounter read methods
+
+    @pytest.fixture
+    def counters(self):
+        #Fixture for StatCounter instance
+        mock_db = MagicMock()
+        return StatCounter(mock_db)
+
+    def test_get_totals(self, counters):
+        #Test totals are read from counter rows
+        counters.db.fetch_all.return_value = [
+            {'scope': 'participants', 'counter_value': 5},
+            {'scope': 'enrollments', 'counter_value': 9},
+        ]
+
+        totals = counters.get_totals()
+
+        assert totals == {'participants': 5, 'courses': 0, 'enrollments': 9}
+
+    def test_get_course_enrollments_missing_row(self, counters):
+        #Test course without counter row has zero enrollments
+        counters.db.fetch_one.return_value = None
+
+        assert counters.get_course_enrollments(3) == 0
@@ -0,0 +1,84 @@
+"""
+Unit tests for the per-connection prepared statement cache.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+from mysql.connector import Error
+from statementCache import StatementCache, statement_cache_for
+
+
+class TestStatementCache:
+    #Test StatementCache behaviour
+
+    @pytest.fixture
+    def connection(self):
+        #Fixture for a connection returning a new mock cursor per statement
+        conn = MagicMock()
+        conn.cursor.side_effect = lambda **kwargs: MagicMock()
+        return conn
+
+    def test_statement_prepared_once(self, connection):
+        #Test the same SQL text reuses its cursor and string object
+        cache = StatementCache(connection)
+
+        first = cache.execute("SELECT * FROM t WHERE id = %s", (1,))
+        second = cache.execute("".join(["SELECT * FROM t ", "WHERE id = %s"]), (2,))
+
+        assert first is second
+        connection.cursor.assert_called_once_with(prepared=True, dictionary=True)
+        sqls = [c[0][0] for c in first.execute.call_args_list]
+        assert sqls[0] is sqls[1]
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_lru_eviction_closes_cursor(self, connection):
+        #Test the least recently used statement is closed when full
+        cache = StatementCache(connection, max_statements=2)
+        a = cache.execute("A %s", (1,))
+        cache.execute("B %s", (1,))
+        cache.execute("A %s", (1,))
+
+        cache.execute("C %s", (1,))
+
+        assert len(cache) == 2
+        assert not a.close.called
+        assert "B %s" not in cache._statements
+
+    def test_error_discards_statement(self, connection):
+        #Test a failed statement is closed and prepared again next time
+        cache = StatementCache(connection)
+        cursor = cache.execute("A %s", (1,))
+        cursor.execute.side_effect = Error("Unknown prepared statement handler")
+
+        with pytest.raises(Error):
+            cache.execute("A %s", (1,))
+
+        cursor.close.assert_called_once()
+        assert cache.execute("A %s", (1,)) is not cursor
+
+    def test_close_all(self, connection):
+        #Test close closes every statement
+        cache = StatementCache(connection)
+        cursors = [cache.execute(f"Q{i} %s", (i,)) for i in range(3)]
+
+        cache.close()
+
+        assert len(cache) == 0
+        assert all(c.close.called for c in cursors)
+
+
+class TestStatementCacheFor:
+    #Test statement_cache_for registry
+
+    def test_one_cache_per_connection(self):
+        #Test the same connection gets the same cache
+        conn, other = MagicMock(), MagicMock()
+
+        assert statement_cache_for(conn) is statement_cache_for(conn)
+        assert statement_cache_for(conn) is not statement_cache_for(other)
+
+    def test_disabled_by_env(self, monkeypatch):
+        #Test DB_PREPARED_STATEMENTS=0 turns prepared statements off
+        monkeypatch.setenv("DB_PREPARED_STATEMENTS", "0")
+
+        assert statement_cache_for(MagicMock()) is None
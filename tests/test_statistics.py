@@ -0,0 +1,69 @@
+"""
+Unit tests for Statistics model.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+from datetime import datetime
+from models.statistics import Statistics
+
+
+def stat_row(bagian, id=None, label=None, keterangan=None, tanggal=None, jumlah=None):
+    #Helper: build one row of the dashboard UNION query
+    return {'bagian': bagian, 'id': id, 'label': label,
+            'keterangan': keterangan, 'tanggal': tanggal, 'jumlah': jumlah}
+
+
+class TestDashboardStats:
+    #Test Statistics.get_dashboard_stats
+
+    @pytest.fixture
+    def statistics(self):
+        #Fixture for Statistics instance
+        mock_db = MagicMock()
+        return Statistics(mock_db)
+
+    def test_single_round_trip(self, statistics):
+        #Test dashboard stats use exactly one query with limits as params
+        statistics.db.fetch_all.return_value = []
+
+        statistics.get_dashboard_stats(3, 3, 5)
+
+        statistics.db.fetch_all.assert_called_once()
+        query, params = statistics.db.fetch_all.call_args[0]
+        assert "FROM stat_counters" in query
+        assert "COUNT(*)" not in query
+        assert "UNION ALL" in query
+        assert params == (3, 3, 5)
+
+    def test_rows_mapped_to_sections(self, statistics):
+        #Test rows are split into counts and recent lists in display order
+        statistics.db.fetch_all.return_value = [
+            stat_row('participants', jumlah=200000),
+            stat_row('courses', jumlah=10),
+            stat_row('enrollments', jumlah=1000000),
+            stat_row('peserta', 9, 'Jane', 'jane@test.com'),
+            stat_row('peserta', 8, 'John', 'john@test.com'),
+            stat_row('kelas', 4, 'Python', 'Budi'),
+            stat_row('pendaftaran', 21, 'Jane', 'Python', datetime(2025, 1, 2)),
+            stat_row('pendaftaran', 20, 'John', 'Python', datetime(2025, 1, 1)),
+        ]
+
+        stats = statistics.get_dashboard_stats()
+
+        assert stats['total_peserta'] == 200000
+        assert stats['total_kelas'] == 10
+        assert stats['total_pendaftaran'] == 1000000
+        assert [p['nama'] for p in stats['peserta_terbaru']] == ['John', 'Jane']
+        assert stats['kelas_terbaru'][0]['instruktur'] == 'Budi'
+        assert [e['id'] for e in stats['pendaftaran_terbaru']] == [20, 21]
+        assert stats['pendaftaran_terbaru'][0]['nama_kelas'] == 'Python'
+
+    def test_empty_database(self, statistics):
+        #Test zero counts and empty lists when query returns nothing
+        statistics.db.fetch_all.return_value = []
+
+        stats = statistics.get_dashboard_stats()
+
+        assert stats['total_peserta'] == 0
+        assert stats['pendaftaran_terbaru'] == []